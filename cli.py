@@ -0,0 +1,11 @@
+"""
+Minecraft Plugin Downloader - komut satırı
+Arayüz olmadan liste senkronizasyonu, güncelleme kontrolü ve arama
+"""
+
+import sys
+
+from src.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
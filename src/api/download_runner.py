@@ -0,0 +1,226 @@
+"""
+Toplu plugin indirme yürütücüsü
+"""
+
+import asyncio
+import os
+from typing import Callable, Dict, List, Optional
+
+from .download_scheduler import DownloadScheduler
+from .jar_store import JarStore
+from .modrinth_api import ModrinthAPI
+from .session_pool import SessionPool
+from .spigot_api import SpigotAPI
+from ..utils import DownloadHistory
+
+class DownloadRunner:
+    """
+    Öğeleri paylaşılan session havuzunun event loop'unda DownloadScheduler ile
+    eşzamanlı indirir. Çoklu indirme, yeniden indirme ve komut satırı aynı
+    yürütücüyü kullanır; Qt'ye bağımlı değildir.
+
+    Öğe biçimi: {'plugin': {...}, 'version': {...}, 'api': 'Modrinth'|'Spigot',
+    'row': satır (isteğe bağlı)}. Her indirme başlarken indirme geçmişi
+    günlüğüne yazılır; günlük yazımları (fsync dahil) loop'u bloklamamak için
+    executor'da yapılır.
+
+    Geri çağrılar havuzun thread'inden çağrılır:
+      on_progress(row, yüzde) - sadece yüzde değiştiğinde
+      on_finished(row, success) - her öğe bittiğinde
+    """
+
+    def __init__(self, download_folder: str, max_concurrent: int = 3, sync: bool = False,
+                 record_completed: bool = False, session_pool: Optional[SessionPool] = None,
+                 history: Optional[DownloadHistory] = None,
+                 on_progress: Optional[Callable[[int, int], None]] = None,
+                 on_finished: Optional[Callable[[int, bool], None]] = None):
+        self.download_folder = download_folder
+        # Senkronizasyon modunda hedefte aynı dosya varsa indirme atlanır
+        self.sync = sync
+        # True ise tamamlanan indirmeler geçmişe burada eklenir (yoksa çağıran ekler)
+        self.record_completed = record_completed
+        self.on_progress = on_progress
+        self.on_finished = on_finished
+        self.cancelled = False
+
+        self.scheduler = DownloadScheduler(max_concurrent)
+        self.pool = session_pool if session_pool is not None else SessionPool.shared()
+        self.jar_store = JarStore.shared()
+        self.history = history if history is not None else DownloadHistory.shared()
+        self.modrinth_api = ModrinthAPI(session_pool=self.pool)
+        self.spigot_api = SpigotAPI(session_pool=self.pool)
+        self.future = None
+
+        self.completed = 0
+        self.journal_keys = {}  # satır -> günlük anahtarı (tamamlanınca kayıt bu anahtarla kapatılır)
+        self.download_paths = {}  # satır -> dosyanın indirildiği yol
+        self.up_to_date_rows = set()
+        self.errors = {}  # satır -> hata mesajı
+
+    # Öğe bilgileri
+
+    @staticmethod
+    def plugin_name(item: Dict) -> str:
+        plugin = item['plugin']
+        if item['api'] == "Modrinth":
+            return plugin.get('title') or 'plugin'
+        return plugin.get('name') or 'plugin'
+
+    @staticmethod
+    def version_name(item: Dict) -> str:
+        version = item['version']
+        return version.get('version_number') or version.get('name', 'N/A')
+
+    @staticmethod
+    def source_fields(item: Dict) -> Dict:
+        """Kayıtta saklanacak plugin/sürüm ID'leri ve dosya adresi"""
+        plugin = item['plugin']
+        if item['api'] == "Modrinth":
+            plugin_id = plugin.get('project_id') or plugin.get('slug')
+        else:
+            plugin_id = plugin.get('id')
+        return DownloadHistory.source_fields(item['api'], plugin_id, item['version'])
+
+    @staticmethod
+    def get_download_host(item: Dict) -> str:
+        """Öğenin indirileceği host'u belirle"""
+        if item['api'] == "Modrinth":
+            download_url = (item['version'].get('files') or [{}])[0].get('url', '')
+            return DownloadScheduler.get_host(download_url)
+        return DownloadScheduler.get_host(SpigotAPI.BASE_URL)
+
+    def target_path(self, item: Dict) -> str:
+        plugin_name = self.plugin_name(item)
+        if item['api'] == "Modrinth":
+            file_name = (item['version'].get('files') or [{}])[0].get('filename', f"{plugin_name}.jar")
+        else:
+            file_name = f"{plugin_name}.jar"
+        return os.path.join(self.download_folder, file_name)
+
+    # Çalıştırma
+
+    def run(self, items: List[Dict]) -> List[bool]:
+        """Öğeleri indir ve bitmesini bekle (havuz thread'i dışından çağrılır)"""
+        self.future = self.pool.submit(self.download_all(items))
+        try:
+            return self.future.result()
+        finally:
+            self.future = None
+
+    async def download_all(self, items: List[Dict]) -> List[bool]:
+        """Tüm öğeleri zamanlayıcı ile eşzamanlı indir"""
+        def on_job_finished(index, success):
+            self.completed += 1
+            if self.on_finished:
+                self.on_finished(items[index].get('row', index), success)
+
+        jobs = []
+        for index, item in enumerate(items):
+            row = item.get('row', index)
+            jobs.append((self.get_download_host(item), lambda item=item, row=row: self.download_item(item, row)))
+        return await self.scheduler.run(jobs, on_job_finished)
+
+    def cancel(self):
+        self.cancelled = True
+        # Zamanlayıcıyı havuzun event loop'u üzerinden iptal et
+        loop = self.pool.loop
+        if loop is not None and not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(self.scheduler.cancel)
+            except RuntimeError:
+                pass
+
+    async def is_up_to_date(self, item: Dict, download_path: str) -> bool:
+        """Hedefteki dosya planlanan sürümle aynı mı (ad, boyut ve hash)"""
+        version = item['version']
+        if item['api'] == "Modrinth":
+            file_info = (version.get('files') or [{}])[0]
+            hashes, alias, size = file_info.get('hashes'), None, file_info.get('size')
+        else:
+            hashes, size = None, None
+            alias = SpigotAPI.store_alias(item['plugin'].get('id'), version.get('id'))
+
+        # Hash hesaplama event loop'u bloklamasın
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self.jar_store.is_up_to_date, download_path, hashes, alias, size
+        )
+
+    async def download_item(self, item: Dict, row: int) -> bool:
+        loop = asyncio.get_running_loop()
+        journal_key = None
+        try:
+            if self.cancelled:
+                return False
+
+            api_type = item['api']
+            version = item['version']
+            download_path = self.target_path(item)
+            self.download_paths[row] = download_path
+            os.makedirs(os.path.dirname(download_path) or '.', exist_ok=True)
+
+            if self.sync and await self.is_up_to_date(item, download_path):
+                self.up_to_date_rows.add(row)
+                if self.on_progress:
+                    self.on_progress(row, 100)
+                return True
+
+            plugin_name = self.plugin_name(item)
+            version_name = self.version_name(item)
+            source = self.source_fields(item)
+            # Günlük yazımı (fsync) disk beklerken diğer indirmeleri durdurmasın
+            journal_key = await loop.run_in_executor(
+                None, lambda: self.history.start(plugin_name, version_name, api_type, download_path, **source)
+            )
+            self.journal_keys[row] = journal_key
+
+            last_progress = -1
+
+            def progress_callback(progress):
+                # Eşzamanlı indirmelerde bildirim trafiğini azalt: sadece yüzde değişince bildir
+                nonlocal last_progress
+                if self.cancelled or progress == last_progress:
+                    return
+                last_progress = progress
+                loop.run_in_executor(None, self.history.progress, journal_key, progress)
+                if self.on_progress:
+                    self.on_progress(row, progress)
+
+            if api_type == "Modrinth":
+                file_info = (version.get('files') or [{}])[0]
+                download_url = file_info.get('url')
+                if download_url:
+                    success = await self.modrinth_api.download_plugin(
+                        download_url, download_path, progress_callback, hashes=file_info.get('hashes')
+                    )
+                else:
+                    success = False
+            else:  # Spigot
+                plugin_id = item['plugin'].get('id')
+                if plugin_id:
+                    success = await self.spigot_api.download_plugin(
+                        plugin_id, version.get('id'), download_path, progress_callback
+                    )
+                else:
+                    success = False
+
+            if not success:
+                await loop.run_in_executor(None, self.history.fail, journal_key, "indirme başarısız")
+            elif self.record_completed:
+                await loop.run_in_executor(
+                    None, lambda: self.history.add(plugin_name, version_name, api_type, download_path,
+                                                   key=journal_key, **source)
+                )
+            return success
+
+        except asyncio.CancelledError:
+            print("İndirme iptal edildi")
+            if journal_key is not None:
+                loop.run_in_executor(None, self.history.fail, journal_key, "iptal edildi")
+            return False
+        except Exception as e:
+            print(f"İndirme hatası: {e}")
+            self.errors[row] = str(e)
+            if journal_key is not None:
+                await loop.run_in_executor(None, self.history.fail, journal_key, e)
+            return False
@@ -0,0 +1,100 @@
+"""
+Eşzamanlı indirme zamanlayıcısı
+"""
+
+import asyncio
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+class DownloadScheduler:
+    """Tek event loop üzerinde sınırlı sayıda indirmeyi aynı anda çalıştırır"""
+
+    # Host başına eşzamanlı bağlantı sınırları
+    HOST_LIMITS = {
+        'api.spiget.org': 2,
+        'cdn.modrinth.com': 4
+    }
+
+    def __init__(self, max_concurrent: int = 3, host_limits: Optional[Dict[str, int]] = None):
+        self.max_concurrent = max(1, int(max_concurrent))
+        self.host_limits = dict(self.HOST_LIMITS)
+        if host_limits:
+            self.host_limits.update(host_limits)
+        self.cancelled = False
+        self._global_semaphore = None
+        self._host_semaphores = {}
+        self._tasks = []
+
+    @staticmethod
+    def get_host(url: str) -> str:
+        """URL'den host adını çıkar"""
+        try:
+            return urlparse(url).hostname or ''
+        except Exception:
+            return ''
+
+    def _get_host_semaphore(self, host: str):
+        """Host için semaphore döndür (sınır yoksa None)"""
+        limit = self.host_limits.get(host)
+        if not limit:
+            return None
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(limit)
+        return self._host_semaphores[host]
+
+    async def _run_job(self, index: int, host: str, job_factory: Callable, on_finished: Optional[Callable]):
+        """Tek bir işi global ve host sınırları içinde çalıştır"""
+        success = False
+        try:
+            async with self._global_semaphore:
+                if self.cancelled:
+                    return False
+
+                host_semaphore = self._get_host_semaphore(host)
+                if host_semaphore is not None:
+                    async with host_semaphore:
+                        if self.cancelled:
+                            return False
+                        success = await job_factory()
+                else:
+                    success = await job_factory()
+            return success
+        except asyncio.CancelledError:
+            success = False
+            raise
+        except Exception as e:
+            print(f"Zamanlanmış indirme hatası: {e}")
+            success = False
+            return False
+        finally:
+            if on_finished:
+                try:
+                    on_finished(index, bool(success))
+                except Exception as e:
+                    print(f"İndirme bildirimi hatası: {e}")
+
+    async def run(self, jobs: List[Tuple[str, Callable]], on_finished: Optional[Callable] = None) -> List[bool]:
+        """
+        İşleri eşzamanlı çalıştır.
+
+        jobs: (host, coroutine üreten fonksiyon) çiftleri
+        on_finished: her iş bittiğinde (index, success) ile çağrılır
+        """
+        self._global_semaphore = asyncio.Semaphore(self.max_concurrent)
+        self._host_semaphores = {}
+
+        self._tasks = [
+            asyncio.ensure_future(self._run_job(index, host, job_factory, on_finished))
+            for index, (host, job_factory) in enumerate(jobs)
+        ]
+
+        results = await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        return [result is True for result in results]
+
+    def cancel(self):
+        """Bekleyen ve çalışan tüm işleri iptal et"""
+        self.cancelled = True
+        for task in self._tasks:
+            if not task.done():
+                task.cancel()
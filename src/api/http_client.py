@@ -0,0 +1,224 @@
+"""
+Yeniden deneme ve hız sınırı destekli ortak HTTP istemcisi
+"""
+
+import asyncio
+import json
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+import aiohttp
+from requests.exceptions import Timeout, ConnectionError, HTTPError
+from requests.structures import CaseInsensitiveDict
+
+from .session_pool import SessionPool
+from .download_scheduler import DownloadScheduler
+from .request_scheduler import RequestScheduler
+
+class HttpResponse:
+    """
+    Okunmuş yanıtın basit kopyası.
+
+    requests.Response ile aynı temel arayüzü (status_code, headers, json,
+    raise_for_status) sunar; API sınıfları ve ResponseCache değişmeden kullanır.
+    """
+
+    def __init__(self, url: str, status_code: int, headers, body: bytes):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = body
+
+    def json(self):
+        return json.loads(self.content.decode('utf-8'))
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise HTTPError(f"{self.status_code} hatası: {self.url}", response=self)
+
+class HttpClient:
+    """
+    API istekleri için paylaşılan async istek katmanı.
+
+    İstekler SessionPool'un event loop'unda aiohttp ile yapılır; senkron
+    çağıranlar get/post üzerinden sonucu bekler. Geçici hatalarda (429, 5xx,
+    bağlantı kopması) üstel bekleme + jitter ile yeniden denenir. Retry-After
+    ve X-Ratelimit-Reset başlıkları varsa bekleme süresi onlardan alınır ve aynı
+    host'a giden diğer istekler de bu süre boyunca bekletilir. Host başına bir
+    yeniden deneme bütçesi tutulur: yeniden denemeler normal isteklerin belli
+    bir oranını aşamaz, böylece 429 yağmurunda istek sayısı katlanmaz.
+    Sadece idempotent istekler (GET vb. veya idempotent=True) ağ hatasında
+    tekrarlanır; 429 sunucunun isteği işlemediğini bildirdiği için her zaman
+    tekrarlanabilir.
+
+    Her deneme önce RequestScheduler'dan host bütçesinden token alır; böylece
+    istekler sınırın altında kalır ve sıraya girdiğinde arama istekleri arka
+    plan işlerinden önce gider.
+    """
+
+    IDEMPOTENT_METHODS = {'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'}
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+    MAX_ATTEMPTS = 4
+    BASE_DELAY = 0.5  # İlk yeniden denemenin üst sınırı (saniye)
+    MAX_DELAY = 30.0  # Bundan uzun bekleme istenirse yeniden denenmez
+    BUDGET_RATIO = 0.2  # Her istek bütçeye bu kadar yeniden deneme hakkı ekler
+    BUDGET_MAX = 10.0  # Host başına biriktirilebilecek yeniden deneme hakkı
+    DEFAULT_TIMEOUT = (3.05, 27)  # (bağlantı, okuma)
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, session_pool: Optional[SessionPool] = None, max_attempts: int = MAX_ATTEMPTS,
+                 scheduler: Optional[RequestScheduler] = None):
+        self.session_pool = session_pool if session_pool is not None else SessionPool.shared()
+        self.scheduler = scheduler if scheduler is not None else RequestScheduler()
+        self.max_attempts = max(1, int(max_attempts))
+        self._budgets = {}  # host -> kalan yeniden deneme hakkı
+        self._blocked_until = {}  # host -> hız sınırının kalktığı zaman (time.monotonic)
+
+    @classmethod
+    def shared(cls) -> 'HttpClient':
+        """Süreç genelindeki ortak istemciyi döndür"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    # Bekleme hesapları
+
+    @staticmethod
+    def header_delay(headers) -> Optional[float]:
+        """Retry-After (saniye veya HTTP tarihi) ya da X-Ratelimit-Reset (saniye) başlığından bekleme süresi"""
+        value = headers.get('Retry-After')
+        if value:
+            try:
+                return max(0.0, float(value))
+            except ValueError:
+                try:
+                    return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+                except (TypeError, ValueError):
+                    pass
+
+        value = headers.get('X-Ratelimit-Reset')
+        if value:
+            try:
+                return max(0.0, float(value))
+            except ValueError:
+                pass
+        return None
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Üstel bekleme, tam jitter ile (attempt 1'den başlar)"""
+        return random.uniform(0, min(self.MAX_DELAY, self.BASE_DELAY * (2 ** attempt)))
+
+    # Yeniden deneme bütçesi
+
+    def _deposit(self, host: str):
+        self._budgets[host] = min(self.BUDGET_MAX, self._budgets.get(host, self.BUDGET_MAX) + self.BUDGET_RATIO)
+
+    def _withdraw(self, host: str) -> bool:
+        budget = self._budgets.get(host, self.BUDGET_MAX)
+        if budget < 1:
+            return False
+        self._budgets[host] = budget - 1
+        return True
+
+    async def _wait_for_host(self, host: str):
+        """Host hız sınırındaysa sınır kalkana kadar bekle"""
+        delay = self._blocked_until.get(host, 0) - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _block_host(self, host: str, delay: float):
+        until = time.monotonic() + delay
+        if until > self._blocked_until.get(host, 0):
+            self._blocked_until[host] = until
+
+    # İstek
+
+    async def request(self, method: str, url: str, params: Optional[Dict] = None, json_body=None,
+                      headers: Optional[Dict] = None, timeout=DEFAULT_TIMEOUT,
+                      idempotent: Optional[bool] = None, priority: Optional[int] = None) -> HttpResponse:
+        """
+        İsteği yap ve yanıtı döndür (havuz loop'unda çağrılmalı)
+
+        Yeniden deneme hakkı bitince son yanıt döner veya son hata fırlatılır;
+        hata durumları requests istisnalarıyla (Timeout, ConnectionError,
+        HTTPError) bildirilir. priority verilmezse çağıran thread'in önceliği
+        (RequestScheduler.current_priority) kullanılır.
+        """
+        method = method.upper()
+        if priority is None:
+            priority = RequestScheduler.current_priority()
+        if idempotent is None:
+            idempotent = method in self.IDEMPOTENT_METHODS
+        host = DownloadScheduler.get_host(url)
+        connect_timeout, read_timeout = timeout
+        client_timeout = aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout)
+        session = await self.session_pool.get_session()
+        self._deposit(host)
+
+        attempt = 0
+        while True:
+            attempt += 1
+            await self._wait_for_host(host)
+            await self.scheduler.acquire(host, priority)
+
+            try:
+                async with session.request(method, url, params=params, json=json_body, headers=headers,
+                                           timeout=client_timeout) as response:
+                    result = HttpResponse(str(response.url), response.status, CaseInsensitiveDict(response.headers),
+                                          await response.read())
+                self.scheduler.update(host, result.headers)
+                error = None
+            except asyncio.TimeoutError as e:
+                result, error = None, Timeout(f"İstek zaman aşımı: {url}")
+                error.__cause__ = e
+            except aiohttp.ClientError as e:
+                result, error = None, ConnectionError(f"Bağlantı hatası: {e}")
+                error.__cause__ = e
+
+            if result is not None:
+                if result.status_code not in self.RETRY_STATUSES:
+                    return result
+                retryable = result.status_code == 429 or idempotent
+                delay = self.header_delay(result.headers)
+                if delay is not None and result.status_code == 429:
+                    # Sınır kalkana kadar bu host'a giden diğer istekler de bekler
+                    self._block_host(host, delay)
+            else:
+                retryable = idempotent
+                delay = None
+
+            if delay is None:
+                delay = self.backoff_delay(attempt)
+            else:
+                delay += random.uniform(0, self.BASE_DELAY)  # Aynı anda uyanan istekleri dağıt
+
+            if (not retryable or attempt >= self.max_attempts or delay > self.MAX_DELAY
+                    or not self._withdraw(host)):
+                if error is not None:
+                    raise error
+                return result
+
+            reason = result.status_code if result is not None else error
+            print(f"İstek yeniden denenecek ({attempt}/{self.max_attempts - 1}, {delay:.1f} sn): {reason}")
+            await asyncio.sleep(delay)
+
+    def request_sync(self, method: str, url: str, **kwargs) -> HttpResponse:
+        """Senkron çağıranlar için: isteği havuz loop'unda çalıştır ve bekle"""
+        # Öncelik loop thread'inde değil, çağıran thread'de belirlenir
+        kwargs.setdefault('priority', RequestScheduler.current_priority())
+        return self.session_pool.run(self.request(method, url, **kwargs))
+
+    def get(self, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None,
+            timeout=DEFAULT_TIMEOUT) -> HttpResponse:
+        return self.request_sync('GET', url, params=params, headers=headers, timeout=timeout)
+
+    def post(self, url: str, json=None, headers: Optional[Dict] = None, timeout=DEFAULT_TIMEOUT,
+             idempotent: bool = False) -> HttpResponse:
+        return self.request_sync('POST', url, json_body=json, headers=headers, timeout=timeout,
+                                 idempotent=idempotent)
@@ -0,0 +1,238 @@
+"""
+İçerik adresli (hash anahtarlı) yerel jar deposu
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import threading
+import uuid
+from typing import Awaitable, Callable, Dict, Optional
+
+class JarStore:
+    """
+    İndirilen jar dosyalarını sha1 değerine göre saklayan depo.
+
+    Her indirme yayınlanan hash ile doğrulanır ve depoya eklenir; aynı dosya
+    başka bir klasöre tekrar indirilmek istendiğinde ağa çıkmadan depodan hard
+    link (desteklenmiyorsa kopya) ile hedefe yerleştirilir. Hash yayınlamayan
+    kaynaklar için (Spigot) dosyalar kaynak/sürüm takma adıyla eşlenir.
+    """
+
+    HASH_ALGORITHMS = ('sha1', 'sha512')
+    READ_SIZE = 1024 * 1024
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, store_dir: str = os.path.join("cache", "jars")):
+        self.store_dir = store_dir
+        self.aliases_file = os.path.join(store_dir, "aliases.json")
+        self._lock = threading.Lock()
+        self._aliases = None  # takma ad -> sha1 (ilk kullanımda yüklenir)
+
+    @classmethod
+    def shared(cls) -> 'JarStore':
+        """Süreç genelindeki ortak depoyu döndür"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def path_for(self, sha1: str) -> str:
+        return os.path.join(self.store_dir, sha1[:2], f"{sha1}.jar")
+
+    @classmethod
+    def hash_file(cls, path: str) -> Dict[str, str]:
+        """Dosyanın sha1 ve sha512 değerlerini tek okumada hesapla"""
+        digests = {name: hashlib.new(name) for name in cls.HASH_ALGORITHMS}
+        with open(path, 'rb') as f:
+            while True:
+                block = f.read(cls.READ_SIZE)
+                if not block:
+                    break
+                for digest in digests.values():
+                    digest.update(block)
+        return {name: digest.hexdigest() for name, digest in digests.items()}
+
+    @classmethod
+    def matches(cls, file_hashes: Dict[str, str], expected: Optional[Dict[str, str]]) -> bool:
+        """Hesaplanan hash'ler yayınlananlarla uyuşuyor mu (ortak algoritma yoksa True)"""
+        for name in cls.HASH_ALGORITHMS:
+            value = (expected or {}).get(name)
+            if value and file_hashes.get(name) != value.lower():
+                return False
+        return True
+
+    def verify(self, path: str, expected: Optional[Dict[str, str]]) -> bool:
+        """Dosyayı yayınlanan hash'lere göre doğrula"""
+        try:
+            return self.matches(self.hash_file(path), expected)
+        except OSError as e:
+            print(f"Hash doğrulanamadı: {e}")
+            return False
+
+    # Takma adlar
+
+    def _load_aliases(self) -> Dict[str, str]:
+        if self._aliases is None:
+            try:
+                with open(self.aliases_file, 'r', encoding='utf-8') as f:
+                    self._aliases = json.load(f)
+            except (OSError, ValueError):
+                self._aliases = {}
+        return self._aliases
+
+    def _save_aliases(self):
+        tmp_file = f"{self.aliases_file}.tmp"
+        try:
+            os.makedirs(self.store_dir, exist_ok=True)
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(self._aliases, f, separators=(',', ':'))
+            os.replace(tmp_file, self.aliases_file)
+        except OSError as e:
+            print(f"Jar deposu indeksi kaydedilemedi: {e}")
+
+    # Depo işlemleri
+
+    @staticmethod
+    def _link_or_copy(source: str, target: str):
+        """Hedefe atomik olarak hard link koy, olmazsa kopyala"""
+        target_dir = os.path.dirname(target) or '.'
+        os.makedirs(target_dir, exist_ok=True)
+        tmp_file = os.path.join(target_dir, f".{os.path.basename(target)}.{uuid.uuid4().hex}.tmp")
+        try:
+            try:
+                os.link(source, tmp_file)
+            except OSError:
+                # Farklı disk veya link desteklemeyen dosya sistemi
+                shutil.copyfile(source, tmp_file)
+            os.replace(tmp_file, target)
+        finally:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+
+    def _resolve(self, hashes: Optional[Dict[str, str]] = None, alias: Optional[str] = None) -> Optional[str]:
+        """Hash veya takma addan depodaki sha1 değerini bul"""
+        sha1 = (hashes or {}).get('sha1')
+        if sha1:
+            return sha1.lower()
+        if alias:
+            with self._lock:
+                return self._load_aliases().get(alias)
+        return None
+
+    def materialize(self, target: str, hashes: Optional[Dict[str, str]] = None,
+                    alias: Optional[str] = None) -> bool:
+        """Dosya depoda varsa hedefe yerleştir ve True döndür (ağ gerekmez)"""
+        sha1 = self._resolve(hashes, alias)
+        if not sha1:
+            return False
+        stored = self.path_for(sha1)
+        if not os.path.exists(stored):
+            return False
+
+        # Depodaki kopya bozulmuşsa kullanma
+        expected = dict(hashes or {}, sha1=sha1)
+        if not self.verify(stored, expected):
+            print(f"Jar deposunda bozuk dosya silindi: {sha1}")
+            try:
+                os.remove(stored)
+            except OSError:
+                pass
+            return False
+
+        try:
+            self._link_or_copy(stored, target)
+            return True
+        except OSError as e:
+            print(f"Jar deposundan kopyalanamadı: {e}")
+            return False
+
+    def is_up_to_date(self, target: str, hashes: Optional[Dict[str, str]] = None,
+                      alias: Optional[str] = None, size: Optional[int] = None) -> bool:
+        """
+        Hedefteki dosya beklenen dosyayla aynı mı (ad, boyut ve hash)
+
+        Beklenen hash bilinmiyorsa güncel kabul edilmez.
+        """
+        if not os.path.isfile(target):
+            return False
+        if size and os.path.getsize(target) != size:
+            return False
+        sha1 = self._resolve(hashes, alias)
+        if not sha1:
+            return False
+        return self.verify(target, dict(hashes or {}, sha1=sha1))
+
+    def add(self, path: str, hashes: Optional[Dict[str, str]] = None, alias: Optional[str] = None) -> Optional[str]:
+        """
+        İndirilen dosyayı doğrula ve depoya ekle
+
+        Hash uyuşmazsa None döner; dosya depoya alınmaz.
+        """
+        try:
+            file_hashes = self.hash_file(path)
+        except OSError as e:
+            print(f"Jar deposuna eklenemedi: {e}")
+            return None
+        if not self.matches(file_hashes, hashes):
+            return None
+        return self._store(path, file_hashes['sha1'], alias)
+
+    def _store(self, path: str, sha1: str, alias: Optional[str] = None) -> str:
+        """Doğrulanmış dosyayı depoya ekle ve takma adı kaydet"""
+        stored = self.path_for(sha1)
+        try:
+            if not os.path.exists(stored):
+                self._link_or_copy(path, stored)
+        except OSError as e:
+            print(f"Jar deposuna eklenemedi: {e}")
+
+        if alias:
+            with self._lock:
+                aliases = self._load_aliases()
+                if aliases.get(alias) != sha1:
+                    aliases[alias] = sha1
+                    self._save_aliases()
+        return sha1
+
+    async def fetch(self, target: str, download: Callable[[Callable[[str], bool]], Awaitable[bool]],
+                    hashes: Optional[Dict[str, str]] = None, alias: Optional[str] = None,
+                    progress_callback=None) -> bool:
+        """
+        Dosyayı depodan yerleştir; yoksa download(verify) ile indir ve depoya ekle
+
+        download, indirilen geçici dosyayı hedefin yerine koymadan önce
+        verify(geçici_yol) ile doğrulamalıdır; böylece hash'i tutmayan bir
+        indirme hedefteki sağlam dosyayı silmez. Hash hesaplama event loop'u
+        bloklamasın diye executor'da yapılır.
+        """
+        loop = asyncio.get_running_loop()
+        if await loop.run_in_executor(None, self.materialize, target, hashes, alias):
+            if progress_callback:
+                progress_callback(100)
+            return True
+
+        verified = {}
+
+        def verify(path):
+            try:
+                file_hashes = self.hash_file(path)
+            except OSError as e:
+                print(f"Hash doğrulanamadı: {e}")
+                return False
+            if not self.matches(file_hashes, hashes):
+                print(f"Hash doğrulaması başarısız, indirme atıldı: {os.path.basename(target)}")
+                return False
+            verified.update(file_hashes)
+            return True
+
+        if not await download(verify):
+            return False
+
+        if verified:
+            await loop.run_in_executor(None, self._store, target, verified['sha1'], alias)
+        return True
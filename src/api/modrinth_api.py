@@ -2,55 +2,80 @@
 Modrinth API ile plugin arama ve indirme işlemleri
 """
 
-import requests
 from requests.exceptions import Timeout, ConnectionError, HTTPError
 import aiohttp
-import aiofiles
 import asyncio
-from typing import List, Dict, Optional
+import json
+from typing import List, Dict, Optional, Tuple
 import os
-import time
+
+from .http_client import HttpClient
+from .response_cache import ResponseCache
+from .resumable_download import ResumableDownloader
+from .jar_store import JarStore
 
 class ModrinthAPI:
     BASE_URL = "https://api.modrinth.com/v2"
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Minecraft-Plugin-Downloader/1.0'
-        })
+    def __init__(self, session_pool=None, response_cache=None, jar_store=None, http_client=None):
+        # Yeniden deneme ve hız sınırı bekleme işini paylaşılan istemci yapar
+        self.http = http_client if http_client is not None else HttpClient.shared()
         self._aio_session = None  # Lazy initialization for async session
+        self.session_pool = session_pool  # Paylaşılan session havuzu (varsa)
+        # Detay ve sürüm yanıtları için kalıcı cache
+        self.response_cache = response_cache if response_cache is not None else ResponseCache.shared()
+        # İndirilen jar'lar hash ile doğrulanıp yerel depoda tutulur
+        self.jar_store = jar_store if jar_store is not None else JarStore.shared()
     
-    def search_plugins(self, query: str, limit: int = 20, include_premium: bool = False) -> List[Dict]:
-        """Plugin arama"""
+    def search_page(self, query: str, limit: int = 20, include_premium: bool = False,
+                    offset: int = 0) -> Tuple[List[Dict], bool]:
+        """
+        Tek arama sayfası: (filtrelenmiş sonuçlar, sunucuda sonraki sayfa var mı)
+        
+        Devam bilgisi filtrelemeden önceki ham sonuçlara göre belirlenir. İstek
+        hataları çağırana iletilir (requests istisnaları).
+        """
         url = f"{self.BASE_URL}/search"
         params = {
             'query': query,
-            'limit': limit,
+            'limit': min(limit, 100),  # Modrinth maksimum 100 limit
+            'offset': offset,
             'facets': '[["project_type:plugin"]]'
         }
         
+        response = self.http.get(
+            url, 
+            params=params,
+            timeout=(3.05, 27)  # (connect, read) timeout
+        )
+        response.raise_for_status()
+        data = response.json()
+        hits = data.get('hits', [])
+        
+        total_hits = data.get('total_hits')
+        if total_hits is not None:
+            has_more = offset + len(hits) < total_hits
+        else:
+            has_more = len(hits) >= params['limit']
+        
+        # Modrinth genelde ücretsiz ama yine de kontrol et
+        if not include_premium:
+            # Modrinth'te şu an premium yok, ama ileride olabilir
+            hits = [plugin for plugin in hits if not plugin.get('premium', False)]
+        
+        return hits, has_more
+    
+    def search_plugins(self, query: str, limit: int = 20, include_premium: bool = False,
+                       offset: int = 0) -> List[Dict]:
+        """
+        Plugin arama
+        
+        offset ile sonraki sayfalar sunucu tarafında atlanarak alınır.
+        """
+        url = f"{self.BASE_URL}/search"
+        
         try:
-            response = self.session.get(
-                url, 
-                params=params,
-                timeout=(3.05, 27)  # (connect, read) timeout
-            )
-            response.raise_for_status()
-            data = response.json()
-            results = data.get('hits', [])
-            
-            # Modrinth genelde ücretsiz ama yine de kontrol et
-            if not include_premium:
-                # Eğer gelecekte premium özelliği eklenirse filtrele
-                filtered_results = []
-                for plugin in results:
-                    # Modrinth'te şu an premium yok, ama ileride olabilir
-                    is_premium = plugin.get('premium', False)
-                    if not is_premium:
-                        filtered_results.append(plugin)
-                return filtered_results
-            
+            results, _ = self.search_page(query, limit=limit, include_premium=include_premium, offset=offset)
             return results
             
         except Timeout:
@@ -60,10 +85,6 @@ class ModrinthAPI:
             print(f"Modrinth bağlantı hatası: {e}")
             return []
         except HTTPError as e:
-            if e.response.status_code == 429:  # Rate limit
-                print("Modrinth rate limit, 5 saniye bekleniyor...")
-                time.sleep(5)
-                return self.search_plugins(query, limit)  # Retry
             print(f"Modrinth HTTP hatası: {e}")
             return []
         except Exception as e:
@@ -75,18 +96,12 @@ class ModrinthAPI:
         url = f"{self.BASE_URL}/project/{plugin_id}"
         
         try:
-            response = self.session.get(url, timeout=(3.05, 27))
-            response.raise_for_status()
-            return response.json()
+            return self.response_cache.get_json(self.http, url, ttl=ResponseCache.TTL_DETAILS)
             
         except Timeout:
             print(f"Plugin detay timeout: {plugin_id}")
             return None
         except HTTPError as e:
-            if e.response.status_code == 429:
-                print("Rate limit, 5 saniye bekleniyor...")
-                time.sleep(5)
-                return self.get_plugin_details(plugin_id)
             print(f"Plugin detay HTTP hatası: {e}")
             return None
         except Exception as e:
@@ -102,9 +117,7 @@ class ModrinthAPI:
         }
         
         try:
-            response = self.session.get(url, params=params, timeout=(3.05, 27))
-            response.raise_for_status()
-            versions = response.json()
+            versions = self.response_cache.get_json(self.http, url, params=params, ttl=ResponseCache.TTL_VERSIONS)
             
             # Eğer limit 100'den fazlaysa, pagination ile daha fazla al
             if limit > 100 and len(versions) == 100:
@@ -117,10 +130,9 @@ class ModrinthAPI:
                             'limit': min(remaining, 100),
                             'offset': next_offset
                         }
-                        next_response = self.session.get(url, params=next_params, timeout=(3.05, 27))
-                        next_response.raise_for_status()
-                        
-                        next_versions = next_response.json()
+                        next_versions = self.response_cache.get_json(
+                            self.http, url, params=next_params, ttl=ResponseCache.TTL_VERSIONS
+                        )
                         if not next_versions:
                             break
                             
@@ -141,18 +153,126 @@ class ModrinthAPI:
             print(f"Version listesi timeout: {plugin_id}")
             return []
         except HTTPError as e:
-            if e.response.status_code == 429:
-                print("Rate limit, 5 saniye bekleniyor...")
-                time.sleep(5)
-                return self.get_plugin_versions(plugin_id, limit, offset)
             print(f"Version listesi HTTP hatası: {e}")
             return []
         except Exception as e:
             print(f"Version listesi hatası: {e}")
             return []
     
+    BATCH_SIZE = 100  # Toplu isteklerde URL uzunluğunu sınırlamak için ID sayısı
+    
+    def _get_batch(self, endpoint: str, ids: List[str]) -> List[Dict]:
+        """/projects ve /versions gibi çoklu ID uç noktalarını parçalar halinde çağır"""
+        url = f"{self.BASE_URL}/{endpoint}"
+        unique_ids = sorted({str(item_id) for item_id in ids if item_id})
+        results = []
+        
+        for start in range(0, len(unique_ids), self.BATCH_SIZE):
+            chunk = unique_ids[start:start + self.BATCH_SIZE]
+            params = {'ids': json.dumps(chunk)}
+            try:
+                results.extend(self.response_cache.get_json(
+                    self.http, url, params=params, ttl=ResponseCache.TTL_VERSIONS
+                ))
+            except HTTPError as e:
+                print(f"Toplu {endpoint} HTTP hatası: {e}")
+            except Exception as e:
+                print(f"Toplu {endpoint} hatası: {e}")
+        
+        return results
+    
+    def get_projects(self, project_ids: List[str]) -> List[Dict]:
+        """Birden fazla projeyi tek istekte getir (/projects?ids=[...])"""
+        return self._get_batch("projects", project_ids)
+    
+    def get_versions(self, version_ids: List[str]) -> List[Dict]:
+        """Birden fazla sürümü tek istekte getir (/versions?ids=[...])"""
+        return self._get_batch("versions", version_ids)
+    
+    def _post_hashes(self, endpoint: str, hashes: List[str], body: Dict) -> Dict[str, Dict]:
+        """Hash listesi alan uç noktaları parçalar halinde çağır, hash -> sürüm döndür"""
+        url = f"{self.BASE_URL}/{endpoint}"
+        unique_hashes = sorted({value.lower() for value in hashes if value})
+        results = {}
+        
+        for start in range(0, len(unique_hashes), self.BATCH_SIZE):
+            chunk = unique_hashes[start:start + self.BATCH_SIZE]
+            try:
+                # Sadece okuma yapan sorgu, yeniden denenmesi güvenli
+                response = self.http.post(url, json=dict(body, hashes=chunk), timeout=(3.05, 27), idempotent=True)
+                response.raise_for_status()
+                results.update(response.json())
+            except HTTPError as e:
+                print(f"Hash ile sürüm arama HTTP hatası: {e}")
+            except Exception as e:
+                print(f"Hash ile sürüm arama hatası: {e}")
+        
+        return results
+    
+    def get_versions_by_hashes(self, hashes: List[str], algorithm: str = 'sha1') -> Dict[str, Dict]:
+        """Dosya hash'lerinden sürümleri bul (POST /version_files), hash -> sürüm döndür"""
+        return self._post_hashes("version_files", hashes, {'algorithm': algorithm})
+    
+    def get_latest_versions_by_hashes(self, hashes: List[str], loaders: Optional[List[str]] = None,
+                                      game_versions: Optional[List[str]] = None,
+                                      algorithm: str = 'sha1') -> Dict[str, Dict]:
+        """
+        Dosya hash'lerine göre her projenin en yeni uyumlu sürümünü getir
+        (POST /version_files/update), hash -> en yeni sürüm döndür
+        
+        loaders/game_versions verilirse sadece bunlarla uyumlu sürümler dikkate alınır.
+        """
+        body = {'algorithm': algorithm}
+        if loaders:
+            body['loaders'] = list(loaders)
+        if game_versions:
+            body['game_versions'] = list(game_versions)
+        return self._post_hashes("version_files/update", hashes, body)
+    
+    def get_recent_versions(self, project_ids: List[str], count: int = 10) -> Dict[str, List[Dict]]:
+        """
+        Birden fazla projenin son sürümlerini iki toplu istekle getir
+        
+        Proje başına en yeni count sürüm, yeniden eskiye sıralı döner. Toplu
+        istekte bulunamayan projeler için tek tek sürüm listesi istenir.
+        """
+        projects = self.get_projects(project_ids)
+        
+        # Projeler hem ID hem slug ile aranabilir
+        project_keys = {}
+        version_ids = []
+        for project in projects:
+            recent_ids = project.get('versions', [])[-count:]
+            version_ids.extend(recent_ids)
+            for key in (project.get('id'), project.get('slug')):
+                if key:
+                    project_keys[key] = project.get('id')
+        
+        versions_by_project = {}
+        for version in self.get_versions(version_ids):
+            versions_by_project.setdefault(version.get('project_id'), []).append(version)
+        
+        results = {}
+        for project_id in project_ids:
+            real_id = project_keys.get(project_id)
+            if real_id is not None:
+                versions = sorted(
+                    versions_by_project.get(real_id, []),
+                    key=lambda version: version.get('date_published', ''),
+                    reverse=True
+                )
+            else:
+                versions = self.get_plugin_versions(project_id)
+            results[project_id] = versions[:count]
+        
+        return results
+    
     async def get_aio_session(self):
         """Async session'ı lazy initialization ile al"""
+        # Paylaşılan havuz varsa keep-alive bağlantılarını yeniden kullan
+        if self.session_pool is not None:
+            return await self.session_pool.get_session()
+        
         if self._aio_session is None or self._aio_session.closed:
             connector = aiohttp.TCPConnector(
                 limit=100,
@@ -175,34 +295,37 @@ class ModrinthAPI:
     
     async def close_aio_session(self):
         """Async session'ı kapat"""
+        # Paylaşılan session havuz tarafından kapatılır
+        if self.session_pool is not None:
+            return
+        
         if self._aio_session and not self._aio_session.closed:
             await self._aio_session.close()
             await asyncio.sleep(0.250)  # SSL bağlantıları için grace period
     
-    async def download_plugin(self, download_url: str, download_path: str, progress_callback=None) -> bool:
-        """Plugin indirme"""
+    async def download_plugin(self, download_url: str, download_path: str, progress_callback=None,
+                              hashes: Optional[Dict] = None) -> bool:
+        """
+        Plugin indirme
+        
+        hashes (sürüm dosyasının 'hashes' alanı) verilirse dosya doğrulanır ve
+        aynı dosya daha önce indirildiyse ağa çıkmadan yerel depodan alınır.
+        """
         try:
             # İndirme klasörünü oluştur
             os.makedirs(os.path.dirname(download_path), exist_ok=True)
             
             session = await self.get_aio_session()
             
-            async with session.get(download_url) as response:
-                if response.status == 200:
-                    total_size = int(response.headers.get('content-length', 0))
-                    downloaded = 0
-                    
-                    async with aiofiles.open(download_path, 'wb') as file:
-                        async for chunk in response.content.iter_chunked(8192):
-                            await file.write(chunk)
-                            downloaded += len(chunk)
-                            
-                            if progress_callback and total_size > 0:
-                                progress = int((downloaded / total_size) * 100)
-                                progress_callback(progress)
-                    
-                    return True
-            return False
+            # .part dosyasına indir, kopan bağlantıda Range ile devam et
+            return await self.jar_store.fetch(
+                download_path,
+                lambda verify: ResumableDownloader().download(
+                    session, download_url, download_path, progress_callback, verify=verify
+                ),
+                hashes=hashes,
+                progress_callback=progress_callback
+            )
             
         except asyncio.CancelledError:
             print("İndirme iptal edildi")
@@ -213,8 +336,3 @@ class ModrinthAPI:
         except Exception as e:
             print(f"İndirme hatası: {e}")
             return False
-    
-    def __del__(self):
-        """Destructor - session'ları kapat"""
-        if hasattr(self, 'session'):
-            self.session.close()
\ No newline at end of file
@@ -0,0 +1,169 @@
+"""
+Hız sınırını gözeten, öncelik sınıflı istek zamanlayıcısı
+"""
+
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional, Tuple
+
+class _HostBucket:
+    """Tek host için token bucket ve bekleyen istek kuyruğu"""
+
+    def __init__(self, limit: int, window: float):
+        self.limit = limit
+        self.window = window
+        self.tokens = float(limit)
+        self.updated = time.monotonic()
+        self.waiters = []  # (öncelik, sıra, future) yığını
+        self.wake_handle = None
+
+    @property
+    def rate(self) -> float:
+        return self.limit / self.window
+
+    def refill(self):
+        now = time.monotonic()
+        self.tokens = min(float(self.limit), self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+class RequestScheduler:
+    """
+    Host başına istek bütçesini token bucket ile izleyen merkezi zamanlayıcı.
+
+    Bütçe, sunucunun bildirdiği X-Ratelimit-Limit / X-Ratelimit-Remaining
+    başlıklarıyla düzeltilir ve küçük bir pay bırakılarak sınırın hemen altında
+    tutulur; böylece 429 almadan tam hızda istek atılır. Token yetmediğinde
+    bekleyen istekler öncelik sırasıyla (arama > dialog > arka plan) uyandırılır.
+    Arka plan istekleri bütçenin son kısmına dokunamaz; bu pay etkileşimli
+    istekler için ayrılır.
+
+    Öncelik, çağıran thread'de priority() bağlamıyla belirlenir; HttpClient
+    isteği yaparken current_priority() değerini kullanır.
+    """
+
+    PRIORITY_INTERACTIVE = 0  # Kullanıcının beklediği arama
+    PRIORITY_DIALOG = 1  # Dialog'larda sürüm yükleme vb.
+    PRIORITY_BACKGROUND = 2  # Sayfa ön yükleme, toplu güncelleme kontrolü
+
+    # Host başına (istek, saniye) varsayılan sınırları; başlıklar gelince güncellenir
+    HOST_LIMITS = {
+        'api.modrinth.com': (300, 60.0)
+    }
+    DEFAULT_LIMIT = (600, 60.0)
+    SAFETY_MARGIN = 2  # Sunucunun bildirdiği kalan haktan bırakılan pay
+    RESERVED_RATIO = {  # Önceliğin dokunamayacağı bütçe oranı
+        PRIORITY_INTERACTIVE: 0.0,
+        PRIORITY_DIALOG: 0.05,
+        PRIORITY_BACKGROUND: 0.2
+    }
+
+    _local = threading.local()
+
+    def __init__(self, host_limits: Optional[Dict[str, Tuple[int, float]]] = None):
+        self.host_limits = dict(self.HOST_LIMITS)
+        if host_limits:
+            self.host_limits.update(host_limits)
+        self._buckets = {}
+        self._sequence = itertools.count()
+
+    # Çağıran thread'in önceliği
+
+    @classmethod
+    def current_priority(cls) -> int:
+        return getattr(cls._local, 'priority', cls.PRIORITY_DIALOG)
+
+    @classmethod
+    @contextmanager
+    def priority(cls, level: int):
+        """Bu bağlamda bu thread'den yapılan istekler verilen öncelikle sıralanır"""
+        previous = getattr(cls._local, 'priority', None)
+        cls._local.priority = level
+        try:
+            yield
+        finally:
+            if previous is None:
+                del cls._local.priority
+            else:
+                cls._local.priority = previous
+
+    @classmethod
+    def bind(cls, func: Callable) -> Callable:
+        """Fonksiyonu çağıranın önceliğiyle başka bir thread'de çalışacak şekilde sar"""
+        level = cls.current_priority()
+
+        def run_with_priority(*args, **kwargs):
+            with cls.priority(level):
+                return func(*args, **kwargs)
+        return run_with_priority
+
+    # Bütçe (event loop içinde çağrılır)
+
+    def _bucket(self, host: str) -> _HostBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = _HostBucket(*self.host_limits.get(host, self.DEFAULT_LIMIT))
+            self._buckets[host] = bucket
+        return bucket
+
+    def _reserve(self, bucket: _HostBucket, priority: int) -> float:
+        return bucket.limit * self.RESERVED_RATIO.get(priority, 0.0)
+
+    async def acquire(self, host: str, priority: int = PRIORITY_DIALOG):
+        """İstek için bir token al; yoksa önceliğine göre sıra bekle"""
+        bucket = self._bucket(host)
+        bucket.refill()
+        if not bucket.waiters and bucket.tokens >= 1 + self._reserve(bucket, priority):
+            bucket.tokens -= 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(bucket.waiters, (priority, next(self._sequence), future))
+        self._dispatch(bucket)
+        await future
+
+    def _dispatch(self, bucket: _HostBucket):
+        """Token yettiği sürece en öncelikli bekleyeni uyandır"""
+        bucket.refill()
+        while bucket.waiters:
+            priority, _, future = bucket.waiters[0]
+            if future.done():  # İptal edilmiş bekleyen
+                heapq.heappop(bucket.waiters)
+                continue
+            needed = 1 + self._reserve(bucket, priority)
+            if bucket.tokens < needed:
+                self._schedule_wake(bucket, (needed - bucket.tokens) / bucket.rate)
+                return
+            heapq.heappop(bucket.waiters)
+            bucket.tokens -= 1
+            future.set_result(None)
+
+    def _schedule_wake(self, bucket: _HostBucket, delay: float):
+        if bucket.wake_handle is not None:
+            bucket.wake_handle.cancel()
+        bucket.wake_handle = asyncio.get_running_loop().call_later(delay, self._wake, bucket)
+
+    def _wake(self, bucket: _HostBucket):
+        bucket.wake_handle = None
+        self._dispatch(bucket)
+
+    def update(self, host: str, headers):
+        """Yanıt başlıklarındaki hız sınırı bilgisiyle bütçeyi düzelt"""
+        limit = headers.get('X-Ratelimit-Limit')
+        remaining = headers.get('X-Ratelimit-Remaining')
+        if limit is None and remaining is None:
+            return
+
+        bucket = self._bucket(host)
+        bucket.refill()
+        try:
+            if limit is not None and int(limit) > 0:
+                bucket.limit = int(limit)
+            if remaining is not None:
+                # Sunucunun sayacı esastır; bizim tahminimiz ondan fazla olamaz
+                bucket.tokens = min(bucket.tokens, float(int(remaining) - self.SAFETY_MARGIN))
+        except ValueError:
+            pass
@@ -0,0 +1,255 @@
+"""
+API yanıtları için diskte kalıcı HTTP cache
+"""
+
+import copy
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+class _Flight:
+    """Devam eden tek bir isteğin sonucu; aynı isteği yapan diğer thread'ler bunu bekler"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.waiters = 0
+        self.copies = []  # Her bekleyen için ayrı kopya
+        self.error = None
+
+    def wait(self):
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.copies.pop()
+
+class ResponseCache:
+    """
+    Endpoint + parametre anahtarlı, TTL ve ETag destekli, boyutu sınırlı yanıt cache'i
+
+    Aynı anahtar için aynı anda gelen istekler tek ağ isteğinde birleştirilir
+    (single-flight): ilk gelen isteği yapar, diğerleri onun sonucunu bekler.
+    Çağıranlar sonucu değiştirebildiği için (ör. sayfalamada extend) her
+    bekleyen ayrıştırılmış verinin kendi kopyasını alır.
+    """
+
+    # Endpoint türüne göre tazelik süreleri (saniye)
+    TTL_DETAILS = 6 * 60 * 60
+    TTL_VERSIONS = 15 * 60
+    TTL_SEARCH = 2 * 60
+
+    DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, cache_dir: str = os.path.join("cache", "http"), max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index = {}  # key -> [boyut, son erişim zamanı]
+        self._total_bytes = 0
+        self._in_flight = {}  # key -> _Flight
+        self._load_index()
+
+    @classmethod
+    def shared(cls) -> 'ResponseCache':
+        """Süreç genelindeki ortak cache'i döndür"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict] = None) -> str:
+        """Endpoint ve parametrelerden cache anahtarı üret"""
+        normalized = json.dumps(
+            {'url': url, 'params': {str(k): str(v) for k, v in (params or {}).items()}},
+            sort_keys=True, ensure_ascii=False
+        )
+        return hashlib.sha1(normalized.encode('utf-8')).hexdigest()
+
+    def _path_for(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _load_index(self):
+        """Diskteki kayıtları tarayıp boyut indeksini oluştur"""
+        try:
+            if not os.path.isdir(self.cache_dir):
+                return
+            for entry in os.scandir(self.cache_dir):
+                if entry.is_file() and entry.name.endswith('.json'):
+                    stat = entry.stat()
+                    self._index[entry.name[:-5]] = [stat.st_size, stat.st_mtime]
+                    self._total_bytes += stat.st_size
+        except Exception as e:
+            print(f"HTTP cache indeksi yüklenemedi: {e}")
+
+    def get_entry(self, key: str) -> Optional[Dict]:
+        """Cache kaydını oku (yoksa None)"""
+        path = self._path_for(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"HTTP cache okuma hatası: {e}")
+            self.remove(key)
+            return None
+
+        # LRU için erişim zamanını güncelle
+        now = time.time()
+        with self._lock:
+            if key in self._index:
+                self._index[key][1] = now
+        try:
+            os.utime(path, (now, now))
+        except OSError:
+            pass
+        return entry
+
+    @staticmethod
+    def is_fresh(entry: Dict) -> bool:
+        """Kayıt TTL süresi içinde mi"""
+        return time.time() - entry.get('stored_at', 0) < entry.get('ttl', 0)
+
+    def store(self, key: str, url: str, params: Optional[Dict], data, etag: Optional[str], ttl: int):
+        """Yanıtı atomik olarak diske yaz"""
+        entry = {
+            'url': url,
+            'params': params or {},
+            'etag': etag,
+            'stored_at': time.time(),
+            'ttl': ttl,
+            'data': data
+        }
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            payload = json.dumps(entry, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            path = self._path_for(key)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"HTTP cache yazma hatası: {e}")
+            return
+
+        with self._lock:
+            old = self._index.get(key)
+            if old:
+                self._total_bytes -= old[0]
+            self._index[key] = [len(payload), time.time()]
+            self._total_bytes += len(payload)
+        self._evict_if_needed()
+
+    def refresh(self, key: str, entry: Dict):
+        """304 sonrası kaydın tazelik zamanını yenile"""
+        self.store(key, entry.get('url', ''), entry.get('params'), entry.get('data'),
+                   entry.get('etag'), entry.get('ttl', 0))
+
+    def remove(self, key: str):
+        """Kaydı sil"""
+        with self._lock:
+            old = self._index.pop(key, None)
+            if old:
+                self._total_bytes -= old[0]
+        try:
+            os.remove(self._path_for(key))
+        except OSError:
+            pass
+
+    def _evict_if_needed(self):
+        """Toplam boyut sınırı aşıldıysa en eski erişilen kayıtları sil"""
+        with self._lock:
+            if self._total_bytes <= self.max_bytes:
+                return
+            # Sınırın %90'ına inene kadar en eski kayıtları çıkar
+            target = int(self.max_bytes * 0.9)
+            victims = []
+            for key, (size, _) in sorted(self._index.items(), key=lambda item: item[1][1]):
+                if self._total_bytes <= target:
+                    break
+                victims.append(key)
+                self._total_bytes -= size
+            for key in victims:
+                del self._index[key]
+
+        for key in victims:
+            try:
+                os.remove(self._path_for(key))
+            except OSError:
+                pass
+
+    def clear(self):
+        """Tüm cache'i temizle"""
+        with self._lock:
+            keys = list(self._index.keys())
+            self._index.clear()
+            self._total_bytes = 0
+        for key in keys:
+            try:
+                os.remove(self._path_for(key))
+            except OSError:
+                pass
+
+    def get_json(self, session, url: str, params: Optional[Dict] = None, ttl: int = TTL_VERSIONS,
+                 timeout=(3.05, 27)):
+        """
+        Cache destekli GET isteği.
+
+        Taze kayıt varsa ağa çıkmaz; bayat kayıt ETag içeriyorsa If-None-Match ile
+        doğrular. HTTP hataları requests'in raise_for_status davranışıyla iletilir.
+        """
+        key = self.make_key(url, params)
+        entry = self.get_entry(key)
+
+        if entry is not None and self.is_fresh(entry):
+            return entry['data']
+
+        # Aynı istek zaten yapılıyorsa onun sonucunu bekle
+        with self._lock:
+            flight = self._in_flight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._in_flight[key] = _Flight()
+            else:
+                flight.waiters += 1
+        if not leader:
+            return flight.wait()
+
+        data = None
+        try:
+            data = self._fetch_json(session, key, url, params, entry, ttl, timeout)
+            return data
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            # Kayıt silindikten sonra bekleyen sayısı değişmez
+            with self._lock:
+                del self._in_flight[key]
+            if flight.error is None:
+                flight.copies = [copy.deepcopy(data) for _ in range(flight.waiters)]
+            flight.done.set()
+
+    def _fetch_json(self, session, key: str, url: str, params: Optional[Dict], entry: Optional[Dict],
+                    ttl: int, timeout):
+        """Bayat veya olmayan kaydı ağdan al (ETag varsa doğrulayarak)"""
+        headers = {}
+        if entry is not None and entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+
+        response = session.get(url, params=params, headers=headers, timeout=timeout)
+
+        if response.status_code == 304 and entry is not None:
+            self.refresh(key, entry)
+            return entry['data']
+
+        response.raise_for_status()
+        data = response.json()
+        self.store(key, url, params, data, response.headers.get('ETag'), ttl)
+        return data
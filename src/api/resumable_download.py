@@ -0,0 +1,201 @@
+"""
+Kaldığı yerden devam edebilen dosya indirme
+"""
+
+import asyncio
+import json
+import os
+from typing import Callable, Dict, Optional
+
+import aiofiles
+import aiohttp
+
+class ResumableDownloader:
+    """
+    Dosyayı önce '<hedef>.part' dosyasına indirir, alınan bayt sayısını yan
+    dosyada ('<hedef>.part.json') tutar ve tamamlanınca hedefe atomik olarak
+    taşır. Bağlantı koparsa sunucu destekliyorsa HTTP Range ile kaldığı yerden
+    devam eder; yarım dosya hiçbir zaman gerçek adla bırakılmaz.
+    """
+
+    PART_SUFFIX = ".part"
+    META_SUFFIX = ".part.json"
+    CHUNK_SIZE = 64 * 1024
+    META_INTERVAL = 1024 * 1024  # Yan dosyanın güncellendiği bayt aralığı
+    MAX_ATTEMPTS = 3
+    RETRY_DELAY = 1.0
+
+    def __init__(self, max_attempts: int = MAX_ATTEMPTS):
+        self.max_attempts = max(1, int(max_attempts))
+
+    @classmethod
+    def part_path(cls, download_path: str) -> str:
+        return download_path + cls.PART_SUFFIX
+
+    @classmethod
+    def meta_path(cls, download_path: str) -> str:
+        return download_path + cls.META_SUFFIX
+
+    @staticmethod
+    def _read_meta(meta_file: str) -> Dict:
+        try:
+            with open(meta_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _write_meta(meta_file: str, meta: Dict):
+        """Yan dosyayı geçici dosya + rename ile yaz"""
+        tmp_file = meta_file + ".tmp"
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+            os.replace(tmp_file, meta_file)
+        except OSError as e:
+            print(f"İndirme durumu kaydedilemedi: {e}")
+
+    @staticmethod
+    def _remove(*paths: str):
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _resume_offset(self, url: str, part_file: str, meta: Dict) -> int:
+        """
+        Önceki yarım indirmeden kaç bayt kullanılabilir
+
+        Doğrulayıcı (ETag / Last-Modified) saklanmadıysa If-Range gönderilemez;
+        sunucudaki dosya değişmişse yeni baytlar eski parçanın sonuna eklenirdi.
+        Bu durumda yarım dosya kullanılmaz, indirme baştan başlar.
+        """
+        if meta.get('url') != url or not os.path.exists(part_file):
+            return 0
+        if not (meta.get('etag') or meta.get('last_modified')):
+            return 0
+        received = min(int(meta.get('received', 0)), os.path.getsize(part_file))
+        if received > 0:
+            # Yan dosyaya yazılmamış (doğrulanmamış) kuyruk atılır
+            with open(part_file, 'r+b') as f:
+                f.truncate(received)
+        return received
+
+    @staticmethod
+    def _content_range_start(response) -> Optional[int]:
+        """'bytes 100-199/200' başlığından başlangıç baytını çıkar"""
+        value = response.headers.get('Content-Range', '')
+        try:
+            return int(value.split(' ', 1)[1].split('-', 1)[0])
+        except (IndexError, ValueError):
+            return None
+
+    async def download(self, session: aiohttp.ClientSession, url: str, download_path: str,
+                       progress_callback: Optional[Callable[[int], None]] = None,
+                       verify: Optional[Callable[[str], bool]] = None) -> bool:
+        """
+        URL'yi indir; başarılıysa dosya download_path altında tam olarak bulunur
+
+        verify verilirse tamamlanan .part dosyası hedefe taşınmadan önce onunla
+        doğrulanır; doğrulanamayan indirme silinir ve hedefteki dosyaya dokunulmaz.
+        """
+        part_file = self.part_path(download_path)
+        meta_file = self.meta_path(download_path)
+        meta = self._read_meta(meta_file)
+        received = self._resume_offset(url, part_file, meta)
+        if received == 0:
+            meta = {'url': url}
+            self._remove(part_file)
+        else:
+            print(f"İndirme kaldığı yerden devam ediyor: {os.path.basename(download_path)} ({received} bayt)")
+
+        for attempt in range(1, self.max_attempts + 1):
+            headers = {}
+            if received > 0:
+                headers['Range'] = f"bytes={received}-"
+                # Dosya sunucuda değiştiyse Range yok sayılır ve tam dosya gelir
+                validator = meta.get('etag') or meta.get('last_modified')
+                if validator:
+                    headers['If-Range'] = validator
+
+            try:
+                async with session.get(url, headers=headers) as response:
+                    if response.status == 416 and received > 0:
+                        if meta.get('total') and received >= meta['total']:
+                            break  # Dosya zaten tamamen alınmış
+                        received = 0
+                        self._remove(part_file)
+                        continue
+
+                    if response.status == 206 and self._content_range_start(response) == received:
+                        mode = 'ab'
+                        total = received + int(response.headers.get('content-length', 0))
+                    elif response.status == 200:
+                        # Sunucu Range desteklemiyor veya dosya değişmiş: baştan başla
+                        mode = 'wb'
+                        received = 0
+                        total = int(response.headers.get('content-length', 0))
+                    else:
+                        print(f"İndirme başarısız ({response.status}): {url}")
+                        return False
+
+                    meta.update({
+                        'url': url,
+                        'received': received,
+                        'total': total or None,
+                        'etag': response.headers.get('ETag'),
+                        'last_modified': response.headers.get('Last-Modified')
+                    })
+                    self._write_meta(meta_file, meta)
+
+                    last_saved = received
+                    async with aiofiles.open(part_file, mode) as file:
+                        async for chunk in response.content.iter_chunked(self.CHUNK_SIZE):
+                            await file.write(chunk)
+                            received += len(chunk)
+
+                            if received - last_saved >= self.META_INTERVAL:
+                                await file.flush()
+                                meta['received'] = received
+                                self._write_meta(meta_file, meta)
+                                last_saved = received
+
+                            if progress_callback and total > 0:
+                                progress_callback(int((received / total) * 100))
+                        await file.flush()
+
+                    meta['received'] = received
+                    self._write_meta(meta_file, meta)
+
+                    if total and received < total:
+                        raise aiohttp.ClientPayloadError(f"Eksik veri: {received}/{total} bayt")
+                    break
+
+            except (aiohttp.ClientPayloadError, aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                meta['received'] = received
+                self._write_meta(meta_file, meta)
+                if attempt >= self.max_attempts:
+                    print(f"İndirme yarıda kaldı, sonraki denemede devam edilecek: {e}")
+                    return False
+                print(f"Bağlantı koptu, yeniden deneniyor ({attempt}/{self.max_attempts - 1}): {e}")
+                await asyncio.sleep(self.RETRY_DELAY * attempt)
+            except asyncio.CancelledError:
+                # İptal edilen indirme bir sonraki sefer kaldığı yerden sürer
+                meta['received'] = received
+                self._write_meta(meta_file, meta)
+                raise
+        else:
+            return False
+
+        # Veri diske yazılmadan rename edilirse çökme sonrası boş dosya kalabilir
+        with open(part_file, 'rb+') as f:
+            os.fsync(f.fileno())
+        if verify and not await asyncio.get_running_loop().run_in_executor(None, verify, part_file):
+            self._remove(part_file, meta_file)
+            return False
+        os.replace(part_file, download_path)
+        self._remove(meta_file)
+        if progress_callback:
+            progress_callback(100)
+        return True
@@ -0,0 +1,120 @@
+"""
+Uygulama genelinde paylaşılan aiohttp session havuzu
+"""
+
+import asyncio
+import threading
+from typing import Optional
+
+import aiohttp
+
+class SessionPool:
+    """Tek bir arka plan event loop'u ve uzun ömürlü aiohttp session'ı yönetir"""
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self):
+        self._loop = None
+        self._thread = None
+        self._session = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> 'SessionPool':
+        """Süreç genelindeki ortak havuzu döndür"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @property
+    def loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        """Havuzun event loop'u (başlatılmadıysa None)"""
+        return self._loop
+
+    def start(self):
+        """Arka plan event loop thread'ini başlat"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def run_loop():
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                loop.run_forever()
+
+            self._loop = loop
+            self._thread = threading.Thread(target=run_loop, name="SessionPoolLoop", daemon=True)
+            self._thread.start()
+            ready.wait()
+
+    def in_pool_thread(self) -> bool:
+        """Çağrı havuzun kendi thread'inden mi yapılıyor"""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def submit(self, coro):
+        """Coroutine'i havuz loop'unda çalıştır, concurrent.futures.Future döndür"""
+        self.start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def run(self, coro, timeout: Optional[float] = None):
+        """Coroutine'i havuz loop'unda çalıştır ve sonucunu bekle"""
+        if self.in_pool_thread():
+            coro.close()
+            raise RuntimeError("SessionPool.run havuz thread'i içinden çağrılamaz")
+        return self.submit(coro).result(timeout)
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """Paylaşılan session'ı döndür (havuz loop'unda çağrılmalı)"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=10,
+                keepalive_timeout=60,
+                ttl_dns_cache=300
+            )
+            timeout = aiohttp.ClientTimeout(
+                total=300,
+                connect=30,
+                sock_connect=30,
+                sock_read=60
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=timeout,
+                connector_owner=True,
+                headers={'User-Agent': 'Minecraft-Plugin-Downloader/1.0'}
+            )
+        return self._session
+
+    async def _close_session(self):
+        """Session'ı kapat"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            await asyncio.sleep(0.250)  # SSL bağlantıları için grace period
+        self._session = None
+
+    def close(self, timeout: float = 5):
+        """Session'ı kapat ve arka plan loop'unu durdur"""
+        with self._lock:
+            loop = self._loop
+            thread = self._thread
+            if loop is None or thread is None or not thread.is_alive():
+                return
+
+            try:
+                asyncio.run_coroutine_threadsafe(self._close_session(), loop).result(timeout)
+            except Exception as e:
+                print(f"Session havuzu kapatma hatası: {e}")
+
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout)
+            if not thread.is_alive():
+                loop.close()
+
+            self._loop = None
+            self._thread = None
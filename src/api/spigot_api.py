@@ -2,71 +2,68 @@
 Spigot API ile plugin arama ve indirme işlemleri
 """
 
-import requests
 from requests.exceptions import Timeout, ConnectionError, HTTPError
 import aiohttp
-import aiofiles
 import asyncio
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, List, Dict, Optional, Tuple
 import os
-import time
+
+from .http_client import HttpClient
+from .request_scheduler import RequestScheduler
+from .response_cache import ResponseCache
+from .resumable_download import ResumableDownloader
+from .jar_store import JarStore
 
 class SpigotAPI:
     BASE_URL = "https://api.spiget.org/v2"
+    DETAIL_WORKERS = 8  # Arama detayları için eşzamanlı istek sayısı
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Minecraft-Plugin-Downloader/1.0'
-        })
+    def __init__(self, session_pool=None, response_cache=None, jar_store=None, http_client=None):
+        # Yeniden deneme ve hız sınırı bekleme işini paylaşılan istemci yapar
+        self.http = http_client if http_client is not None else HttpClient.shared()
         self._aio_session = None  # Lazy initialization for async session
+        self.session_pool = session_pool  # Paylaşılan session havuzu (varsa)
+        # Detay ve sürüm yanıtları için kalıcı cache
+        self.response_cache = response_cache if response_cache is not None else ResponseCache.shared()
+        # Spigot hash yayınlamaz; aynı kaynak sürümü yerel depodan takma adla bulunur
+        self.jar_store = jar_store if jar_store is not None else JarStore.shared()
     
-    def search_plugins(self, query: str, size: int = 20, include_premium: bool = False) -> List[Dict]:
-        """Plugin arama"""
+    def search_page(self, query: str, size: int = 20, include_premium: bool = False,
+                    result_callback: Optional[Callable[[Dict], None]] = None,
+                    page: int = 1) -> Tuple[List[Dict], bool]:
+        """
+        Tek arama sayfası: (detaylandırılmış sonuçlar, sunucuda sonraki sayfa var mı)
+        
+        Paralı pluginler filtrelendiğinde sayfa boş dönebilir; devam bilgisi bu
+        yüzden sunucunun döndürdüğü ham sonuç sayısına göre belirlenir. İstek
+        hataları çağırana iletilir (requests istisnaları).
+        """
+        url = f"{self.BASE_URL}/search/resources/{query}"
+        params = {'size': size, 'page': page, 'sort': '-downloads'}
+        
+        response = self.http.get(url, params=params, timeout=(3.05, 27))
+        response.raise_for_status()
+        raw_results = response.json()
+        
+        results = self.enrich_search_results(raw_results, include_premium, result_callback)
+        return results, len(raw_results) >= size
+    
+    def search_plugins(self, query: str, size: int = 20, include_premium: bool = False,
+                       result_callback: Optional[Callable[[Dict], None]] = None,
+                       page: int = 1) -> List[Dict]:
+        """
+        Plugin arama
+        
+        result_callback verilirse detayları tamamlanan her plugin hazır olduğu anda bildirilir.
+        page 1'den başlar; sonraki sayfalar sunucu tarafında atlanarak alınır.
+        """
         url = f"{self.BASE_URL}/search/resources/{query}"
-        params = {'size': size, 'sort': '-downloads'}
         
         try:
-            response = self.session.get(url, params=params, timeout=(3.05, 27))
-            response.raise_for_status()
-            results = response.json()
-            
-            # Her plugin için detay bilgilerini al (ikon ve yazar için)
-            filtered_results = []
-            for plugin in results:
-                plugin_id = plugin.get('id')
-                if plugin_id:
-                    try:
-                        detail_url = f"{self.BASE_URL}/resources/{plugin_id}"
-                        detail_response = self.session.get(detail_url, timeout=(3.05, 27))
-                        if detail_response.status_code == 200:
-                            detail_data = detail_response.json()
-                            
-                            # Paralı plugin kontrolü
-                            is_premium = detail_data.get('premium', False)
-                            has_price = detail_data.get('price', 0) > 0
-                            
-                            # Paralı pluginleri filtrele (include_premium False ise)
-                            if not include_premium and (is_premium or has_price):
-                                continue
-                            
-                            if 'icon' in detail_data:
-                                plugin['icon'] = detail_data['icon']
-                            
-                            if 'author' in detail_data:
-                                plugin['author'] = detail_data['author']
-                            
-                            # Premium bilgisini ekle
-                            plugin['premium'] = is_premium
-                            plugin['price'] = detail_data.get('price', 0)
-                            
-                            filtered_results.append(plugin)
-                    except:
-                        # Hata durumunda plugin'i ekle (detay alınamazsa)
-                        if include_premium:
-                            filtered_results.append(plugin)
-            
-            return filtered_results
+            results, _ = self.search_page(query, size=size, include_premium=include_premium,
+                                          result_callback=result_callback, page=page)
+            return results
             
         except Timeout:
             print(f"Spigot arama timeout: {url}")
@@ -75,33 +72,91 @@ class SpigotAPI:
             print(f"Spigot bağlantı hatası: {e}")
             return []
         except HTTPError as e:
-            if e.response.status_code == 429:
-                print("Spigot rate limit, 5 saniye bekleniyor...")
-                time.sleep(5)
-                return self.search_plugins(query, size)
             print(f"Spigot HTTP hatası: {e}")
             return []
         except Exception as e:
             print(f"Spigot beklenmeyen hata: {e}")
             return []
     
+    def enrich_search_results(self, results: List[Dict], include_premium: bool = False,
+                              result_callback: Optional[Callable[[Dict], None]] = None) -> List[Dict]:
+        """Arama sonuçlarına detay bilgilerini (ikon, yazar, premium) paralel olarak ekle"""
+        plugins = [plugin for plugin in results if plugin.get('id')]
+        if not plugins:
+            return []
+        
+        enriched = [None] * len(plugins)
+        
+        # Detay isteklerini sınırlı bir thread havuzunda aynı anda gönder
+        max_workers = min(self.DETAIL_WORKERS, len(plugins))
+        enrich_plugin = RequestScheduler.bind(self._enrich_plugin)  # Aramanın önceliğini koru
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(enrich_plugin, plugin, include_premium): index
+                for index, plugin in enumerate(plugins)
+            }
+            
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    plugin = future.result()
+                except Exception:
+                    plugin = None
+                
+                if plugin is None:
+                    continue
+                
+                enriched[index] = plugin
+                if result_callback:
+                    try:
+                        result_callback(plugin)
+                    except Exception as e:
+                        print(f"Spigot sonuç bildirimi hatası: {e}")
+        
+        # Orijinal sıralamayı (indirme sayısına göre) koru
+        return [plugin for plugin in enriched if plugin is not None]
+    
+    def _enrich_plugin(self, plugin: Dict, include_premium: bool) -> Optional[Dict]:
+        """Tek plugin için detayları al; filtrelenecekse None döndür"""
+        plugin_id = plugin.get('id')
+        try:
+            detail_url = f"{self.BASE_URL}/resources/{plugin_id}"
+            detail_data = self.response_cache.get_json(self.http, detail_url, ttl=ResponseCache.TTL_DETAILS)
+            
+            # Paralı plugin kontrolü
+            is_premium = detail_data.get('premium', False)
+            has_price = detail_data.get('price', 0) > 0
+            
+            # Paralı pluginleri filtrele (include_premium False ise)
+            if not include_premium and (is_premium or has_price):
+                return None
+            
+            if 'icon' in detail_data:
+                plugin['icon'] = detail_data['icon']
+            
+            if 'author' in detail_data:
+                plugin['author'] = detail_data['author']
+            
+            # Premium bilgisini ekle
+            plugin['premium'] = is_premium
+            plugin['price'] = detail_data.get('price', 0)
+            
+            return plugin
+        except:
+            # Hata durumunda plugin'i ekle (detay alınamazsa)
+            return plugin if include_premium else None
+    
     def get_plugin_details(self, plugin_id: int) -> Optional[Dict]:
         """Plugin detaylarını getir"""
         url = f"{self.BASE_URL}/resources/{plugin_id}"
         
         try:
-            response = self.session.get(url, timeout=(3.05, 27))
-            response.raise_for_status()
-            return response.json()
+            return self.response_cache.get_json(self.http, url, ttl=ResponseCache.TTL_DETAILS)
             
         except Timeout:
             print(f"Plugin detay timeout: {plugin_id}")
             return None
         except HTTPError as e:
-            if e.response.status_code == 429:
-                print("Rate limit, 5 saniye bekleniyor...")
-                time.sleep(5)
-                return self.get_plugin_details(plugin_id)
             print(f"Plugin detay HTTP hatası: {e}")
             return None
         except Exception as e:
@@ -114,26 +169,41 @@ class SpigotAPI:
         params = {'size': size, 'sort': '-id'}
         
         try:
-            response = self.session.get(url, params=params, timeout=(3.05, 27))
-            response.raise_for_status()
-            return response.json()
+            return self.response_cache.get_json(self.http, url, params=params, ttl=ResponseCache.TTL_VERSIONS)
             
         except Timeout:
             print(f"Version listesi timeout: {plugin_id}")
             return []
         except HTTPError as e:
-            if e.response.status_code == 429:
-                print("Rate limit, 5 saniye bekleniyor...")
-                time.sleep(5)
-                return self.get_plugin_versions(plugin_id, size)
             print(f"Version listesi HTTP hatası: {e}")
             return []
         except Exception as e:
             print(f"Version listesi hatası: {e}")
             return []
     
+    def get_latest_version(self, plugin_id: int) -> Optional[Dict]:
+        """Plugin'in en son yayınlanan sürümünü getir"""
+        url = f"{self.BASE_URL}/resources/{plugin_id}/versions/latest"
+        
+        try:
+            return self.response_cache.get_json(self.http, url, ttl=ResponseCache.TTL_VERSIONS)
+            
+        except Timeout:
+            print(f"Son sürüm timeout: {plugin_id}")
+            return None
+        except HTTPError as e:
+            print(f"Son sürüm HTTP hatası: {e}")
+            return None
+        except Exception as e:
+            print(f"Son sürüm hatası: {e}")
+            return None
+    
     async def get_aio_session(self):
         """Async session'ı lazy initialization ile al"""
+        # Paylaşılan havuz varsa keep-alive bağlantılarını yeniden kullan
+        if self.session_pool is not None:
+            return await self.session_pool.get_session()
+        
         if self._aio_session is None or self._aio_session.closed:
             connector = aiohttp.TCPConnector(
                 limit=100,
@@ -156,10 +226,21 @@ class SpigotAPI:
     
     async def close_aio_session(self):
         """Async session'ı kapat"""
+        # Paylaşılan session havuz tarafından kapatılır
+        if self.session_pool is not None:
+            return
+        
         if self._aio_session and not self._aio_session.closed:
             await self._aio_session.close()
             await asyncio.sleep(0.250)  # SSL bağlantıları için grace period
     
+    @staticmethod
+    def store_alias(plugin_id, version_id) -> Optional[str]:
+        """Jar deposunda kaynak sürümünü tanımlayan takma ad ('latest' değişebileceği için yok)"""
+        if plugin_id and str(version_id or '').isdigit():
+            return f"spigot:{plugin_id}:{version_id}"
+        return None
+    
     async def download_plugin(self, plugin_id: int, version_id: int, download_path: str, progress_callback=None) -> bool:
         """Plugin indirme"""
         try:
@@ -169,22 +250,17 @@ class SpigotAPI:
             url = f"{self.BASE_URL}/resources/{plugin_id}/versions/{version_id}/download"
             session = await self.get_aio_session()
             
-            async with session.get(url) as response:
-                if response.status == 200:
-                    total_size = int(response.headers.get('content-length', 0))
-                    downloaded = 0
-                    
-                    async with aiofiles.open(download_path, 'wb') as file:
-                        async for chunk in response.content.iter_chunked(8192):
-                            await file.write(chunk)
-                            downloaded += len(chunk)
-                            
-                            if progress_callback and total_size > 0:
-                                progress = int((downloaded / total_size) * 100)
-                                progress_callback(progress)
-                    
-                    return True
-            return False
+            alias = self.store_alias(plugin_id, version_id)
+            
+            # .part dosyasına indir, kopan bağlantıda Range ile devam et
+            return await self.jar_store.fetch(
+                download_path,
+                lambda verify: ResumableDownloader().download(
+                    session, url, download_path, progress_callback, verify=verify
+                ),
+                alias=alias,
+                progress_callback=progress_callback
+            )
             
         except asyncio.CancelledError:
             print("İndirme iptal edildi")
@@ -195,8 +271,3 @@ class SpigotAPI:
         except Exception as e:
             print(f"İndirme hatası: {e}")
             return False
-    
-    def __del__(self):
-        """Destructor - session'ları kapat"""
-        if hasattr(self, 'session'):
-            self.session.close()
\ No newline at end of file
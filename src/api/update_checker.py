@@ -0,0 +1,198 @@
+"""
+Liste ve indirme geçmişi için toplu güncelleme kontrolü
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from .modrinth_api import ModrinthAPI
+from .spigot_api import SpigotAPI
+from .jar_store import JarStore
+from .request_scheduler import RequestScheduler
+
+class UpdateChecker:
+    """
+    Birçok plugin'in en son uyumlu sürümünü aynı anda bulur.
+
+    Modrinth kayıtları dosya hash'iyle tek toplu istekte (/version_files/update),
+    hash'i bilinmeyenler proje ID'siyle toplu sürüm isteğinde çözülür. Spigot
+    toplu uç nokta sunmadığından son sürümler sınırlı bir thread havuzunda
+    paralel istenir. İstekler arka plan önceliğiyle yapılır, aramaları
+    yavaşlatmaz. Qt'ye bağımlı değildir; sonuçlar düz sözlük olarak döner.
+    """
+
+    MAX_WORKERS = 8  # Spigot için eşzamanlı istek sayısı
+    RECENT_COUNT = 10  # Hash'siz Modrinth projelerinde uyumlu sürüm aranan son sürüm sayısı
+
+    STATUS_OUTDATED = 'outdated'
+    STATUS_UP_TO_DATE = 'up_to_date'
+    STATUS_UNKNOWN = 'unknown'
+
+    def __init__(self, modrinth_api: Optional[ModrinthAPI] = None, spigot_api: Optional[SpigotAPI] = None,
+                 max_workers: int = MAX_WORKERS):
+        self.modrinth_api = modrinth_api if modrinth_api is not None else ModrinthAPI()
+        self.spigot_api = spigot_api if spigot_api is not None else SpigotAPI()
+        self.max_workers = max(1, int(max_workers))
+
+    # Kayıtları ortak biçime çevirme
+
+    @staticmethod
+    def entry_from_list_plugin(plugin: Dict) -> Dict:
+        """plugin_lists.json kaydını kontrol girdisine çevir"""
+        api = plugin.get('api', 'Modrinth')
+        version = plugin.get('version_data') or {}
+        entry = {
+            'name': plugin.get('name', ''),
+            'api': api,
+            'plugin_id': str(plugin.get('plugin_id') or ''),
+            'version_id': str(version.get('id') or ''),
+            'current_version': plugin.get('current_version', ''),
+            'current_date': version.get('date_published'),
+            'loaders': version.get('loaders') or [],
+            'sha1': None
+        }
+        if api == "Modrinth":
+            files = version.get('files') or [{}]
+            entry['sha1'] = (files[0].get('hashes') or {}).get('sha1')
+        return entry
+
+    @staticmethod
+    def entry_from_download(record: Dict) -> Dict:
+        """İndirme geçmişi kaydını kontrol girdisine çevir"""
+        return {
+            'name': record.get('name', ''),
+            'api': record.get('api', 'Modrinth'),
+            'plugin_id': str(record.get('plugin_id') or ''),
+            'version_id': str(record.get('version_id') or ''),
+            'current_version': record.get('version', ''),
+            'current_date': None,
+            'loaders': [],
+            'sha1': None,
+            'path': record.get('path', '')
+        }
+
+    # Kontrol
+
+    def check(self, entries: List[Dict], game_versions: Optional[List[str]] = None) -> List[Dict]:
+        """
+        Girdilerin en son sürümlerini bul
+
+        Her girdi için 'latest' (sürüm sözlüğü veya None), 'latest_version' ve
+        'status' (outdated / up_to_date / unknown) alanları eklenmiş kopyasını
+        aynı sırayla döndür.
+        """
+        results = [dict(entry, latest=None, latest_version='', status=self.STATUS_UNKNOWN) for entry in entries]
+        modrinth = [result for result in results if result['api'] == "Modrinth"]
+        spigot = [result for result in results if result['api'] != "Modrinth"]
+
+        # Modrinth toplu istekleri ve Spigot istekleri aynı anda çalışır
+        with RequestScheduler.priority(RequestScheduler.PRIORITY_BACKGROUND):
+            check_modrinth = RequestScheduler.bind(self._check_modrinth)
+            check_spigot = RequestScheduler.bind(self._check_spigot)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            modrinth_future = executor.submit(check_modrinth, modrinth, game_versions)
+            spigot_futures = [executor.submit(check_spigot, result) for result in spigot]
+            for future in [modrinth_future] + spigot_futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"Güncelleme kontrolü hatası: {e}")
+
+        for result in results:
+            self._set_status(result)
+        return results
+
+    @staticmethod
+    def _hash_local_file(result: Dict):
+        """Hash bilinmiyorsa diskteki dosyadan hesapla"""
+        path = result.get('path')
+        if result.get('sha1') or not path or not os.path.isfile(path):
+            return
+        try:
+            result['sha1'] = JarStore.hash_file(path)['sha1']
+        except OSError as e:
+            print(f"Hash hesaplanamadı ({path}): {e}")
+
+    def _check_modrinth(self, results: List[Dict], game_versions: Optional[List[str]]):
+        for result in results:
+            self._hash_local_file(result)
+
+        # Aynı loader kümesini kullananlar tek istekte sorgulanır
+        groups = {}
+        for result in results:
+            if result['sha1']:
+                groups.setdefault(tuple(sorted(result['loaders'])), []).append(result)
+
+        for loaders, group in groups.items():
+            latest = self.modrinth_api.get_latest_versions_by_hashes(
+                [result['sha1'] for result in group], loaders=list(loaders), game_versions=game_versions
+            )
+            for result in group:
+                version = latest.get(result['sha1'].lower())
+                if version:
+                    result['latest'] = version
+                    result['plugin_id'] = result['plugin_id'] or version.get('project_id', '')
+
+        # Hash'i olmayan veya eşleşmeyen kayıtlar proje ID'siyle çözülür
+        remaining = [result for result in results if result['latest'] is None]
+        for result in remaining:
+            if not result['plugin_id']:
+                search_results = self.modrinth_api.search_plugins(result['name'], limit=5)
+                if search_results:
+                    result['plugin_id'] = search_results[0].get('project_id') or search_results[0].get('slug', '')
+
+        project_ids = list({result['plugin_id'] for result in remaining if result['plugin_id']})
+        if not project_ids:
+            return
+        recent = self.modrinth_api.get_recent_versions(project_ids, count=self.RECENT_COUNT)
+        for result in remaining:
+            for version in recent.get(result['plugin_id'], []):
+                if self._is_compatible(version, result['loaders'], game_versions):
+                    result['latest'] = version
+                    break
+
+    @staticmethod
+    def _is_compatible(version: Dict, loaders: List[str], game_versions: Optional[List[str]]) -> bool:
+        if loaders and not set(loaders) & set(version.get('loaders', [])):
+            return False
+        if game_versions and not set(game_versions) & set(version.get('game_versions', [])):
+            return False
+        return True
+
+    def _check_spigot(self, result: Dict):
+        if not result['plugin_id']:
+            search_results = self.spigot_api.search_plugins(result['name'], size=5)
+            if not search_results:
+                return
+            result['plugin_id'] = str(search_results[0].get('id', ''))
+        result['latest'] = self.spigot_api.get_latest_version(result['plugin_id'])
+
+    @classmethod
+    def _set_status(cls, result: Dict):
+        latest = result['latest']
+        if not latest:
+            return
+
+        if result['api'] == "Modrinth":
+            result['latest_version'] = latest.get('version_number', '')
+            latest_hashes = {(file.get('hashes') or {}).get('sha1') for file in latest.get('files', [])}
+            if result['sha1'] and latest_hashes - {None}:
+                # Dosya en son sürümün dosyasıyla aynıysa güncel
+                outdated = result['sha1'].lower() not in latest_hashes
+            elif result['version_id']:
+                outdated = latest.get('id') != result['version_id']
+                # Kayıttaki sürüm en yenisinden daha yeniyse (ön sürüm vb.) güncel say
+                if outdated and result['current_date'] and latest.get('date_published'):
+                    outdated = latest['date_published'] > result['current_date']
+            else:
+                outdated = result['latest_version'] != result['current_version']
+        else:
+            result['latest_version'] = latest.get('name', '')
+            if result['version_id'].isdigit() and str(latest.get('id', '')).isdigit():
+                # Spiget sürüm ID'leri artan sırada verilir
+                outdated = int(latest['id']) > int(result['version_id'])
+            else:
+                outdated = result['latest_version'] != result['current_version']
+
+        result['status'] = cls.STATUS_OUTDATED if outdated else cls.STATUS_UP_TO_DATE
@@ -0,0 +1,307 @@
+"""
+Qt'siz komut satırı aracı
+
+Arayüz açmadan liste senkronizasyonu, güncelleme kontrolü ve arama yapar.
+Her olay stdout'a tek satırlık JSON olarak yazılır (JSON Lines); API
+modüllerinin print ile verdiği mesajlar stderr'e yönlendirilir. PyQt6 hiç
+içe aktarılmaz.
+
+Örnekler:
+    python cli.py sync "Survival" servers/survival/plugins
+    python cli.py check-updates --list "Survival" --game-version 1.20.4
+    python cli.py search worldedit --api modrinth
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+
+EXIT_OK = 0
+EXIT_FAILED = 1  # Bazı işlemler başarısız
+EXIT_USAGE = 2  # Liste bulunamadı, geçersiz argüman
+
+PROGRESS_STEP = 10  # İlerleme olaylarının yayınlandığı yüzde aralığı
+
+class EventWriter:
+    """Olayları JSON Lines olarak yazar (birden fazla thread'den güvenli)"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._lock = threading.Lock()
+
+    def emit(self, event, **fields):
+        line = json.dumps(dict(event=event, time=round(time.time(), 3), **fields), ensure_ascii=False)
+        with self._lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+# Yardımcılar
+
+def plugin_name_of(item):
+    return item['plugin'].get('title') or item['plugin'].get('name', 'plugin')
+
+def version_name_of(version):
+    return version.get('version_number') or version.get('name', 'N/A')
+
+def download_item_from_list_plugin(plugin, version):
+    """Liste kaydını indirme öğesine çevir (arayüzdeki toplu indirmeyle aynı biçim)"""
+    api_type = plugin.get('api', 'Modrinth')
+    plugin_id = plugin.get('plugin_id', '')
+    if api_type == "Modrinth":
+        plugin_obj = {'title': plugin.get('name'), 'project_id': plugin_id, 'slug': plugin_id}
+    else:
+        plugin_obj = {'name': plugin.get('name'), 'id': int(plugin_id)}
+    return {'plugin': plugin_obj, 'version': version, 'api': api_type}
+
+def check_entries(entries, game_versions, events):
+    """UpdateChecker'ı çalıştır ve her sonucu olay olarak yayınla"""
+    from .api.update_checker import UpdateChecker
+
+    results = UpdateChecker().check(entries, game_versions=game_versions)
+    for result in results:
+        events.emit(
+            'update',
+            name=result['name'],
+            api=result['api'],
+            plugin_id=result['plugin_id'],
+            current_version=result['current_version'],
+            latest_version=result['latest_version'],
+            status=result['status']
+        )
+    return results
+
+def save_latest_versions(list_name, results):
+    """Bulunan son sürümleri listedeki 'latest_version' alanına yaz"""
+    from .utils import ListManager
+
+    latest_versions = {
+        ListManager.plugin_key(result): result['latest_version']
+        for result in results if result['latest_version']
+    }
+    if latest_versions:
+        ListManager.shared().set_latest_versions(list_name, latest_versions)
+
+# Komutlar
+
+def command_search(args, events):
+    """Plugin ara ve sonuçları yayınla"""
+    from concurrent.futures import ThreadPoolExecutor
+    from .api.modrinth_api import ModrinthAPI
+    from .api.spigot_api import SpigotAPI
+    from .api.request_scheduler import RequestScheduler
+    from .utils import SettingsManager, PluginSorter
+
+    show_premium = SettingsManager.get_show_premium_plugins()
+    limit = args.limit or SettingsManager.get_search_limit()
+    modrinth_results, spigot_results = [], []
+
+    with RequestScheduler.priority(RequestScheduler.PRIORITY_INTERACTIVE):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            modrinth_future = spigot_future = None
+            if args.api in ('modrinth', 'all'):
+                modrinth_future = executor.submit(
+                    RequestScheduler.bind(ModrinthAPI().search_plugins), args.query, limit=limit,
+                    include_premium=show_premium
+                )
+            if args.api in ('spigot', 'all'):
+                spigot_future = executor.submit(
+                    RequestScheduler.bind(SpigotAPI().search_plugins), args.query, size=limit,
+                    include_premium=show_premium
+                )
+            if modrinth_future is not None:
+                modrinth_results = modrinth_future.result()
+            if spigot_future is not None:
+                spigot_results = spigot_future.result()
+
+    results = PluginSorter.sort_search_results(modrinth_results, spigot_results)
+    for plugin in results:
+        if plugin.get('_api_source') == 'Spigot':
+            events.emit('result', api='Spigot', plugin_id=str(plugin.get('id', '')), name=plugin.get('name', ''),
+                        description=plugin.get('tag', ''), downloads=plugin.get('downloads', 0),
+                        premium=bool(plugin.get('premium')))
+        else:
+            events.emit('result', api='Modrinth', plugin_id=plugin.get('project_id') or plugin.get('slug', ''),
+                        name=plugin.get('title', ''), description=plugin.get('description', ''),
+                        downloads=plugin.get('downloads', 0), premium=False)
+
+    events.emit('summary', command='search', count=len(results))
+    return EXIT_OK
+
+def command_check_updates(args, events):
+    """Liste veya indirme geçmişindeki plugin'lerin güncellemelerini kontrol et"""
+    from .api.update_checker import UpdateChecker
+    from .utils import ListManager, DownloadHistory
+
+    if args.list:
+        if ListManager.shared().get_list(args.list) is None:
+            events.emit('error', message=f"Liste bulunamadı: {args.list}")
+            return EXIT_USAGE
+        entries = [UpdateChecker.entry_from_list_plugin(plugin) for plugin in ListManager.shared().get_plugins(args.list)]
+    else:
+        # Aynı dosya birden fazla indirildiyse sadece son kaydı kontrol et
+        latest_records = {}
+        for record in DownloadHistory.shared().load():
+            latest_records[record.get('path') or record.get('name')] = record
+        entries = [UpdateChecker.entry_from_download(record) for record in latest_records.values()]
+
+    events.emit('start', command='check-updates', total=len(entries))
+    results = check_entries(entries, args.game_version, events)
+    if args.list:
+        save_latest_versions(args.list, results)
+
+    counts = {status: 0 for status in (UpdateChecker.STATUS_OUTDATED, UpdateChecker.STATUS_UP_TO_DATE,
+                                       UpdateChecker.STATUS_UNKNOWN)}
+    for result in results:
+        counts[result['status']] += 1
+    events.emit('summary', command='check-updates', total=len(results), **counts)
+    return EXIT_OK
+
+def command_sync(args, events):
+    """Listedeki plugin'leri klasöre indir; klasörde aynı dosya varsa atla"""
+    from .api.update_checker import UpdateChecker
+    from .utils import ListManager, SettingsManager
+
+    manager = ListManager.shared()
+    if manager.get_list(args.list) is None:
+        events.emit('error', message=f"Liste bulunamadı: {args.list}")
+        return EXIT_USAGE
+    plugins = manager.get_plugins(args.list)
+    folder = args.folder or SettingsManager.get('default_folder', 'plugins')
+
+    # İstenirse listede kayıtlı sürüm yerine en son uyumlu sürüm indirilir
+    latest = {}
+    if args.latest and plugins:
+        entries = [UpdateChecker.entry_from_list_plugin(plugin) for plugin in plugins]
+        results = check_entries(entries, args.game_version, events)
+        save_latest_versions(args.list, results)
+        latest = {index: result['latest'] for index, result in enumerate(results) if result['latest']}
+
+    items = []
+    for index, plugin in enumerate(plugins):
+        version = latest.get(index) or plugin.get('version_data')
+        if not version or not plugin.get('plugin_id'):
+            events.emit('skipped', name=plugin.get('name', ''), reason="sürüm bilgisi yok")
+            continue
+        try:
+            items.append(download_item_from_list_plugin(plugin, version))
+        except ValueError:
+            events.emit('skipped', name=plugin.get('name', ''), reason="geçersiz plugin ID")
+
+    events.emit('start', command='sync', list=args.list, folder=os.path.abspath(folder), total=len(items))
+    concurrency = args.concurrency or SettingsManager.get('concurrent_downloads', 3)
+    downloader = HeadlessDownloader(folder, concurrency, force=args.force, events=events)
+    statuses = downloader.run(items)
+
+    counts = {status: statuses.count(status) for status in ('downloaded', 'up_to_date', 'failed')}
+    events.emit('summary', command='sync', total=len(items), **counts)
+    return EXIT_FAILED if counts['failed'] else EXIT_OK
+
+class HeadlessDownloader:
+    """
+    Arayüzdeki toplu indirmeyle aynı DownloadRunner'ı kullanır (dosya adları,
+    jar deposu kontrolü ve indirme geçmişi kayıtları ortak); ilerlemeyi sinyal
+    yerine olay olarak yayınlar.
+    """
+
+    def __init__(self, folder, max_concurrent, force=False, events=None):
+        from .api.download_runner import DownloadRunner
+
+        self.events = events
+        self.items = []
+        self.checkpoints = {}  # satır -> son yayınlanan ilerleme
+        self.runner = DownloadRunner(
+            folder, max_concurrent, sync=not force, record_completed=True,
+            on_progress=self.on_progress, on_finished=self.on_finished
+        )
+
+    def run(self, items):
+        """Tüm öğeleri indir; her öğe için downloaded / up_to_date / failed döndür"""
+        self.items = items
+        try:
+            results = self.runner.run(items)
+        except KeyboardInterrupt:
+            self.runner.cancel()
+            raise
+        return [self.status(index, success) for index, success in enumerate(results)]
+
+    def status(self, row, success):
+        if not success:
+            return 'failed'
+        return 'up_to_date' if row in self.runner.up_to_date_rows else 'downloaded'
+
+    def on_progress(self, row, progress):
+        checkpoint = int(progress) // PROGRESS_STEP * PROGRESS_STEP
+        if checkpoint > self.checkpoints.get(row, -1) and row not in self.runner.up_to_date_rows:
+            self.checkpoints[row] = checkpoint
+            self.events.emit('progress', name=plugin_name_of(self.items[row]), progress=checkpoint)
+
+    def on_finished(self, row, success):
+        item = self.items[row]
+        fields = dict(name=plugin_name_of(item), version=version_name_of(item['version']), api=item['api'],
+                      path=self.runner.download_paths.get(row), status=self.status(row, success))
+        if row in self.runner.errors:
+            fields['error'] = self.runner.errors[row]
+        self.events.emit('item', **fields)
+
+# Giriş noktası
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="pluginauto",
+        description="Minecraft Plugin Downloader - komut satırı (çıktı: JSON Lines)"
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    sync = commands.add_parser('sync', help="Listeyi klasöre senkronize et")
+    sync.add_argument('list', help="Liste adı")
+    sync.add_argument('folder', nargs='?', help="Hedef klasör (varsayılan: ayarlardaki indirme klasörü)")
+    sync.add_argument('--latest', action='store_true', help="Kayıtlı sürüm yerine en son uyumlu sürümü indir")
+    sync.add_argument('--game-version', action='append', help="Uyumlu Minecraft sürümü (tekrarlanabilir)")
+    sync.add_argument('--concurrency', type=int, help="Eşzamanlı indirme sayısı")
+    sync.add_argument('--force', action='store_true', help="Klasördeki dosya güncel olsa da indir")
+
+    check = commands.add_parser('check-updates', help="Güncellemeleri kontrol et")
+    source = check.add_mutually_exclusive_group(required=True)
+    source.add_argument('--list', help="Kontrol edilecek liste")
+    source.add_argument('--history', action='store_true', help="İndirme geçmişini kontrol et")
+    check.add_argument('--game-version', action='append', help="Uyumlu Minecraft sürümü (tekrarlanabilir)")
+
+    search = commands.add_parser('search', help="Plugin ara")
+    search.add_argument('query', help="Arama metni")
+    search.add_argument('--api', choices=['modrinth', 'spigot', 'all'], default='all', help="Aranacak kaynak")
+    search.add_argument('--limit', type=int, help="Kaynak başına sonuç sayısı")
+
+    return parser
+
+COMMANDS = {
+    'sync': command_sync,
+    'check-updates': command_check_updates,
+    'search': command_search
+}
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    events = EventWriter(sys.stdout)
+
+    # API modüllerinin mesajları JSON çıktısına karışmasın
+    with contextlib.redirect_stdout(sys.stderr):
+        try:
+            return COMMANDS[args.command](args, events)
+        except KeyboardInterrupt:
+            events.emit('error', message="iptal edildi")
+            return EXIT_FAILED
+        except Exception as e:
+            events.emit('error', message=str(e))
+            return EXIT_FAILED
+        finally:
+            from .utils import ListManager
+            from .api.session_pool import SessionPool
+            ListManager.flush_all()
+            SessionPool.shared().close()
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,11 +6,12 @@ from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                             QPushButton, QProgressBar, QComboBox, QFileDialog,
                             QMessageBox, QTextEdit)
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
-import asyncio
 import os
 
 from ..api.modrinth_api import ModrinthAPI
 from ..api.spigot_api import SpigotAPI
+from ..api.session_pool import SessionPool
+from ..utils import DownloadHistory
 
 class DownloadWorker(QThread):
     progress_updated = pyqtSignal(int)
@@ -22,63 +23,61 @@ class DownloadWorker(QThread):
         self.plugin = plugin
         self.version = version
         self.download_path = download_path
+        self.history = DownloadHistory.shared()
+        self.journal_key = None
         
     def run(self):
         try:
-            # Windows için event loop policy ayarla
-            if hasattr(asyncio, 'WindowsProactorEventLoopPolicy'):
-                asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+            # İndirmeyi günlüğe yaz: çökme durumunda yarım kaldığı bilinir
+            plugin_name = self.plugin.get('title') or self.plugin.get('name', 'N/A')
+            version_name = self.version.get('version_number') or self.version.get('name', 'N/A')
+            self.journal_key = self.history.start(
+                plugin_name, version_name, self.api_type, self.download_path, **self.source_fields()
+            )
             
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+            # Paylaşılan session havuzu: keep-alive bağlantıları indirmeler arasında korunur
+            pool = SessionPool.shared()
             
-            api = None
-            try:
-                if self.api_type == "Modrinth":
-                    api = ModrinthAPI()
-                    # Modrinth için download URL'i version'dan al
-                    download_url = self.version.get('files', [{}])[0].get('url')
-                    if download_url:
-                        success = loop.run_until_complete(
-                            api.download_plugin(download_url, self.download_path, self.update_progress)
+            if self.api_type == "Modrinth":
+                api = ModrinthAPI(session_pool=pool)
+                # Modrinth için download URL'i version'dan al
+                download_url = self.version.get('files', [{}])[0].get('url')
+                if download_url:
+                    success = pool.run(
+                        api.download_plugin(
+                            download_url, self.download_path, self.update_progress,
+                            hashes=self.version.get('files', [{}])[0].get('hashes')
                         )
-                    else:
-                        success = False
-                else:  # Spigot
-                    api = SpigotAPI()
-                    plugin_id = self.plugin.get('id')
-                    version_id = self.version.get('id')
-                    success = loop.run_until_complete(
-                        api.download_plugin(plugin_id, version_id, self.download_path, self.update_progress)
                     )
-                
-                self.download_finished.emit(success, self.download_path)
-                
-            finally:
-                # API session'ını kapat
-                if api:
-                    try:
-                        loop.run_until_complete(api.close_aio_session())
-                    except:
-                        pass
-                
-                # Loop'u güvenli şekilde kapat
-                try:
-                    pending = asyncio.all_tasks(loop)
-                    for task in pending:
-                        task.cancel()
-                    if pending:
-                        loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
-                except:
-                    pass
-                finally:
-                    loop.close()
+                else:
+                    success = False
+            else:  # Spigot
+                api = SpigotAPI(session_pool=pool)
+                plugin_id = self.plugin.get('id')
+                version_id = self.version.get('id')
+                success = pool.run(
+                    api.download_plugin(plugin_id, version_id, self.download_path, self.update_progress)
+                )
+            
+            if not success:
+                self.history.fail(self.journal_key, "indirme başarısız")
+            self.download_finished.emit(success, self.download_path)
                     
         except Exception as e:
             print(f"Download worker hatası: {e}")
+            self.history.fail(self.journal_key, e)
             self.download_finished.emit(False, str(e))
     
+    def source_fields(self):
+        """Kayıtta saklanacak plugin/sürüm ID'leri ve dosya adresi"""
+        if self.api_type == "Modrinth":
+            plugin_id = self.plugin.get('project_id') or self.plugin.get('slug')
+        else:
+            plugin_id = self.plugin.get('id')
+        return DownloadHistory.source_fields(self.api_type, plugin_id, self.version)
+    
     def update_progress(self, progress):
+        self.history.progress(self.journal_key, progress)
         self.progress_updated.emit(progress)
 
 class DownloadDialog(QDialog):
@@ -248,7 +247,9 @@ class DownloadDialog(QDialog):
                     plugin_name, 
                     version_name, 
                     self.api_type, 
-                    message
+                    message,
+                    journal_key=self.download_worker.journal_key,
+                    **self.download_worker.source_fields()
                 )
             
             QMessageBox.information(self, "Başarılı", f"Plugin başarıyla indirildi:\n{message}")
@@ -5,15 +5,24 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                             QTableWidget, QTableWidgetItem, QPushButton,
                             QHeaderView, QFileDialog, QMessageBox)
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 import os
-import json
-from ..utils import SettingsManager, IconManager, IconCacheMixin, PluginSorter
+from ..utils import SettingsManager, IconManager, IconCacheMixin, PluginSorter, DownloadHistory
 
 class DownloadManagerTab(QWidget, IconCacheMixin):
+    ROW_BATCH_DELAY = 50  # Yeni kayıtların tabloya toplu eklenmeden önce beklediği süre (ms)
+    
     def __init__(self):
         super().__init__()
-        self.downloads_file = "downloads.json"
+        self.history = DownloadHistory.shared()
+        self.displayed_downloads = []  # Tablodaki sırayla gösterilen kayıtlar
+        self.pending_downloads = []  # Tabloya henüz eklenmemiş yeni kayıtlar
+        
+        # Art arda gelen kayıtları tek seferde tabloya ekle
+        self.row_batch_timer = QTimer(self)
+        self.row_batch_timer.setSingleShot(True)
+        self.row_batch_timer.setInterval(self.ROW_BATCH_DELAY)
+        self.row_batch_timer.timeout.connect(self.flush_pending_rows)
         self.search_tab = None
         self.active_downloads = {}  # Aktif indirmeler için
         self.icon_cache = None  # İkon cache referansı
@@ -42,8 +51,13 @@ class DownloadManagerTab(QWidget, IconCacheMixin):
         sort_btn.clicked.connect(self.change_sorting)
         header_layout.addWidget(sort_btn)
         
+        update_check_btn = QPushButton("Güncellemeleri Kontrol Et")
+        update_check_btn.setStyleSheet("QPushButton { background-color: #2196F3; color: white; padding: 6px 12px; }")
+        update_check_btn.clicked.connect(self.check_history_updates)
+        header_layout.addWidget(update_check_btn)
+        
         refresh_btn = QPushButton("Yenile")
-        refresh_btn.clicked.connect(self.load_downloads)
+        refresh_btn.clicked.connect(self.refresh_downloads)
         header_layout.addWidget(refresh_btn)
         
         clear_btn = QPushButton("Geçmişi Temizle")
@@ -109,6 +123,8 @@ class DownloadManagerTab(QWidget, IconCacheMixin):
         # Satır yüksekliği
         self.downloads_table.verticalHeader().setDefaultSectionSize(60)
         
+        # Kaydırıldıkça görünen satırların ikonlarını öne al
+        self.watch_icon_visibility(self.downloads_table)
         layout.addWidget(self.downloads_table)
         
         # İstatistikler
@@ -118,68 +134,123 @@ class DownloadManagerTab(QWidget, IconCacheMixin):
     def load_downloads(self):
         """İndirme geçmişini yükle"""
         try:
-            downloads = []
-            if os.path.exists(self.downloads_file):
-                try:
-                    with open(self.downloads_file, 'r', encoding='utf-8') as f:
-                        downloads = json.load(f)
-                except (json.JSONDecodeError, FileNotFoundError):
-                    downloads = []
+            # Bekleyen yeni kayıtlar zaten depodan okunan listede
+            self.row_batch_timer.stop()
+            self.pending_downloads = []
+            downloads = self.history.load()
             
             # API önceliğine göre sırala
             sorted_downloads = PluginSorter.sort_by_api_priority(downloads)
+            # Geçmişin kendi listesi değil kopya tutulur; eklenen satırlar orada iki kez yer almaz
+            self.displayed_downloads = list(sorted_downloads)
             self.downloads_table.setRowCount(len(sorted_downloads))
             
             for row, download in enumerate(sorted_downloads):
-                # Seçim checkbox'ı
-                from PyQt6.QtWidgets import QCheckBox
-                checkbox = QCheckBox()
-                checkbox.stateChanged.connect(self.update_multi_buttons)
-                self.downloads_table.setCellWidget(row, 0, checkbox)
-                
-                # İkon (cache destekli)
-                api_type = download.get('api', 'N/A')
-                icon_url = download.get('icon_url', '')
-                icon_label = IconManager.create_cached_icon(icon_url, api_type, self.icon_cache, self.download_icon_async)
-                self.downloads_table.setCellWidget(row, 1, icon_label)
-                
-                self.downloads_table.setItem(row, 2, QTableWidgetItem(download.get('name', 'N/A')))
-                self.downloads_table.setItem(row, 3, QTableWidgetItem(download.get('version', 'N/A')))
-                self.downloads_table.setItem(row, 4, QTableWidgetItem(download.get('api', 'N/A')))
-                self.downloads_table.setItem(row, 5, QTableWidgetItem(download.get('date', 'N/A')))
-                self.downloads_table.setItem(row, 6, QTableWidgetItem(download.get('path', 'N/A')))
-                
-                # Yeniden İndir, Dosya Aç ve Git butonları
-                button_widget = QWidget()
-                button_layout = QHBoxLayout(button_widget)
-                button_layout.setContentsMargins(2, 2, 2, 2)
-                
-                redownload_btn = QPushButton("Yeniden İndir")
-                redownload_btn.setStyleSheet("QPushButton { background-color: #4CAF50; color: white; padding: 4px 8px; }")
-                redownload_btn.clicked.connect(lambda checked, d=download: self.redownload_plugin(d))
-                button_layout.addWidget(redownload_btn)
-                
-                open_file_btn = QPushButton("Dosya Aç")
-                open_file_btn.setStyleSheet("QPushButton { background-color: #FF9800; color: white; padding: 4px 8px; }")
-                open_file_btn.clicked.connect(lambda checked, d=download: self.open_file_location(d))
-                button_layout.addWidget(open_file_btn)
-                
-                git_btn = QPushButton("Git")
-                git_btn.setStyleSheet("QPushButton { background-color: #2196F3; color: white; padding: 4px 8px; }")
-                git_btn.clicked.connect(lambda checked, d=download: self.open_plugin_website(d))
-                button_layout.addWidget(git_btn)
-                
-                self.downloads_table.setCellWidget(row, 7, button_widget)
+                self.populate_row(row, download)
             
-            self.stats_label.setText(f"Toplam indirme: {len(sorted_downloads)}")
+            self.update_stats()
             print(f"İndirme geçmişi yüklendi: {len(sorted_downloads)} kayıt")
             
         except Exception as e:
             print(f"İndirme geçmişi yüklenirken hata: {e}")
             QMessageBox.warning(self, "Uyarı", f"İndirme geçmişi yüklenemedi: {e}")
             # Hata durumunda boş tablo göster
+            self.displayed_downloads = []
             self.downloads_table.setRowCount(0)
-            self.stats_label.setText("Toplam indirme: 0")
+            self.update_stats()
+    
+    def populate_row(self, row, download):
+        """Tablonun verilen satırını kayıtla doldur"""
+        # Seçim checkbox'ı
+        from PyQt6.QtWidgets import QCheckBox
+        checkbox = QCheckBox()
+        checkbox.stateChanged.connect(self.update_multi_buttons)
+        self.downloads_table.setCellWidget(row, 0, checkbox)
+        
+        # İkon (cache destekli)
+        api_type = download.get('api', 'N/A')
+        icon_url = download.get('icon_url', '')
+        icon_label = IconManager.create_cached_icon(icon_url, api_type, self.icon_cache, self.download_icon_async)
+        self.downloads_table.setCellWidget(row, 1, icon_label)
+        
+        self.downloads_table.setItem(row, 2, QTableWidgetItem(download.get('name', 'N/A')))
+        self.downloads_table.setItem(row, 3, QTableWidgetItem(download.get('version', 'N/A')))
+        self.downloads_table.setItem(row, 4, QTableWidgetItem(download.get('api', 'N/A')))
+        self.downloads_table.setItem(row, 5, QTableWidgetItem(download.get('date', 'N/A')))
+        self.downloads_table.setItem(row, 6, QTableWidgetItem(download.get('path', 'N/A')))
+        
+        # Yeniden İndir, Dosya Aç ve Git butonları
+        button_widget = QWidget()
+        button_layout = QHBoxLayout(button_widget)
+        button_layout.setContentsMargins(2, 2, 2, 2)
+        
+        redownload_btn = QPushButton("Yeniden İndir")
+        redownload_btn.setStyleSheet("QPushButton { background-color: #4CAF50; color: white; padding: 4px 8px; }")
+        redownload_btn.clicked.connect(lambda checked, d=download: self.redownload_plugin(d))
+        button_layout.addWidget(redownload_btn)
+        
+        open_file_btn = QPushButton("Dosya Aç")
+        open_file_btn.setStyleSheet("QPushButton { background-color: #FF9800; color: white; padding: 4px 8px; }")
+        open_file_btn.clicked.connect(lambda checked, d=download: self.open_file_location(d))
+        button_layout.addWidget(open_file_btn)
+        
+        git_btn = QPushButton("Git")
+        git_btn.setStyleSheet("QPushButton { background-color: #2196F3; color: white; padding: 4px 8px; }")
+        git_btn.clicked.connect(lambda checked, d=download: self.open_plugin_website(d))
+        button_layout.addWidget(git_btn)
+        
+        self.downloads_table.setCellWidget(row, 7, button_widget)
+    
+    def flush_pending_rows(self):
+        """Bekleyen kayıtları tabloyu yeniden oluşturmadan sıralamadaki yerlerine ekle"""
+        pending = self.pending_downloads
+        self.pending_downloads = []
+        if not pending:
+            return
+        
+        api_priority = SettingsManager.get_api_priority()
+        self.downloads_table.setUpdatesEnabled(False)
+        try:
+            for download in pending:
+                row = PluginSorter.insert_position(self.displayed_downloads, download, api_priority=api_priority)
+                self.displayed_downloads.insert(row, download)
+                self.downloads_table.insertRow(row)
+                self.populate_row(row, download)
+        finally:
+            self.downloads_table.setUpdatesEnabled(True)
+        
+        self.update_stats()
+    
+    def remove_records(self, records):
+        """Kayıtları geçmişten sil; sadece gerçekten silinenlerin satırlarını kaldır ve onları döndür"""
+        self.history.remove(records)
+        remaining_ids = {record.get('id') for record in self.history.load()}
+        removed = [
+            record for record in records
+            if record.get('id') is not None and record.get('id') not in remaining_ids
+        ]
+        self.remove_rows(removed)
+        return removed
+    
+    def remove_rows(self, records):
+        """Verilen kayıtların satırlarını tablodan kaldır"""
+        remove_ids = {id(record) for record in records}
+        self.pending_downloads = [d for d in self.pending_downloads if id(d) not in remove_ids]
+        for row in range(len(self.displayed_downloads) - 1, -1, -1):
+            if id(self.displayed_downloads[row]) in remove_ids:
+                self.displayed_downloads.pop(row)
+                self.downloads_table.removeRow(row)
+        self.update_stats()
+        self.update_multi_buttons()
+    
+    def refresh_downloads(self):
+        """Geçmişi depodan yeniden okuyup tabloyu baştan oluştur"""
+        self.history.load(reload=True)
+        self.load_downloads()
+    
+    def update_stats(self):
+        """Toplam kayıt sayısını göster"""
+        self.stats_label.setText(f"Toplam indirme: {len(self.displayed_downloads)}")
     
     def clear_history(self):
         """İndirme geçmişini temizle"""
@@ -191,43 +262,33 @@ class DownloadManagerTab(QWidget, IconCacheMixin):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            try:
-                if os.path.exists(self.downloads_file):
-                    os.remove(self.downloads_file)
-                self.load_downloads()
+            if self.history.clear():
+                self.row_batch_timer.stop()
+                self.pending_downloads = []
+                self.displayed_downloads = []
+                self.downloads_table.setRowCount(0)
+                self.update_stats()
+                self.update_multi_buttons()
                 QMessageBox.information(self, "Başarılı", "İndirme geçmişi temizlendi.")
-            except Exception as e:
-                QMessageBox.critical(self, "Hata", f"Geçmiş temizlenemedi: {e}")
+            else:
+                QMessageBox.critical(self, "Hata", "Geçmiş temizlenemedi!")
     
-    def add_download(self, name, version, api, path):
-        """Yeni indirme kaydı ekle"""
+    def add_download(self, name, version, api, path, journal_key=None, **source):
+        """
+        Yeni indirme kaydı ekle
+        
+        journal_key: worker'ın günlükte açtığı indirme
+        source: plugin_id, version_id, file_url (DownloadHistory.source_fields)
+        """
         try:
-            # Mevcut kayıtları yükle
-            downloads = []
-            if os.path.exists(self.downloads_file):
-                try:
-                    with open(self.downloads_file, 'r', encoding='utf-8') as f:
-                        downloads = json.load(f)
-                except (json.JSONDecodeError, FileNotFoundError):
-                    downloads = []
-            
-            from datetime import datetime
-            download_record = {
-                'name': name,
-                'version': version,
-                'api': api,
-                'path': path,
-                'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
+            record = self.history.add(name, version, api, path, key=journal_key, **source)
+            if record is None:
+                raise RuntimeError("kayıt depoya yazılamadı")
             
-            downloads.append(download_record)
-            
-            # Kayıtları dosyaya yaz
-            with open(self.downloads_file, 'w', encoding='utf-8') as f:
-                json.dump(downloads, f, ensure_ascii=False, indent=2)
-            
-            # Tabloyu güncelle
-            self.load_downloads()
+            # Satırı bir sonraki toplu eklemede tabloya koy
+            self.pending_downloads.append(record)
+            if not self.row_batch_timer.isActive():
+                self.row_batch_timer.start()
             
             print(f"İndirme kaydı eklendi: {name} - {version}")
             
@@ -243,24 +304,32 @@ class DownloadManagerTab(QWidget, IconCacheMixin):
             
             plugin_name = download_record.get('name', '')
             api_type = download_record.get('api', 'Modrinth')
+            plugin_id = download_record.get('plugin_id')
             
-            # Plugin'i ara
             if api_type == "Modrinth":
                 from ..api.modrinth_api import ModrinthAPI
                 api = ModrinthAPI()
-                results = api.search_plugins(plugin_name, limit=10)
             else:
                 from ..api.spigot_api import SpigotAPI
                 api = SpigotAPI()
-                results = api.search_plugins(plugin_name, size=10)
             
-            if not results:
+            if plugin_id:
+                # Kayıtta saklanan ID ile plugin'i doğrudan al (isimle arama yok)
+                plugin = api.get_plugin_details(plugin_id)
+                if plugin and api_type == "Modrinth":
+                    plugin = dict(plugin, project_id=plugin.get('id'))
+            else:
+                # Eski kayıtlarda ID yok: plugin'i ara ve ilk sonucu al (en uygun match)
+                if api_type == "Modrinth":
+                    results = api.search_plugins(plugin_name, limit=10)
+                else:
+                    results = api.search_plugins(plugin_name, size=10)
+                plugin = results[0] if results else None
+            
+            if not plugin:
                 QMessageBox.warning(self, "Uyarı", f"'{plugin_name}' plugini bulunamadı!")
                 return
             
-            # İlk sonucu al (en uygun match)
-            plugin = results[0]
-            
             # İndirme dialog'unu aç
             from .download_dialog import DownloadDialog
             dialog = DownloadDialog(plugin, api_type, self)
@@ -296,6 +365,15 @@ class DownloadManagerTab(QWidget, IconCacheMixin):
             if checkbox:
                 checkbox.setChecked(False)
     
+    def get_checked_downloads(self):
+        """İşaretli satırlara karşılık gelen kayıtları döndür"""
+        checked = []
+        for row, download in enumerate(self.displayed_downloads):
+            checkbox = self.downloads_table.cellWidget(row, 0)
+            if checkbox and checkbox.isChecked():
+                checked.append(download)
+        return checked
+    
     def update_multi_buttons(self):
         """Çoklu işlem butonlarını güncelle"""
         selected_count = 0
@@ -341,25 +419,8 @@ class DownloadManagerTab(QWidget, IconCacheMixin):
         
         if reply == QMessageBox.StandardButton.Yes:
             try:
-                # JSON'dan sil
-                downloads = []
-                if os.path.exists(self.downloads_file):
-                    with open(self.downloads_file, 'r', encoding='utf-8') as f:
-                        downloads = json.load(f)
-                
-                # Kaydı bul ve sil
-                for i, download in enumerate(downloads):
-                    if (download.get('name') == download_record.get('name') and 
-                        download.get('date') == download_record.get('date')):
-                        downloads.pop(i)
-                        break
-                
-                # Dosyaya yaz
-                with open(self.downloads_file, 'w', encoding='utf-8') as f:
-                    json.dump(downloads, f, ensure_ascii=False, indent=2)
-                
-                # Tabloyu yenile
-                self.load_downloads()
+                if not self.remove_records([download_record]):
+                    QMessageBox.warning(self, "Uyarı", "Kayıt silinemedi.")
                 
             except Exception as e:
                 QMessageBox.critical(self, "Hata", f"Kayıt silinemedi: {e}")
@@ -367,19 +428,8 @@ class DownloadManagerTab(QWidget, IconCacheMixin):
     def redownload_selected_plugins(self):
         """Seçili pluginleri yeniden indir"""
         try:
-            selected_downloads = []
-            
-            # Seçili kayıtları topla
-            downloads = []
-            if os.path.exists(self.downloads_file):
-                with open(self.downloads_file, 'r', encoding='utf-8') as f:
-                    downloads = json.load(f)
-            
-            for row in range(self.downloads_table.rowCount()):
-                checkbox = self.downloads_table.cellWidget(row, 0)
-                if checkbox and checkbox.isChecked():
-                    if row < len(downloads):
-                        selected_downloads.append(downloads[row])
+            # Seçili kayıtları topla (satırlar sıralanmış listeye karşılık gelir)
+            selected_downloads = self.get_checked_downloads()
             
             if not selected_downloads:
                 QMessageBox.warning(self, "Uyarı", "Seçili plugin bulunamadı!")
@@ -394,6 +444,28 @@ class DownloadManagerTab(QWidget, IconCacheMixin):
         except Exception as e:
             QMessageBox.critical(self, "Hata", f"Yeniden indirme hatası: {e}")
     
+    def check_history_updates(self):
+        """İndirilen plugin'lerin güncellemelerini kontrol et"""
+        try:
+            # Aynı plugin birden fazla indirildiyse en son kayıt kontrol edilir
+            latest_records = {}
+            for record in self.history.load():
+                latest_records[(record.get('name'), record.get('api'))] = record
+            
+            if not latest_records:
+                QMessageBox.warning(self, "Uyarı", "İndirme geçmişi boş!")
+                return
+            
+            from ..api.update_checker import UpdateChecker
+            from .update_check_dialog import UpdateCheckDialog
+            entries = [UpdateChecker.entry_from_download(record) for record in latest_records.values()]
+            dialog = UpdateCheckDialog(entries, self)
+            dialog.set_download_manager(self)
+            dialog.exec()
+            
+        except Exception as e:
+            QMessageBox.critical(self, "Hata", f"Güncelleme kontrolü hatası: {e}")
+    
     def open_plugin_website(self, download_record):
         """Plugin'in web sitesini aç"""
         try:
@@ -401,8 +473,15 @@ class DownloadManagerTab(QWidget, IconCacheMixin):
             
             plugin_name = download_record.get('name', '')
             api_type = download_record.get('api', 'Modrinth')
+            plugin_id = download_record.get('plugin_id')
             
-            if api_type == "Modrinth":
+            if plugin_id:
+                # Kayıtta saklanan ID ile doğrudan plugin sayfası
+                if api_type == "Modrinth":
+                    url = f"https://modrinth.com/plugin/{plugin_id}"
+                else:
+                    url = f"https://www.spigotmc.org/resources/{plugin_id}/"
+            elif api_type == "Modrinth":
                 # Plugin adından slug oluştur (basit yaklaşım)
                 slug = plugin_name.lower().replace(' ', '-').replace('_', '-')
                 url = f"https://modrinth.com/plugin/{slug}"
@@ -417,6 +496,11 @@ class DownloadManagerTab(QWidget, IconCacheMixin):
     
 
     
+    def on_settings_changed(self, changed, settings):
+        """Sıralama ayarı değiştiyse tabloyu yeniden sırala"""
+        if 'api_priority' in changed:
+            self.load_downloads()
+    
     def change_sorting(self):
         """Sıralamayı değiştir"""
         try:
@@ -441,9 +525,8 @@ class DownloadManagerTab(QWidget, IconCacheMixin):
             
             if ok and new_priority != current_priority:
                 # Ayarları güncelle
+                # Tablo ayar değişikliği bildirimiyle (on_settings_changed) yeniden sıralanır
                 if SettingsManager.update_api_priority(new_priority):
-                    # Tabloyu yeniden yükle
-                    self.load_downloads()
                     QMessageBox.information(self, "Başarılı", f"Sıralama '{new_priority}' olarak değiştirildi.")
                 else:
                     QMessageBox.critical(self, "Hata", "Sıralama ayarı kaydedilemedi!")
@@ -491,27 +574,18 @@ class DownloadManagerTab(QWidget, IconCacheMixin):
         
         if reply == QMessageBox.StandardButton.Yes:
             try:
-                # Mevcut kayıtları yükle
-                downloads = []
-                if os.path.exists(self.downloads_file):
-                    with open(self.downloads_file, 'r', encoding='utf-8') as f:
-                        downloads = json.load(f)
+                checked_downloads = self.get_checked_downloads()
+                removed_count = len(self.remove_records(checked_downloads))
                 
-                # Seçili kayıtları sil (tersten git ki index karışmasın)
-                for row in range(self.downloads_table.rowCount() - 1, -1, -1):
-                    checkbox = self.downloads_table.cellWidget(row, 0)
-                    if checkbox and checkbox.isChecked():
-                        if row < len(downloads):
-                            downloads.pop(row)
-                
-                # Dosyaya yaz
-                with open(self.downloads_file, 'w', encoding='utf-8') as f:
-                    json.dump(downloads, f, ensure_ascii=False, indent=2)
-                
-                # Tabloyu yenile
-                self.load_downloads()
-                
-                QMessageBox.information(self, "Başarılı", f"{selected_count} kayıt silindi.")
+                if removed_count == 0:
+                    QMessageBox.warning(self, "Uyarı", "Kayıtlar silinemedi.")
+                elif removed_count < len(checked_downloads):
+                    QMessageBox.warning(
+                        self, "Uyarı",
+                        f"{removed_count} kayıt silindi, {len(checked_downloads) - removed_count} kayıt silinemedi."
+                    )
+                else:
+                    QMessageBox.information(self, "Başarılı", f"{removed_count} kayıt silindi.")
                 
             except Exception as e:
                 QMessageBox.critical(self, "Hata", f"Kayıtlar silinemedi: {e}")
\ No newline at end of file
@@ -12,14 +12,17 @@ from PyQt6.QtGui import QFont, QIcon
 from .plugin_search_tab import PluginSearchTab
 from .download_manager_tab import DownloadManagerTab
 from .settings_tab import SettingsTab
+from ..api.session_pool import SessionPool
+from ..utils import IconCache, IconFetchService, ListManager
 
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
-        # Global ikon cache sistemi
-        self.icon_cache = {}  # URL -> QPixmap mapping
-        # API instance'larını takip et (session cleanup için)
-        self._api_instances = []
+        # Global ikon cache sistemi (bellek LRU + disk), son kullanılanları önceden yükle
+        self.icon_cache = IconCache()
+        self.icon_cache.warm_load()
+        # Uygulama genelinde paylaşılan session havuzu
+        self.session_pool = SessionPool.shared()
         self.init_ui()
         
     def init_ui(self):
@@ -56,6 +59,11 @@ class MainWindow(QMainWindow):
         # Lists tab'a download manager referansını ver
         self.lists_tab.set_download_manager(self.download_tab)
         
+        # Ayar değişikliklerini ilgili sekmelere ilet
+        self.settings_tab.settings_changed.connect(self.search_tab.on_settings_changed)
+        self.settings_tab.settings_changed.connect(self.lists_tab.on_settings_changed)
+        self.settings_tab.settings_changed.connect(self.download_tab.on_settings_changed)
+        
         # Tüm sekmeler için ikon cache referansını ver
         self.search_tab.set_icon_cache(self.icon_cache)
         self.download_tab.set_icon_cache(self.icon_cache)
@@ -80,9 +88,17 @@ class MainWindow(QMainWindow):
     
     def update_cache_stats(self):
         """Cache istatistiklerini güncelle"""
-        cache_count = len(self.icon_cache)
+        stats = self.icon_cache.stats()
+        cache_count = stats['count']
         if cache_count > 0:
-            self.statusBar().showMessage(f"Hazır - {cache_count} ikon cache'de")
+            memory_mb = stats['memory_bytes'] / (1024 * 1024)
+            disk_mb = stats['disk_bytes'] / (1024 * 1024)
+            message = (f"Hazır - {cache_count} ikon cache'de "
+                       f"(bellek: {stats['memory_count']} / {memory_mb:.1f} MB, "
+                       f"disk: {stats['disk_count']} / {disk_mb:.1f} MB")
+            if stats['hits'] + stats['misses'] > 0:
+                message += f", isabet: %{stats['hit_rate'] * 100:.0f}"
+            self.statusBar().showMessage(message + ")")
         else:
             self.statusBar().showMessage("Hazır")
     
@@ -93,8 +109,6 @@ class MainWindow(QMainWindow):
     
     def closeEvent(self, event):
         """Pencere kapatılırken temizlik yap"""
-        import asyncio
-        
         # Worker thread'leri temizle
         if hasattr(self.search_tab, 'cleanup_worker'):
             try:
@@ -102,29 +116,21 @@ class MainWindow(QMainWindow):
             except:
                 pass
         
-        # İkon worker'larını temizle
-        if hasattr(self.search_tab, 'icon_workers'):
-            for worker in list(self.search_tab.icon_workers.values()):
-                try:
-                    if worker.isRunning():
-                        worker.quit()
-                        worker.wait(1000)
-                except:
-                    pass
-        
-        # Async session'ları kapat
+        # İkon indirme servisini durdur
+        try:
+            IconFetchService.shared().stop()
+        except:
+            pass
+        
+        # Bekleyen liste değişikliklerini diske yaz
+        try:
+            ListManager.flush_all()
+        except:
+            pass
+        
+        # Paylaşılan session havuzunu kapat
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # Event loop çalışıyorsa, task olarak ekle
-                for api_instance in self._api_instances:
-                    if hasattr(api_instance, 'close_aio_session'):
-                        loop.create_task(api_instance.close_aio_session())
-            else:
-                # Event loop çalışmıyorsa, direkt çalıştır
-                for api_instance in self._api_instances:
-                    if hasattr(api_instance, 'close_aio_session'):
-                        loop.run_until_complete(api_instance.close_aio_session())
+            self.session_pool.close()
         except:
             pass
         
@@ -6,12 +6,14 @@ from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                             QPushButton, QProgressBar, QTableWidget, QTableWidgetItem,
                             QHeaderView, QCheckBox, QMessageBox, QFileDialog, QComboBox)
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
-import asyncio
+import concurrent.futures
 import os
 from datetime import datetime
 
 from ..api.modrinth_api import ModrinthAPI
 from ..api.spigot_api import SpigotAPI
+from ..api.download_runner import DownloadRunner
+from ..utils import SettingsManager
 
 class MultiDownloadWorker(QThread):
     progress_updated = pyqtSignal(int, int)  # current, total
@@ -19,120 +21,43 @@ class MultiDownloadWorker(QThread):
     download_finished = pyqtSignal(bool, str, int)  # success, message, row
     all_finished = pyqtSignal()
     
-    def __init__(self, download_items, download_folder):
+    def __init__(self, download_items, download_folder, max_concurrent=None, sync=False):
         super().__init__()
         self.download_items = download_items
-        self.download_folder = download_folder
-        self.cancelled = False
+        self.item_names = {
+            item.get('row', index): DownloadRunner.plugin_name(item)
+            for index, item in enumerate(download_items)
+        }
+        
+        # Eşzamanlı indirme sayısını ayarlardan al
+        if max_concurrent is None:
+            max_concurrent = SettingsManager.get('concurrent_downloads', 3)
+        self.runner = DownloadRunner(
+            download_folder, max_concurrent, sync=sync,
+            on_progress=self.item_progress_updated.emit,
+            on_finished=self.on_item_finished
+        )
+        self.journal_keys = self.runner.journal_keys
+        self.download_paths = self.runner.download_paths
+        self.up_to_date_rows = self.runner.up_to_date_rows
         
     def run(self):
         try:
-            # Windows için event loop policy ayarla
-            if hasattr(asyncio, 'WindowsProactorEventLoopPolicy'):
-                asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
-            
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            try:
-                total_items = len(self.download_items)
-                completed = 0
-                
-                for row, item in enumerate(self.download_items):
-                    if self.cancelled:
-                        break
-                        
-                    try:
-                        success = loop.run_until_complete(self.download_single_item(item, row))
-                        completed += 1
-                        
-                        plugin_name = item.get('plugin', {}).get('title') or item.get('plugin', {}).get('name', 'Unknown')
-                        self.download_finished.emit(success, plugin_name, row)
-                        self.progress_updated.emit(completed, total_items)
-                    except Exception as e:
-                        print(f"Öğe indirme hatası: {e}")
-                        self.download_finished.emit(False, str(e), row)
-                        completed += 1
-                        self.progress_updated.emit(completed, total_items)
-                
-                self.all_finished.emit()
-                
-            finally:
-                # Loop'u güvenli şekilde kapat
-                try:
-                    pending = asyncio.all_tasks(loop)
-                    for task in pending:
-                        task.cancel()
-                    if pending:
-                        loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
-                except:
-                    pass
-                finally:
-                    loop.close()
+            self.runner.run(self.download_items)
+            self.all_finished.emit()
             
+        except concurrent.futures.CancelledError:
+            self.all_finished.emit()
         except Exception as e:
             print(f"Worker thread hatası: {e}")
             self.download_finished.emit(False, str(e), -1)
     
-    async def download_single_item(self, item, row):
-        try:
-            if self.cancelled:
-                return False
-                
-            api_type = item['api']
-            plugin = item['plugin']
-            version = item['version']
-            
-            # Dosya adını oluştur
-            if api_type == "Modrinth":
-                plugin_name = plugin.get('title', 'plugin')
-                file_name = version.get('files', [{}])[0].get('filename', f"{plugin_name}.jar")
-            else:
-                plugin_name = plugin.get('name', 'plugin')
-                file_name = f"{plugin_name}.jar"
-            
-            download_path = os.path.join(self.download_folder, file_name)
-            
-            # İndirme klasörünü oluştur
-            os.makedirs(os.path.dirname(download_path), exist_ok=True)
-            
-            def progress_callback(progress):
-                if not self.cancelled:
-                    self.item_progress_updated.emit(row, progress)
-            
-            api = None
-            try:
-                if api_type == "Modrinth":
-                    api = ModrinthAPI()
-                    download_url = version.get('files', [{}])[0].get('url')
-                    if download_url:
-                        success = await api.download_plugin(download_url, download_path, progress_callback)
-                    else:
-                        success = False
-                else:  # Spigot
-                    api = SpigotAPI()
-                    plugin_id = plugin.get('id')
-                    version_id = version.get('id')
-                    success = await api.download_plugin(plugin_id, version_id, download_path, progress_callback)
-                
-                return success
-            finally:
-                # API session'ını kapat
-                if api:
-                    try:
-                        await api.close_aio_session()
-                    except:
-                        pass
-            
-        except asyncio.CancelledError:
-            print("İndirme iptal edildi")
-            return False
-        except Exception as e:
-            print(f"İndirme hatası: {e}")
-            return False
+    def on_item_finished(self, row, success):
+        self.download_finished.emit(success, self.item_names.get(row, 'Unknown'), row)
+        self.progress_updated.emit(self.runner.completed, len(self.download_items))
     
     def cancel(self):
-        self.cancelled = True
+        self.runner.cancel()
 
 class MultiDownloadDialog(QDialog):
     def __init__(self, plugins_data, parent=None):
@@ -140,6 +65,8 @@ class MultiDownloadDialog(QDialog):
         self.plugins_data = plugins_data
         self.download_manager = None
         self.download_worker = None
+        self.fetched_count = 0
+        self.failed_count = 0
         self.init_ui()
         
     def init_ui(self):
@@ -184,6 +111,11 @@ class MultiDownloadDialog(QDialog):
         
         layout.addLayout(folder_layout)
         
+        # Senkronizasyon: klasörde aynı dosya varsa tekrar indirme
+        self.sync_checkbox = QCheckBox("Sadece eksik veya değişen dosyaları indir")
+        self.sync_checkbox.setChecked(True)
+        layout.addWidget(self.sync_checkbox)
+        
         # Genel ilerleme
         self.overall_progress = QProgressBar()
         layout.addWidget(self.overall_progress)
@@ -229,9 +161,8 @@ class MultiDownloadDialog(QDialog):
             
             self.plugins_table.setItem(row, 1, QTableWidgetItem(name))
             
-            # Sürüm seçimi
+            # Sürüm seçimi (sürümler tablo dolduktan sonra toplu yüklenir)
             version_combo = QComboBox()
-            self.load_versions_for_plugin(plugin_data, version_combo, row)
             self.plugins_table.setCellWidget(row, 2, version_combo)
             
             self.plugins_table.setItem(row, 3, QTableWidgetItem(plugin_data['api']))
@@ -241,6 +172,28 @@ class MultiDownloadDialog(QDialog):
             progress_bar = QProgressBar()
             progress_bar.setVisible(False)
             self.plugins_table.setCellWidget(row, 5, progress_bar)
+        
+        self.load_all_versions()
+    
+    def load_all_versions(self):
+        """Tüm satırların sürümlerini yükle (Modrinth projeleri toplu istekle)"""
+        modrinth_ids = {}
+        for row, plugin_data in enumerate(self.plugins_data):
+            if plugin_data['api'] == "Modrinth":
+                plugin = plugin_data['plugin']
+                modrinth_ids[row] = plugin.get('project_id') or plugin.get('slug')
+        
+        modrinth_versions = {}
+        if modrinth_ids:
+            try:
+                modrinth_versions = ModrinthAPI().get_recent_versions(list(set(modrinth_ids.values())))
+            except Exception as e:
+                print(f"Toplu sürüm yükleme hatası: {e}")
+        
+        for row, plugin_data in enumerate(self.plugins_data):
+            version_combo = self.plugins_table.cellWidget(row, 2)
+            versions = modrinth_versions.get(modrinth_ids[row]) if row in modrinth_ids else None
+            self.load_versions_for_plugin(plugin_data, version_combo, row, versions)
     
     def browse_folder(self):
         """Klasör seç"""
@@ -275,6 +228,7 @@ class MultiDownloadDialog(QDialog):
                     # Orijinal plugin data'sını kopyala ve sürümü güncelle
                     item_data = self.plugins_data[row].copy()
                     item_data['version'] = selected_version
+                    item_data['row'] = row
                     selected_items.append(item_data)
         
         if not selected_items:
@@ -283,6 +237,8 @@ class MultiDownloadDialog(QDialog):
         
         # UI'yi güncelle
         self.download_btn.setEnabled(False)
+        self.fetched_count = 0
+        self.failed_count = 0
         self.overall_progress.setMaximum(len(selected_items))
         self.overall_progress.setValue(0)
         
@@ -295,7 +251,9 @@ class MultiDownloadDialog(QDialog):
                 self.plugins_table.setItem(row, 4, QTableWidgetItem("İndiriliyor"))
         
         # Worker thread başlat
-        self.download_worker = MultiDownloadWorker(selected_items, self.folder_input.text())
+        self.download_worker = MultiDownloadWorker(
+            selected_items, self.folder_input.text(), sync=self.sync_checkbox.isChecked()
+        )
         self.download_worker.progress_updated.connect(self.update_overall_progress)
         self.download_worker.item_progress_updated.connect(self.update_item_progress)
         self.download_worker.download_finished.connect(self.item_download_finished)
@@ -315,13 +273,17 @@ class MultiDownloadDialog(QDialog):
     
     def update_item_progress(self, row, progress):
         """Öğe ilerlemesini güncelle"""
-        progress_bar = self.plugins_table.cellWidget(row, 4)
+        progress_bar = self.plugins_table.cellWidget(row, 5)
         if progress_bar:
             progress_bar.setValue(progress)
     
     def item_download_finished(self, success, name, row):
         """Öğe indirme tamamlandı"""
-        if success:
+        if success and row in self.download_worker.up_to_date_rows:
+            # Dosya zaten güncel, indirme yapılmadı
+            self.plugins_table.setItem(row, 4, QTableWidgetItem("Güncel"))
+        elif success:
+            self.fetched_count += 1
             self.plugins_table.setItem(row, 4, QTableWidgetItem("Tamamlandı"))
             
             # İndirme kaydını ekle
@@ -329,39 +291,57 @@ class MultiDownloadDialog(QDialog):
                 plugin_data = self.plugins_data[row]
                 api_type = plugin_data['api']
                 
+                # Tabloda seçilen sürümü kullan
+                version_combo = self.plugins_table.cellWidget(row, 2)
+                version = (version_combo.currentData() if version_combo else None) or plugin_data['version']
+                
                 if api_type == "Modrinth":
                     plugin_name = plugin_data['plugin'].get('title', 'N/A')
-                    version_name = plugin_data['version'].get('version_number', 'N/A')
+                    version_name = version.get('version_number', 'N/A')
                 else:
                     plugin_name = plugin_data['plugin'].get('name', 'N/A')
-                    version_name = plugin_data['version'].get('name', 'N/A')
+                    version_name = version.get('name', 'N/A')
                 
-                file_path = os.path.join(self.folder_input.text(), f"{plugin_name}.jar")
-                self.download_manager.add_download(plugin_name, version_name, api_type, file_path)
+                # Worker'ın dosyayı gerçekten yazdığı yol (Modrinth dosya adını sürümden alır)
+                file_path = self.download_worker.download_paths.get(
+                    row, os.path.join(self.folder_input.text(), f"{plugin_name}.jar")
+                )
+                source = DownloadRunner.source_fields(dict(plugin_data, version=version))
+                self.download_manager.add_download(
+                    plugin_name, version_name, api_type, file_path,
+                    journal_key=self.download_worker.journal_keys.get(row),
+                    **source
+                )
         else:
+            self.failed_count += 1
             self.plugins_table.setItem(row, 4, QTableWidgetItem("Başarısız"))
     
     def all_downloads_finished(self):
         """Tüm indirmeler tamamlandı"""
         self.download_btn.setEnabled(True)
         self.download_btn.setText("Tamamlandı")
-        QMessageBox.information(self, "Tamamlandı", "Tüm indirmeler tamamlandı!")
+        
+        up_to_date_count = len(self.download_worker.up_to_date_rows)
+        summary = f"{up_to_date_count} güncel, {self.fetched_count} indirildi"
+        if self.failed_count:
+            summary += f", {self.failed_count} başarısız"
+        QMessageBox.information(self, "Tamamlandı", f"Tüm indirmeler tamamlandı!\n\n{summary}")
     
     def set_download_manager(self, download_manager):
         """Download manager referansını ayarla"""
         self.download_manager = download_manager    
 
-    def load_versions_for_plugin(self, plugin_data, version_combo, row):
-        """Plugin için sürümleri yükle"""
+    def load_versions_for_plugin(self, plugin_data, version_combo, row, versions=None):
+        """Plugin için sürümleri yükle (versions verilirse istek atılmaz)"""
         try:
             api_type = plugin_data['api']
             plugin = plugin_data['plugin']
             
             if api_type == "Modrinth":
-                from ..api.modrinth_api import ModrinthAPI
-                api = ModrinthAPI()
-                plugin_id = plugin.get('project_id') or plugin.get('slug')
-                versions = api.get_plugin_versions(plugin_id, limit=200)
+                if versions is None:
+                    api = ModrinthAPI()
+                    plugin_id = plugin.get('project_id') or plugin.get('slug')
+                    versions = api.get_plugin_versions(plugin_id, limit=200)
                 
                 for version in versions[:10]:  # İlk 10 sürüm
                     version_name = version.get('version_number', 'N/A')
@@ -373,7 +353,6 @@ class MultiDownloadDialog(QDialog):
                     version_combo.addItem(display_name, version)
                     
             else:  # Spigot
-                from ..api.spigot_api import SpigotAPI
                 api = SpigotAPI()
                 plugin_id = plugin.get('id')
                 versions = api.get_plugin_versions(plugin_id)
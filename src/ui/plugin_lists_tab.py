@@ -9,8 +9,6 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
 from PyQt6.QtCore import Qt, QSize
 from PyQt6.QtGui import QIcon, QPixmap
 import os
-import json
-from datetime import datetime
 from ..utils import SettingsManager, IconManager, IconCacheMixin, PluginSorter, ListManager
 
 class PluginListsTab(QWidget, IconCacheMixin):
@@ -19,8 +17,8 @@ class PluginListsTab(QWidget, IconCacheMixin):
         self.download_manager = None
         self.current_list_name = None
         self.icon_cache = None  # İkon cache referansı
-        self.list_manager = ListManager()
-        self.lists_file = "plugin_lists.json"  # Liste dosyası
+        self.list_manager = ListManager.shared()  # Sekme ve dialog'ların ortak deposu
+        self.displayed_plugins = []  # Tablodaki sırayla liste kayıtları
         self.init_ui()
         self.load_lists()
         
@@ -71,6 +69,11 @@ class PluginListsTab(QWidget, IconCacheMixin):
         sort_btn.clicked.connect(self.change_sorting)
         plugin_header.addWidget(sort_btn)
         
+        update_check_btn = QPushButton("Güncellemeleri Kontrol Et")
+        update_check_btn.setStyleSheet("QPushButton { background-color: #2196F3; color: white; padding: 6px 12px; }")
+        update_check_btn.clicked.connect(self.check_list_updates)
+        plugin_header.addWidget(update_check_btn)
+        
         right_layout.addLayout(plugin_header)
         
         # Çoklu işlem butonları
@@ -131,6 +134,8 @@ class PluginListsTab(QWidget, IconCacheMixin):
         
         self.plugins_table.verticalHeader().setDefaultSectionSize(60)
         
+        # Kaydırıldıkça görünen satırların ikonlarını öne al
+        self.watch_icon_visibility(self.plugins_table)
         right_layout.addWidget(self.plugins_table)
         
         # Splitter ile panelleri ayır
@@ -208,44 +213,35 @@ class PluginListsTab(QWidget, IconCacheMixin):
         if dialog.exec() == QDialog.DialogCode.Accepted:
             list_data = dialog.get_list_data()
             
-            # Mevcut listeleri kontrol et
             try:
-                if os.path.exists(self.lists_file):
-                    with open(self.lists_file, 'r', encoding='utf-8') as f:
-                        lists_data = json.load(f)
-                else:
-                    lists_data = {}
-                
-                if list_data['name'] in lists_data:
-                    QMessageBox.warning(self, "Uyarı", "Bu isimde bir liste zaten var!")
+                success, message = self.list_manager.create_list(
+                    list_data['name'],
+                    icon=list_data['icon'],
+                    description=list_data['description'],
+                    custom_icon_path=list_data.get('custom_icon_path', '')
+                )
+                if not success:
+                    QMessageBox.warning(self, "Uyarı", message)
                     return
                 
-                # Yeni liste oluştur
-                lists_data[list_data['name']] = {
-                    'plugins': [],
-                    'icon': list_data['icon'],
-                    'description': list_data['description'],
-                    'created_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                    'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                }
-                
-                # Dosyaya kaydet
-                with open(self.lists_file, 'w', encoding='utf-8') as f:
-                    json.dump(lists_data, f, ensure_ascii=False, indent=2)
-                
                 # UI'yi güncelle
                 self.load_lists()
                 
                 # Yeni listeyi seç
-                for i in range(self.lists_widget.count()):
-                    if self.lists_widget.item(i).text() == list_data['name']:
-                        self.lists_widget.setCurrentRow(i)
-                        self.list_selected(self.lists_widget.item(i))
-                        break
+                self.select_list(list_data['name'])
                 
             except Exception as e:
                 QMessageBox.critical(self, "Hata", f"Liste oluşturulamadı: {e}")
     
+    def select_list(self, list_name):
+        """Sol paneldeki listeyi adına göre seç"""
+        for i in range(self.lists_widget.count()):
+            item = self.lists_widget.item(i)
+            if item.data(Qt.ItemDataRole.UserRole) == list_name:
+                self.lists_widget.setCurrentRow(i)
+                self.list_selected(item)
+                break
+    
     def show_list_context_menu(self, position):
         """Liste sağ tık menüsü"""
         item = self.lists_widget.itemAt(position)
@@ -276,18 +272,14 @@ class PluginListsTab(QWidget, IconCacheMixin):
         new_name, ok = QInputDialog.getText(self, "Liste Adını Değiştir", "Yeni ad:", text=old_name)
         if ok and new_name.strip() and new_name.strip() != old_name:
             try:
-                with open(self.lists_file, 'r', encoding='utf-8') as f:
-                    lists_data = json.load(f)
-                
-                if new_name.strip() in lists_data:
-                    QMessageBox.warning(self, "Uyarı", "Bu isimde bir liste zaten var!")
+                success, message = self.list_manager.rename_list(old_name, new_name.strip())
+                if not success:
+                    QMessageBox.warning(self, "Uyarı", message)
                     return
                 
-                # Listeyi yeniden adlandır
-                lists_data[new_name.strip()] = lists_data.pop(old_name)
-                
-                with open(self.lists_file, 'w', encoding='utf-8') as f:
-                    json.dump(lists_data, f, ensure_ascii=False, indent=2)
+                if self.current_list_name == old_name:
+                    self.current_list_name = new_name.strip()
+                    self.plugin_list_title.setText(f"Liste: {self.current_list_name}")
                 
                 self.load_lists()
                 
@@ -305,14 +297,7 @@ class PluginListsTab(QWidget, IconCacheMixin):
         
         if reply == QMessageBox.StandardButton.Yes:
             try:
-                with open(self.lists_file, 'r', encoding='utf-8') as f:
-                    lists_data = json.load(f)
-                
-                if list_name in lists_data:
-                    del lists_data[list_name]
-                
-                with open(self.lists_file, 'w', encoding='utf-8') as f:
-                    json.dump(lists_data, f, ensure_ascii=False, indent=2)
+                self.list_manager.delete_list(list_name)
                 
                 self.load_lists()
                 self.clear_plugin_table()
@@ -339,16 +324,10 @@ class PluginListsTab(QWidget, IconCacheMixin):
     def load_plugins_for_list(self, list_name):
         """Seçili liste için pluginleri yükle"""
         try:
-            if not os.path.exists(self.lists_file):
-                return
-                
-            with open(self.lists_file, 'r', encoding='utf-8') as f:
-                lists_data = json.load(f)
-            
-            if list_name not in lists_data:
+            if self.list_manager.get_list(list_name) is None:
                 return
             
-            plugins = lists_data[list_name].get('plugins', [])
+            plugins = self.list_manager.get_plugins(list_name)
             self.display_plugins(plugins)
             
         except Exception as e:
@@ -359,6 +338,8 @@ class PluginListsTab(QWidget, IconCacheMixin):
         """Pluginleri tabloda göster"""
         # API önceliğine göre sırala
         sorted_plugins = PluginSorter.sort_by_api_priority(plugins)
+        # Satır indeksleri bu sıraya göre; kayıtlar depodaki nesnelerin kendisi
+        self.displayed_plugins = sorted_plugins
         self.plugins_table.setRowCount(len(sorted_plugins))
         
         for row, plugin in enumerate(sorted_plugins):
@@ -402,6 +383,7 @@ class PluginListsTab(QWidget, IconCacheMixin):
     def clear_plugin_table(self):
         """Plugin tablosunu temizle"""
         self.plugins_table.setRowCount(0)
+        self.displayed_plugins = []
         self.plugin_list_title.setText("Plugin listesi seçin")
         self.current_list_name = None
     
@@ -452,34 +434,13 @@ class PluginListsTab(QWidget, IconCacheMixin):
     def add_plugin_to_list(self, list_name, plugin_data):
         """Plugin'i listeye ekle"""
         try:
-            if not os.path.exists(self.lists_file):
-                lists_data = {}
-            else:
-                with open(self.lists_file, 'r', encoding='utf-8') as f:
-                    lists_data = json.load(f)
-            
-            if list_name not in lists_data:
-                lists_data[list_name] = {
-                    'plugins': [],
-                    'created_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                    'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                }
-            
-            # Plugin zaten listede var mı kontrol et
-            existing_plugins = lists_data[list_name]['plugins']
-            for existing in existing_plugins:
-                if (existing.get('name') == plugin_data.get('name') and 
-                    existing.get('api') == plugin_data.get('api')):
-                    QMessageBox.information(self, "Bilgi", "Bu plugin zaten listede mevcut!")
-                    return False
-            
-            # Plugin'i ekle
-            lists_data[list_name]['plugins'].append(plugin_data)
-            lists_data[list_name]['last_updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            if self.list_manager.get_list(list_name) is None:
+                self.list_manager.create_list(list_name)
             
-            # Dosyaya kaydet
-            with open(self.lists_file, 'w', encoding='utf-8') as f:
-                json.dump(lists_data, f, ensure_ascii=False, indent=2)
+            success, message = self.list_manager.add_plugin_to_list(list_name, plugin_data)
+            if not success:
+                QMessageBox.information(self, "Bilgi", message)
+                return False
             
             # Eğer bu liste şu anda seçiliyse, tabloyu güncelle
             if self.current_list_name == list_name:
@@ -555,7 +516,6 @@ class PluginListsTab(QWidget, IconCacheMixin):
     def remove_single_plugin(self, plugin, row):
         """Tek plugin kaldır"""
         plugin_name = plugin.get('name', 'N/A')
-        
         reply = QMessageBox.question(
             self,
             "Onay",
@@ -565,81 +525,64 @@ class PluginListsTab(QWidget, IconCacheMixin):
         
         if reply == QMessageBox.StandardButton.Yes:
             try:
-                # Liste verilerini yükle
-                with open(self.lists_file, 'r', encoding='utf-8') as f:
-                    lists_data = json.load(f)
-                
-                if self.current_list_name in lists_data:
-                    plugins = lists_data[self.current_list_name]['plugins']
+                success, message = self.list_manager.remove_plugins(self.current_list_name, [plugin])
+                if success:
+                    # Tabloyu yenile
+                    self.load_plugins_for_list(self.current_list_name)
+                    self.update_list_stats()
                     
-                    if row < len(plugins):
-                        # Plugin'i listeden çıkar
-                        plugins.pop(row)
-                        
-                        # Güncellenmiş listeyi kaydet
-                        lists_data[self.current_list_name]['plugins'] = plugins
-                        lists_data[self.current_list_name]['last_updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                        
-                        with open(self.lists_file, 'w', encoding='utf-8') as f:
-                            json.dump(lists_data, f, ensure_ascii=False, indent=2)
-                        
-                        # Tabloyu yenile
-                        self.load_plugins_for_list(self.current_list_name)
-                        self.update_list_stats()
-                        
-                        QMessageBox.information(self, "Başarılı", f"'{plugin_name}' listeden kaldırıldı.")
+                    QMessageBox.information(self, "Başarılı", f"'{plugin_name}' listeden kaldırıldı.")
+                else:
+                    QMessageBox.warning(self, "Uyarı", message)
                 
             except Exception as e:
                 QMessageBox.critical(self, "Hata", f"Plugin kaldırılamadı: {e}")
     
+    def get_checked_plugins(self):
+        """İşaretli satırların liste kayıtlarını döndür (tablodaki sıralamaya göre)"""
+        checked = []
+        for row in range(self.plugins_table.rowCount()):
+            checkbox = self.plugins_table.cellWidget(row, 0)
+            if checkbox and checkbox.isChecked() and row < len(self.displayed_plugins):
+                checked.append(self.displayed_plugins[row])
+        return checked
+    
     def download_selected_plugins(self):
         """Seçili pluginleri indir"""
         try:
             selected_plugins = []
             
-            # Seçili pluginleri topla
-            for row in range(self.plugins_table.rowCount()):
-                checkbox = self.plugins_table.cellWidget(row, 0)
-                if checkbox and checkbox.isChecked():
-                    # Liste verilerini al
-                    with open(self.lists_file, 'r', encoding='utf-8') as f:
-                        lists_data = json.load(f)
-                    
-                    if self.current_list_name in lists_data:
-                        plugins = lists_data[self.current_list_name]['plugins']
-                        if row < len(plugins):
-                            plugin = plugins[row]
-                            
-                            # Plugin için sürüm bilgisini hazırla
-                            api_type = plugin.get('api', 'Modrinth')
-                            plugin_id = plugin.get('plugin_id', '')
-                            version_type = plugin.get('version_type', 'latest')
-                            
-                            # Seçili sürümü al
-                            selected_version = plugin.get('version_data')
-                            if not selected_version:
-                                continue
-                            
-                            # Plugin objesini oluştur
-                            if api_type == "Modrinth":
-                                plugin_obj = {
-                                    'title': plugin.get('name'),
-                                    'project_id': plugin_id,
-                                    'slug': plugin_id,
-                                    '_api_source': 'Modrinth'
-                                }
-                            else:
-                                plugin_obj = {
-                                    'name': plugin.get('name'),
-                                    'id': int(plugin_id),
-                                    '_api_source': 'Spigot'
-                                }
-                            
-                            selected_plugins.append({
-                                'plugin': plugin_obj,
-                                'version': selected_version,
-                                'api': api_type
-                            })
+            # Seçili pluginleri topla (bellekteki kayıtlardan, dosya okunmaz)
+            for plugin in self.get_checked_plugins():
+                # Plugin için sürüm bilgisini hazırla
+                api_type = plugin.get('api', 'Modrinth')
+                plugin_id = plugin.get('plugin_id', '')
+                
+                # Seçili sürümü al
+                selected_version = plugin.get('version_data')
+                if not selected_version:
+                    continue
+                
+                # Plugin objesini oluştur
+                if api_type == "Modrinth":
+                    plugin_obj = {
+                        'title': plugin.get('name'),
+                        'project_id': plugin_id,
+                        'slug': plugin_id,
+                        '_api_source': 'Modrinth'
+                    }
+                else:
+                    plugin_obj = {
+                        'name': plugin.get('name'),
+                        'id': int(plugin_id),
+                        '_api_source': 'Spigot'
+                    }
+                
+                selected_plugins.append({
+                    'plugin': plugin_obj,
+                    'version': selected_version,
+                    'api': api_type
+                })
             
             if not selected_plugins:
                 QMessageBox.warning(self, "Uyarı", "İndirilecek plugin seçilmedi!")
@@ -654,6 +597,28 @@ class PluginListsTab(QWidget, IconCacheMixin):
         except Exception as e:
             QMessageBox.critical(self, "Hata", f"Çoklu indirme hatası: {e}")
     
+    def check_list_updates(self):
+        """Seçili listedeki tüm plugin'lerin güncellemelerini kontrol et"""
+        try:
+            if not self.current_list_name:
+                QMessageBox.warning(self, "Uyarı", "Önce bir liste seçin!")
+                return
+            
+            plugins = self.list_manager.get_plugins(self.current_list_name)
+            if not plugins:
+                QMessageBox.warning(self, "Uyarı", "Listede plugin yok!")
+                return
+            
+            from ..api.update_checker import UpdateChecker
+            from .update_check_dialog import UpdateCheckDialog
+            entries = [UpdateChecker.entry_from_list_plugin(plugin) for plugin in plugins]
+            dialog = UpdateCheckDialog(entries, self, list_name=self.current_list_name)
+            dialog.set_download_manager(self.download_manager)
+            dialog.exec()
+            
+        except Exception as e:
+            QMessageBox.critical(self, "Hata", f"Güncelleme kontrolü hatası: {e}")
+    
     def open_plugin_website(self, plugin):
         """Plugin'in web sitesini aç"""
         try:
@@ -686,6 +651,11 @@ class PluginListsTab(QWidget, IconCacheMixin):
     
 
     
+    def on_settings_changed(self, changed, settings):
+        """Sıralama ayarı değiştiyse açık listeyi yeniden sırala"""
+        if 'api_priority' in changed and self.current_list_name:
+            self.load_plugins_for_list(self.current_list_name)
+    
     def change_sorting(self):
         """Sıralamayı değiştir"""
         try:
@@ -708,11 +678,8 @@ class PluginListsTab(QWidget, IconCacheMixin):
             
             if ok and new_priority != current_priority:
                 # Ayarları güncelle
+                # Tablo ayar değişikliği bildirimiyle (on_settings_changed) yeniden sıralanır
                 if SettingsManager.update_api_priority(new_priority):
-                    # Tabloyu yeniden yükle
-                    if self.current_list_name:
-                        self.load_plugins_for_list(self.current_list_name)
-                    
                     QMessageBox.information(self, "Başarılı", f"Sıralama '{new_priority}' olarak değiştirildi.")
                 else:
                     QMessageBox.critical(self, "Hata", "Sıralama ayarı kaydedilemedi!")
@@ -724,15 +691,8 @@ class PluginListsTab(QWidget, IconCacheMixin):
 
     def remove_selected_plugins(self):
         """Seçili pluginleri kaldır"""
-        selected_count = 0
-        selected_rows = []
-        
-        # Seçili satırları topla
-        for row in range(self.plugins_table.rowCount()):
-            checkbox = self.plugins_table.cellWidget(row, 0)
-            if checkbox and checkbox.isChecked():
-                selected_count += 1
-                selected_rows.append(row)
+        selected = self.get_checked_plugins()
+        selected_count = len(selected)
         
         if selected_count == 0:
             QMessageBox.warning(self, "Uyarı", "Kaldırılacak plugin seçilmedi!")
@@ -747,30 +707,16 @@ class PluginListsTab(QWidget, IconCacheMixin):
         
         if reply == QMessageBox.StandardButton.Yes:
             try:
-                # Liste verilerini yükle
-                with open(self.lists_file, 'r', encoding='utf-8') as f:
-                    lists_data = json.load(f)
+                success, message = self.list_manager.remove_plugins(self.current_list_name, selected)
+                if not success:
+                    QMessageBox.warning(self, "Uyarı", message)
+                    return
                 
-                if self.current_list_name in lists_data:
-                    plugins = lists_data[self.current_list_name]['plugins']
-                    
-                    # Seçili pluginleri sil (tersten git ki index karışmasın)
-                    for row in sorted(selected_rows, reverse=True):
-                        if row < len(plugins):
-                            plugins.pop(row)
-                    
-                    # Güncellenmiş listeyi kaydet
-                    lists_data[self.current_list_name]['plugins'] = plugins
-                    lists_data[self.current_list_name]['last_updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    
-                    with open(self.lists_file, 'w', encoding='utf-8') as f:
-                        json.dump(lists_data, f, ensure_ascii=False, indent=2)
-                    
-                    # Tabloyu yenile
-                    self.load_plugins_for_list(self.current_list_name)
-                    self.update_list_stats()
-                    
-                    QMessageBox.information(self, "Başarılı", f"{selected_count} plugin listeden kaldırıldı.")
+                # Tabloyu yenile
+                self.load_plugins_for_list(self.current_list_name)
+                self.update_list_stats()
+                
+                QMessageBox.information(self, "Başarılı", f"{selected_count} plugin listeden kaldırıldı.")
                 
             except Exception as e:
                 QMessageBox.critical(self, "Hata", f"Pluginler kaldırılamadı: {e}")
@@ -780,29 +726,11 @@ class PluginListsTab(QWidget, IconCacheMixin):
     def create_new_list_from_dialog(self, name):
         """Dialog'dan yeni liste oluştur (basit versiyon)"""
         try:
-            if os.path.exists(self.lists_file):
-                with open(self.lists_file, 'r', encoding='utf-8') as f:
-                    lists_data = json.load(f)
-            else:
-                lists_data = {}
-            
-            if name in lists_data:
-                QMessageBox.warning(self, "Uyarı", "Bu isimde bir liste zaten var!")
+            success, message = self.list_manager.create_list(name)
+            if not success:
+                QMessageBox.warning(self, "Uyarı", message)
                 return False
             
-            # Yeni liste oluştur (basit versiyon)
-            lists_data[name] = {
-                'plugins': [],
-                'icon': '📋 Varsayılan',
-                'description': '',
-                'created_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
-            
-            # Dosyaya kaydet
-            with open(self.lists_file, 'w', encoding='utf-8') as f:
-                json.dump(lists_data, f, ensure_ascii=False, indent=2)
-            
             # UI'yi güncelle
             self.load_lists()
             return True
@@ -815,15 +743,11 @@ class PluginListsTab(QWidget, IconCacheMixin):
     def edit_list(self, list_name):
         """Liste düzenle"""
         try:
-            with open(self.lists_file, 'r', encoding='utf-8') as f:
-                lists_data = json.load(f)
-            
-            if list_name not in lists_data:
+            list_info = self.list_manager.get_list(list_name)
+            if list_info is None:
                 QMessageBox.warning(self, "Uyarı", "Liste bulunamadı!")
                 return
             
-            list_info = lists_data[list_name]
-            
             from .edit_list_dialog import EditListDialog
             dialog = EditListDialog(list_name, list_info, self)
             
@@ -832,33 +756,25 @@ class PluginListsTab(QWidget, IconCacheMixin):
                 
                 # Liste adı değiştiyse
                 if updated_data['name'] != list_name:
-                    if updated_data['name'] in lists_data:
-                        QMessageBox.warning(self, "Uyarı", "Bu isimde bir liste zaten var!")
+                    success, message = self.list_manager.rename_list(list_name, updated_data['name'])
+                    if not success:
+                        QMessageBox.warning(self, "Uyarı", message)
                         return
-                    
-                    # Eski listeyi sil, yeni adla ekle
-                    lists_data[updated_data['name']] = lists_data.pop(list_name)
                     list_name = updated_data['name']
                 
                 # Liste bilgilerini güncelle
-                lists_data[list_name]['icon'] = updated_data['icon']
-                lists_data[list_name]['description'] = updated_data['description']
-                lists_data[list_name]['last_updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                
-                # Dosyaya kaydet
-                with open(self.lists_file, 'w', encoding='utf-8') as f:
-                    json.dump(lists_data, f, ensure_ascii=False, indent=2)
+                self.list_manager.update_list(
+                    list_name,
+                    icon=updated_data['icon'],
+                    description=updated_data['description'],
+                    custom_icon_path=updated_data.get('custom_icon_path')
+                )
                 
                 # UI'yi güncelle
                 self.load_lists()
                 
                 # Güncellenmiş listeyi seç
-                for i in range(self.lists_widget.count()):
-                    item = self.lists_widget.item(i)
-                    if item.data(Qt.ItemDataRole.UserRole) == list_name:
-                        self.lists_widget.setCurrentRow(i)
-                        self.list_selected(item)
-                        break
+                self.select_list(list_name)
                 
         except Exception as e:
             QMessageBox.critical(self, "Hata", f"Liste düzenlenemedi: {e}")
@@ -867,35 +783,14 @@ class PluginListsTab(QWidget, IconCacheMixin):
         """Seçili plugin'leri başka listeye aktar"""
         try:
             # Seçili plugin'leri topla
-            selected_plugins = []
-            selected_rows = []
-            
-            for row in range(self.plugins_table.rowCount()):
-                checkbox = self.plugins_table.cellWidget(row, 0)
-                if checkbox and checkbox.isChecked():
-                    selected_rows.append(row)
-            
-            if not selected_rows:
-                QMessageBox.warning(self, "Uyarı", "Aktarılacak plugin seçilmedi!")
-                return
-            
-            # Mevcut liste verilerini al
-            with open(self.lists_file, 'r', encoding='utf-8') as f:
-                lists_data = json.load(f)
-            
-            if self.current_list_name not in lists_data:
+            if self.list_manager.get_list(self.current_list_name) is None:
                 QMessageBox.warning(self, "Uyarı", "Kaynak liste bulunamadı!")
                 return
             
-            plugins = lists_data[self.current_list_name]['plugins']
-            
-            # Seçili plugin'leri al
-            for row in selected_rows:
-                if row < len(plugins):
-                    selected_plugins.append(plugins[row])
+            selected_plugins = self.get_checked_plugins()
             
             if not selected_plugins:
-                QMessageBox.warning(self, "Uyarı", "Aktarılacak plugin bulunamadı!")
+                QMessageBox.warning(self, "Uyarı", "Aktarılacak plugin seçilmedi!")
                 return
             
             # Transfer dialog'unu aç
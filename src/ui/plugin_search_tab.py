@@ -3,83 +3,200 @@ Plugin arama sekmesi
 """
 
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                            QLineEdit, QPushButton, QTableWidget, QTableWidgetItem,
+                            QLineEdit, QPushButton, QTableView,
                             QComboBox, QMessageBox, QHeaderView)
 from PyQt6.QtCore import Qt, QThread, QObject, pyqtSignal, pyqtSlot
 import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 from ..api.modrinth_api import ModrinthAPI
 from ..api.spigot_api import SpigotAPI
+from ..api.request_scheduler import RequestScheduler
 from .download_dialog import DownloadDialog
-from ..utils import SettingsManager, IconManager, IconCacheMixin, PluginSorter
+from .search_results_model import SearchResultsModel, IconDelegate, ActionButtonDelegate
+from ..utils import SettingsManager, PluginSorter
 
 
 
 class SearchWorker(QObject):
     """Worker object for plugin search - PyQt6 best practice"""
-    results_ready = pyqtSignal(list)
+    results_ready = pyqtSignal(list)  # İlk sayfanın kısmi sonuçları
+    page_ready = pyqtSignal(int, list, list)  # sayfa, sonuçlar, devamı olan kaynaklar
     error_occurred = pyqtSignal(str)
     finished = pyqtSignal()
     
-    def __init__(self, api_type, query):
+    PARTIAL_EMIT_INTERVAL = 0.15  # Kısmi sonuç yayınları arasındaki en kısa süre (saniye)
+    
+    def __init__(self, api_type, query, page=0, page_size=20, sources=None):
         super().__init__()
         self.api_type = api_type
         self.query = query
+        self.page = page
+        self.page_size = max(1, page_size)
+        # Karışık aramada sonuçları bitmiş kaynaklar tekrar sorgulanmaz
+        if sources is None:
+            sources = ["Modrinth", "Spigot"] if api_type == "Karışık" else [api_type]
+        self.sources = list(sources)
+        self._last_partial_emit = 0.0
+        # İlk sayfayı kullanıcı bekler; sonraki sayfalar önceden yüklenir
+        self.priority = RequestScheduler.PRIORITY_INTERACTIVE if page == 0 else RequestScheduler.PRIORITY_BACKGROUND
+    
+    def emit_partial_results(self, results):
+        """Kısmi sonuçları tabloyu çok sık yenilemeden yayınla (sadece ilk sayfa)"""
+        if self.page != 0:
+            return
+        now = time.monotonic()
+        if now - self._last_partial_emit < self.PARTIAL_EMIT_INTERVAL:
+            return
+        self._last_partial_emit = now
+        self.results_ready.emit(list(results))
+    
+    def search_source(self, source, show_premium, size, result_callback=None):
+        """Tek kaynaktan bu sayfayı al: (sonuçlar, sunucuda sonraki sayfa var mı)"""
+        if source == "Modrinth":
+            results, has_more = ModrinthAPI().search_page(
+                self.query, limit=size, include_premium=show_premium, offset=self.page * size
+            )
+        else:
+            results, has_more = SpigotAPI().search_page(
+                self.query, size=size, include_premium=show_premium,
+                result_callback=result_callback, page=self.page + 1
+            )
+        for result in results:
+            result['_api_source'] = source
+        return results, has_more
+    
+    def remaining_sources(self, outcomes):
+        """
+        Sonraki sayfası olan kaynaklar
+        
+        outcomes: kaynak -> (sonuçlar, devamı var) ya da istek hatası. Hata alan
+        kaynak listeden düşmez; sonraki sayfalarda hata varsa sayfa hata olarak
+        bildirilir ve kaydırıldığında yeniden istenir.
+        """
+        errors = [outcome for outcome in outcomes.values() if isinstance(outcome, Exception)]
+        if errors and (self.page > 0 or len(errors) == len(outcomes)):
+            raise errors[0]
+        return [
+            source for source in self.sources
+            if source in outcomes and (isinstance(outcomes[source], Exception) or outcomes[source][1])
+        ]
+    
+    def search_mixed(self, show_premium):
+        """Karışık arama: iki kaynağı paralel sorgula, her gelen sonucu sıralayarak yayınla"""
+        # Sayfa boyutu iki kaynak arasında paylaştırılır
+        per_source = max(1, self.page_size // 2)
+        
+        lock = threading.Lock()
+        modrinth_results = []
+        spigot_results = []
+        
+        def on_spigot_result(plugin):
+            # Spigot detayları geldikçe mevcut Modrinth sonuçlarıyla birleştir
+            with lock:
+                spigot_results.append(plugin)
+                self.emit_partial_results(
+                    PluginSorter.sort_search_results(list(modrinth_results), list(spigot_results))
+                )
+        
+        outcomes = {}
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = {}
+            if "Modrinth" in self.sources:
+                futures["Modrinth"] = executor.submit(
+                    RequestScheduler.bind(self.search_source), "Modrinth", show_premium, per_source
+                )
+            if "Spigot" in self.sources:
+                futures["Spigot"] = executor.submit(
+                    RequestScheduler.bind(self.search_source), "Spigot", show_premium, per_source,
+                    on_spigot_result
+                )
+            
+            # Modrinth genelde daha hızlı: gelir gelmez göster
+            for source, future in futures.items():
+                try:
+                    outcomes[source] = future.result()
+                except Exception as e:
+                    print(f"{source} arama hatası: {e}")
+                    outcomes[source] = e
+                    continue
+                
+                if source == "Modrinth":
+                    with lock:
+                        modrinth_results.extend(outcomes[source][0])
+                        self.emit_partial_results(
+                            PluginSorter.sort_search_results(list(modrinth_results), list(spigot_results))
+                        )
+        
+        remaining = self.remaining_sources(outcomes)
+        
+        def page_results(source):
+            outcome = outcomes.get(source)
+            return outcome[0] if isinstance(outcome, tuple) else []
+        
+        modrinth_final = page_results("Modrinth")
+        spigot_final = page_results("Spigot")
+        
+        # API önceliğine göre sırala (Spigot'un orijinal sırasıyla)
+        return PluginSorter.sort_search_results(modrinth_final, spigot_final), remaining
     
     @pyqtSlot()
     def do_work(self):
         """Arama işlemini gerçekleştir"""
         try:
-            results = []
-            
-            # Paralı plugin ayarını al
-            show_premium = SettingsManager.get_show_premium_plugins()
-            
-            if self.api_type == "Karışık":
-                # Hem Modrinth hem Spigot'tan ara
-                modrinth_api = ModrinthAPI()
-                spigot_api = SpigotAPI()
-                
-                modrinth_results = modrinth_api.search_plugins(self.query, limit=10, include_premium=show_premium)
-                spigot_results = spigot_api.search_plugins(self.query, size=10, include_premium=show_premium)
-                
-                # Modrinth sonuçlarını işaretle
-                for result in modrinth_results:
-                    result['_api_source'] = 'Modrinth'
+            # Bu thread'den yapılan istekler worker'ın önceliğiyle sıraya girer
+            with RequestScheduler.priority(self.priority):
+                # Paralı plugin ayarını al
+                show_premium = SettingsManager.get_show_premium_plugins()
                 
-                # Spigot sonuçlarını işaretle
-                for result in spigot_results:
-                    result['_api_source'] = 'Spigot'
-                
-                # API önceliğine göre sırala
-                results = PluginSorter.sort_search_results(modrinth_results, spigot_results)
+                if self.api_type == "Karışık":
+                    # Modrinth ve Spigot'u aynı anda ara, gelen sonuçları hemen birleştir
+                    results, remaining = self.search_mixed(show_premium)
+                else:
+                    streamed = []
+                    
+                    def on_spigot_result(plugin):
+                        # Detayı tamamlanan sonuçları beklemeden göster
+                        plugin['_api_source'] = 'Spigot'
+                        streamed.append(plugin)
+                        self.emit_partial_results(streamed)
+                    
+                    # Hata çağırana iletilir; kaynak sonraki sayfalardan düşmez
+                    results, has_more = self.search_source(
+                        self.api_type, show_premium, self.page_size, on_spigot_result
+                    )
+                    remaining = [self.api_type] if has_more else []
                 
-            elif self.api_type == "Modrinth":
-                api = ModrinthAPI()
-                results = api.search_plugins(self.query, include_premium=show_premium)
-                for result in results:
-                    result['_api_source'] = 'Modrinth'
-            else:  # Spigot
-                api = SpigotAPI()
-                results = api.search_plugins(self.query, include_premium=show_premium)
-                for result in results:
-                    result['_api_source'] = 'Spigot'
-            
-            self.results_ready.emit(results)
+                self.page_ready.emit(self.page, results, remaining)
             
         except Exception as e:
             self.error_occurred.emit(str(e))
         finally:
             self.finished.emit()
 
-class PluginSearchTab(QWidget, IconCacheMixin):
+class PluginSearchTab(QWidget):
     def __init__(self):
         super().__init__()
         self.download_manager = None
         self.lists_tab = None
-        self.current_results = []
-        self.selected_plugins = set()  # Seçili pluginleri sakla
         self.icon_cache = None  # İkon cache referansı
+        self.results_model = SearchResultsModel(self)
+        self.results_model.selection_changed.connect(self.update_multi_download_button)
+        
+        # Sayfalama durumu
+        self.search_query = ""
+        self.search_api_type = ""
+        self.page_size = 20
+        self.search_generation = 0  # Eski aramaların geç gelen sayfalarını ayırt etmek için
+        self.loaded_pages = 0
+        self.remaining_sources = []  # Sonraki sayfası olan kaynaklar
+        self.prefetched_page = None  # Önceden alınmış, henüz gösterilmemiş sayfa
+        self.page_loading = False
+        self.append_requested = False
+        self.page_threads = {}  # Çalışan sayfa thread'leri -> worker (bitene kadar canlı tutulur)
+        
         self.init_ui()
     
     def set_download_manager(self, download_manager):
@@ -93,6 +210,7 @@ class PluginSearchTab(QWidget, IconCacheMixin):
     def set_icon_cache(self, icon_cache):
         """İkon cache referansını ayarla"""
         self.icon_cache = icon_cache
+        self.results_model.set_icon_cache(icon_cache)
         
     def init_ui(self):
         layout = QVBoxLayout(self)
@@ -137,12 +255,18 @@ class PluginSearchTab(QWidget, IconCacheMixin):
         
         layout.addLayout(multi_layout)
         
-        # Sonuçlar tablosu
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(8)
-        self.results_table.setHorizontalHeaderLabels([
-            "Seç", "İkon", "Ad", "Açıklama", "Yazar", "API", "İndirme", "Aksiyon"
-        ])
+        # Sonuçlar tablosu (model/view: sadece görünen satırlar çizilir)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
+        self.results_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.results_table.setWordWrap(False)
+        
+        self.icon_delegate = IconDelegate(self.results_table)
+        self.results_table.setItemDelegateForColumn(SearchResultsModel.COLUMN_ICON, self.icon_delegate)
+        self.action_delegate = ActionButtonDelegate(self.results_table)
+        self.action_delegate.download_clicked.connect(self.download_plugin_at)
+        self.action_delegate.open_clicked.connect(self.open_plugin_website_at)
+        self.results_table.setItemDelegateForColumn(SearchResultsModel.COLUMN_ACTIONS, self.action_delegate)
         
         # Tablo ayarları
         header = self.results_table.horizontalHeader()
@@ -151,7 +275,7 @@ class PluginSearchTab(QWidget, IconCacheMixin):
         header.setSectionResizeMode(2, QHeaderView.ResizeMode.Interactive)  # Ad
         header.setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)  # Açıklama
         header.setSectionResizeMode(4, QHeaderView.ResizeMode.Interactive)  # Yazar
-        header.setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)  # API
+        header.setSectionResizeMode(5, QHeaderView.ResizeMode.Interactive)  # API
         header.setSectionResizeMode(6, QHeaderView.ResizeMode.Interactive)  # İndirme
         header.setSectionResizeMode(7, QHeaderView.ResizeMode.Interactive)  # Aksiyon
         
@@ -164,9 +288,13 @@ class PluginSearchTab(QWidget, IconCacheMixin):
         self.results_table.setColumnWidth(6, 80)   # İndirme
         self.results_table.setColumnWidth(7, 150)  # Aksiyon
         
-        # Satır yüksekliği
+        # Satır yüksekliği (sabit: binlerce satırda boyut hesabı yapılmaz)
+        self.results_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         self.results_table.verticalHeader().setDefaultSectionSize(60)
         
+        # Alta yaklaşıldıkça sonraki sayfayı göster
+        self.results_table.verticalScrollBar().valueChanged.connect(self.on_results_scrolled)
+        
         # Sağ tık menüsü
         self.results_table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.results_table.customContextMenuRequested.connect(self.show_context_menu)
@@ -184,13 +312,25 @@ class PluginSearchTab(QWidget, IconCacheMixin):
         # Önceki worker'ı temizle
         self.cleanup_worker()
         
+        # Sayfalama durumunu sıfırla
+        self.search_generation += 1
+        self.search_query = query
+        self.search_api_type = api_type
+        self.page_size = SettingsManager.get_search_limit()
+        self.loaded_pages = 0
+        self.remaining_sources = []
+        self.prefetched_page = None
+        self.page_loading = False
+        self.append_requested = False
+        
         # Arama butonunu devre dışı bırak
         self.search_button.setEnabled(False)
         self.search_button.setText("Aranıyor...")
         
         # Worker object pattern (PyQt6 best practice)
         self.search_thread = QThread()
-        self.search_worker = SearchWorker(api_type, query)
+        self.search_worker = SearchWorker(api_type, query, page=0, page_size=self.page_size)
+        self.search_worker.generation = self.search_generation
         self.search_worker.moveToThread(self.search_thread)
         
         # Bağlantılar
@@ -199,7 +339,8 @@ class PluginSearchTab(QWidget, IconCacheMixin):
         self.search_worker.finished.connect(self.search_worker.deleteLater)
         self.search_thread.finished.connect(self.search_thread.deleteLater)
         
-        self.search_worker.results_ready.connect(self.display_results)
+        self.search_worker.results_ready.connect(self.on_results_ready)
+        self.search_worker.page_ready.connect(self.on_page_ready)
         self.search_worker.error_occurred.connect(self.handle_error)
         self.search_worker.finished.connect(self.search_finished)
         
@@ -217,6 +358,104 @@ class PluginSearchTab(QWidget, IconCacheMixin):
             except RuntimeError:
                 # Thread zaten silinmiş, sorun değil
                 pass
+        
+        # Sayfa ön yükleme thread'leri
+        for thread in list(self.page_threads):
+            try:
+                if thread.isRunning():
+                    thread.quit()
+                    thread.wait(5000)
+            except RuntimeError:
+                pass
+    
+    def on_results_ready(self, results):
+        """Sadece güncel aramanın (kısmi veya tam) sonuçlarını göster"""
+        if self.sender() is not self.search_worker:
+            return
+        self.display_results(results)
+    
+    def on_page_ready(self, page, results, remaining_sources):
+        """Tamamlanan sayfayı göster ya da bir sonraki kaydırma için sakla"""
+        if getattr(self.sender(), 'generation', None) != self.search_generation:
+            return
+        
+        if page == 0:
+            self.display_results(results)
+            self.loaded_pages = 1
+            self.remaining_sources = remaining_sources
+            # Bir sayfa ileriden al
+            self.prefetch_next_page()
+            return
+        
+        self.page_loading = False
+        self.prefetched_page = (page, results, remaining_sources)
+        if self.append_requested or self.is_near_bottom():
+            self.show_prefetched_page()
+    
+    def on_page_error(self, error_msg):
+        """Sonraki sayfa alınamadığında sessizce durdur (kaydırınca yeniden denenir)"""
+        if getattr(self.sender(), 'generation', None) != self.search_generation:
+            return
+        print(f"Sonraki sayfa alınamadı: {error_msg}")
+        self.page_loading = False
+        self.append_requested = False
+    
+    def prefetch_next_page(self):
+        """Sonraki sayfayı arka planda, kullanıcı ulaşmadan önce al"""
+        if self.page_loading or self.prefetched_page is not None or not self.remaining_sources:
+            return
+        
+        self.page_loading = True
+        thread = QThread()
+        worker = SearchWorker(self.search_api_type, self.search_query, page=self.loaded_pages,
+                              page_size=self.page_size, sources=self.remaining_sources)
+        worker.generation = self.search_generation
+        worker.moveToThread(thread)
+        
+        # İlk sayfadaki worker object pattern'i ile aynı bağlantılar
+        thread.started.connect(worker.do_work)
+        worker.finished.connect(thread.quit)
+        worker.finished.connect(worker.deleteLater)
+        thread.finished.connect(lambda thread=thread: self.page_threads.pop(thread, None))
+        thread.finished.connect(thread.deleteLater)
+        
+        worker.page_ready.connect(self.on_page_ready)
+        worker.error_occurred.connect(self.on_page_error)
+        
+        self.page_threads[thread] = worker
+        thread.start()
+    
+    def show_prefetched_page(self):
+        """Önceden alınan sayfayı tabloya ekle ve bir sonrakini iste"""
+        if self.prefetched_page is None:
+            return
+        page, results, remaining_sources = self.prefetched_page
+        self.prefetched_page = None
+        self.append_requested = False
+        
+        self.results_model.append_results(results)
+        self.loaded_pages = page + 1
+        self.remaining_sources = remaining_sources
+        self.prefetch_next_page()
+    
+    def is_near_bottom(self):
+        """Tablo sonuna yaklaşıldı mı (kaydırma yoksa her zaman evet)"""
+        scroll_bar = self.results_table.verticalScrollBar()
+        return scroll_bar.maximum() - scroll_bar.value() <= scroll_bar.pageStep() // 2
+    
+    def on_results_scrolled(self, value):
+        """Kaydırma alta yaklaştığında sonraki sayfayı göster"""
+        if not self.is_near_bottom():
+            return
+        if self.prefetched_page is not None:
+            self.show_prefetched_page()
+        elif self.page_loading:
+            # Sayfa gelir gelmez eklensin
+            self.append_requested = True
+        elif self.remaining_sources:
+            # Önceki deneme hata aldıysa sayfayı yeniden iste
+            self.append_requested = True
+            self.prefetch_next_page()
     
     def search_finished(self):
         """Arama tamamlandığında çağrılır"""
@@ -224,106 +463,42 @@ class PluginSearchTab(QWidget, IconCacheMixin):
         self.search_button.setText("Ara")
         
     def display_results(self, results):
-        self.results_table.setRowCount(len(results))
-        self.current_results = results  # Sonuçları sakla
-        
-        for row, plugin in enumerate(results):
-            # API kaynağını belirle
-            api_source = plugin.get('_api_source', self.api_combo.currentText())
-            
-            if api_source == "Modrinth":
-                name = plugin.get('title', 'N/A')
-                description = plugin.get('description', 'N/A')
-                author = plugin.get('author', 'N/A')
-                downloads = plugin.get('downloads', 0)
-                icon_url = plugin.get('icon_url', '')
-                plugin_id = plugin.get('project_id') or plugin.get('slug', '')
-                    
-            else:  # Spigot
-                name = plugin.get('name', 'N/A')
-                description = plugin.get('tag', 'N/A')
-                
-                # Yazar bilgisini güvenli şekilde al
-                author_info = plugin.get('author')
-                if isinstance(author_info, dict):
-                    author = author_info.get('username', author_info.get('name', 'Bilinmeyen'))
-                elif isinstance(author_info, str):
-                    author = author_info
-                else:
-                    # Debug için author bilgisini yazdır
-                    print(f"Plugin: {name}, Author data: {author_info}, Type: {type(author_info)}")
-                    author = 'Bilinmeyen'
-                downloads = plugin.get('downloads', 0)
-                
-                # Spigot ikon URL'sini oluştur
-                icon_data = plugin.get('icon', {})
-                icon_url = ''
-                
-                if icon_data:
-                    try:
-                        if isinstance(icon_data, dict) and 'url' in icon_data:
-                            url = icon_data['url']
-                            if url.startswith('http'):
-                                icon_url = url
-                            elif url.startswith('/'):
-                                icon_url = f"https://www.spigotmc.org{url}"
-                            else:
-                                icon_url = f"https://www.spigotmc.org/{url}"
-                    except:
-                        pass
-                
-                # Spigot için şimdilik varsayılan ikon kullan (API karmaşık)
-                # Gelecekte daha detaylı ikon desteği eklenebilir
-                if not icon_url:
-                    icon_url = ''  # Varsayılan S ikonu kullanılacak
-                    
-                plugin_id = str(plugin.get('id', ''))
-            
-            # Seçim checkbox'ı
-            from PyQt6.QtWidgets import QCheckBox
-            checkbox = QCheckBox()
-            
-            # Önceki seçimi koru
-            plugin_key = f"{api_source}:{plugin_id}"
-            if plugin_key in self.selected_plugins:
-                checkbox.setChecked(True)
-            
-            checkbox.stateChanged.connect(lambda state, key=plugin_key: self.handle_selection_change(state, key))
-            self.results_table.setCellWidget(row, 0, checkbox)
-            
-            # İkon
-            icon_label = IconManager.create_cached_icon(icon_url, api_source, self.icon_cache, self.download_icon_async)
-            self.results_table.setCellWidget(row, 1, icon_label)
-            
-            self.results_table.setItem(row, 2, QTableWidgetItem(name))
-            self.results_table.setItem(row, 3, QTableWidgetItem(description))
-            self.results_table.setItem(row, 4, QTableWidgetItem(author))
-            self.results_table.setItem(row, 5, QTableWidgetItem(api_source))
-            self.results_table.setItem(row, 6, QTableWidgetItem(str(downloads)))
-            
-            # İndir ve Git butonları
-            button_widget = QWidget()
-            button_layout = QHBoxLayout(button_widget)
-            button_layout.setContentsMargins(2, 2, 2, 2)
-            
-            download_btn = QPushButton("İndir")
-            download_btn.setStyleSheet("QPushButton { background-color: #4CAF50; color: white; padding: 4px 8px; }")
-            download_btn.clicked.connect(lambda checked, p=plugin: self.download_plugin(p))
-            button_layout.addWidget(download_btn)
-            
-            git_btn = QPushButton("Git")
-            git_btn.setStyleSheet("QPushButton { background-color: #2196F3; color: white; padding: 4px 8px; }")
-            git_btn.clicked.connect(lambda checked, p=plugin: self.open_plugin_website(p))
-            button_layout.addWidget(git_btn)
-            
-            self.results_table.setCellWidget(row, 7, button_widget)
+        self.results_model.default_api = self.api_combo.currentText()
+        self.results_model.set_results(results)
         
         # Buton durumu search_finished'da ayarlanacak
         
+    def on_settings_changed(self, changed, settings):
+        """Gösterilen sonuçları sadece ilgili ayar değiştiyse yeniden sırala/filtrele"""
+        if not {'api_priority', 'show_premium_plugins'} & changed:
+            return
+        
+        results = self.results_model.results()
+        if not results:
+            return
+        
+        if 'show_premium_plugins' in changed and not settings.get('show_premium_plugins', False):
+            results = [plugin for plugin in results if not plugin.get('premium')]
+        if 'api_priority' in changed:
+            results = PluginSorter.sort_by_api_priority(results, api_key='_api_source')
+        self.results_model.set_results(results)
+        
     def handle_error(self, error_msg):
         QMessageBox.critical(self, "Hata", f"Arama hatası: {error_msg}")
         # Buton durumu search_finished'da ayarlanacak
         
+    def download_plugin_at(self, row):
+        """Satırdaki İndir butonuna basıldığında"""
+        plugin = self.results_model.plugin_at(row)
+        if plugin is not None:
+            self.download_plugin(plugin)
+    
+    def open_plugin_website_at(self, row):
+        """Satırdaki Git butonuna basıldığında"""
+        plugin = self.results_model.plugin_at(row)
+        if plugin is not None:
+            self.open_plugin_website(plugin)
+    
     def download_plugin(self, plugin):
         api_source = plugin.get('_api_source', self.api_combo.currentText())
         dialog = DownloadDialog(plugin, api_source, self)
@@ -361,25 +536,16 @@ class PluginSearchTab(QWidget, IconCacheMixin):
   
     def select_all_results(self):
         """Tüm sonuçları seç"""
-        for row in range(self.results_table.rowCount()):
-            checkbox = self.results_table.cellWidget(row, 0)
-            if checkbox:
-                checkbox.setChecked(True)
+        self.results_model.set_all_checked(True)
     
     def deselect_all_results(self):
         """Tüm seçimleri kaldır"""
-        for row in range(self.results_table.rowCount()):
-            checkbox = self.results_table.cellWidget(row, 0)
-            if checkbox:
-                checkbox.setChecked(False)
+        self.results_model.set_all_checked(False)
     
-    def update_multi_download_button(self):
+    def update_multi_download_button(self, selected_count=None):
         """Çoklu indirme butonunu güncelle"""
-        selected_count = 0
-        for row in range(self.results_table.rowCount()):
-            checkbox = self.results_table.cellWidget(row, 0)
-            if checkbox and checkbox.isChecked():
-                selected_count += 1
+        if selected_count is None:
+            selected_count = self.results_model.selected_count()
         
         self.multi_download_btn.setEnabled(selected_count > 0)
         if selected_count > 0:
@@ -392,31 +558,28 @@ class PluginSearchTab(QWidget, IconCacheMixin):
         try:
             selected_plugins = []
             
-            for row in range(self.results_table.rowCount()):
-                checkbox = self.results_table.cellWidget(row, 0)
-                if checkbox and checkbox.isChecked():
-                    plugin = self.current_results[row]
-                    api_source = plugin.get('_api_source', self.api_combo.currentText())
-                    
-                    # Plugin için en son versiyonu al
-                    if api_source == "Modrinth":
-                        from ..api.modrinth_api import ModrinthAPI
-                        api = ModrinthAPI()
-                        plugin_id = plugin.get('project_id') or plugin.get('slug')
-                        versions = api.get_plugin_versions(plugin_id)
-                    else:
-                        from ..api.spigot_api import SpigotAPI
-                        api = SpigotAPI()
-                        plugin_id = plugin.get('id')
-                        versions = api.get_plugin_versions(plugin_id)
-                    
-                    if versions:
-                        latest_version = versions[0]  # İlk versiyon genellikle en son
-                        selected_plugins.append({
-                            'plugin': plugin,
-                            'version': latest_version,
-                            'api': api_source
-                        })
+            for plugin in self.results_model.selected_plugins():
+                api_source = plugin.get('_api_source', self.api_combo.currentText())
+                
+                # Plugin için en son versiyonu al
+                if api_source == "Modrinth":
+                    from ..api.modrinth_api import ModrinthAPI
+                    api = ModrinthAPI()
+                    plugin_id = plugin.get('project_id') or plugin.get('slug')
+                    versions = api.get_plugin_versions(plugin_id)
+                else:
+                    from ..api.spigot_api import SpigotAPI
+                    api = SpigotAPI()
+                    plugin_id = plugin.get('id')
+                    versions = api.get_plugin_versions(plugin_id)
+                
+                if versions:
+                    latest_version = versions[0]  # İlk versiyon genellikle en son
+                    selected_plugins.append({
+                        'plugin': plugin,
+                        'version': latest_version,
+                        'api': api_source
+                    })
             
             if not selected_plugins:
                 QMessageBox.warning(self, "Uyarı", "Seçili plugin bulunamadı!")
@@ -433,58 +596,30 @@ class PluginSearchTab(QWidget, IconCacheMixin):
    
 
     
-    def handle_selection_change(self, state, plugin_key):
-        """Seçim değişikliğini işle"""
-        if state == 2:  # Checked
-            self.selected_plugins.add(plugin_key)
-        else:  # Unchecked
-            self.selected_plugins.discard(plugin_key)
-        
-        self.update_multi_download_button()
-    
     def remove_plugin_from_results(self, row):
-        """Plugin'i sonuçlardan çıkar"""
-        if row < len(self.current_results):
-            # Seçimden de çıkar
-            plugin = self.current_results[row]
-            api_source = plugin.get('_api_source', self.api_combo.currentText())
-            
-            if api_source == "Modrinth":
-                plugin_id = plugin.get('project_id') or plugin.get('slug', '')
-            else:
-                plugin_id = str(plugin.get('id', ''))
-            
-            plugin_key = f"{api_source}:{plugin_id}"
-            self.selected_plugins.discard(plugin_key)
-            
-            # Listeden çıkar
-            self.current_results.pop(row)
-            
-            # Tabloyu yeniden oluştur
-            self.display_results(self.current_results)    
+        """Plugin'i sonuçlardan ve seçimden çıkar (sadece o satır kaldırılır)"""
+        self.results_model.remove_row(row)
    
     def show_context_menu(self, position):
         """Sağ tık menüsünü göster"""
         if not self.lists_tab:
             return
             
-        item = self.results_table.itemAt(position)
-        if item is None:
+        index = self.results_table.indexAt(position)
+        if not index.isValid():
             return
         
-        row = item.row()
-        if row >= len(self.current_results):
+        plugin = self.results_model.plugin_at(index.row())
+        if plugin is None:
             return
         
-        plugin = self.current_results[row]
-        
         from PyQt6.QtWidgets import QMenu
         menu = QMenu(self)
         
         add_to_list_action = menu.addAction("Listeye Ekle")
         add_to_list_action.triggered.connect(lambda: self.add_plugin_to_list(plugin))
         
-        menu.exec(self.results_table.mapToGlobal(position))
+        menu.exec(self.results_table.viewport().mapToGlobal(position))
     
 
     
@@ -6,156 +6,117 @@ from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                             QPushButton, QProgressBar, QTableWidget, QTableWidgetItem,
                             QHeaderView, QCheckBox, QMessageBox, QFileDialog, QComboBox)
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
-import asyncio
 import os
 from datetime import datetime
 
 from ..api.modrinth_api import ModrinthAPI
 from ..api.spigot_api import SpigotAPI
+from ..api.jar_store import JarStore
+from ..utils import DownloadHistory
+from .multi_download_dialog import MultiDownloadWorker
 
-class RedownloadWorker(QThread):
-    progress_updated = pyqtSignal(int, int)  # current, total
-    item_progress_updated = pyqtSignal(int, int)  # row, progress
-    download_finished = pyqtSignal(bool, str, int)  # success, message, row
-    all_finished = pyqtSignal()
+class RedownloadVersionWorker(QThread):
+    """
+    Kayıtların sürümlerini arka planda yükler (jar hash'leme ve API istekleri
+    arayüzü dondurmasın). Her kayıt için versions_loaded(satır, sürümler,
+    plugin ID) yayınlanır; Modrinth kayıtları toplu istekle yüklenir.
+    """
+    versions_loaded = pyqtSignal(int, list, object)  # row, versions, plugin_id
     
-    def __init__(self, download_items, download_folder):
+    def __init__(self, download_records, modrinth_version_count):
         super().__init__()
-        self.download_items = download_items
-        self.download_folder = download_folder
-        self.cancelled = False
-        
+        self.download_records = download_records
+        self.modrinth_version_count = modrinth_version_count
+    
     def run(self):
         try:
-            # Windows için event loop policy ayarla
-            if hasattr(asyncio, 'WindowsProactorEventLoopPolicy'):
-                asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
-            
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            try:
-                total_items = len(self.download_items)
-                completed = 0
-                
-                for row, item in enumerate(self.download_items):
-                    if self.cancelled:
-                        break
-                        
-                    try:
-                        success = loop.run_until_complete(self.redownload_single_item(item, row))
-                        completed += 1
-                        
-                        plugin_name = item.get('name', 'Unknown')
-                        self.download_finished.emit(success, plugin_name, row)
-                        self.progress_updated.emit(completed, total_items)
-                    except Exception as e:
-                        print(f"Öğe yeniden indirme hatası: {e}")
-                        self.download_finished.emit(False, str(e), row)
-                        completed += 1
-                        self.progress_updated.emit(completed, total_items)
-                
-                self.all_finished.emit()
-                
-            finally:
-                # Loop'u güvenli şekilde kapat
-                try:
-                    pending = asyncio.all_tasks(loop)
-                    for task in pending:
-                        task.cancel()
-                    if pending:
-                        loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
-                except:
-                    pass
-                finally:
-                    loop.close()
-            
+            modrinth_ids = self.resolve_modrinth_projects()
         except Exception as e:
-            print(f"Redownload worker thread hatası: {e}")
-            self.download_finished.emit(False, str(e), -1)
-    
-    async def redownload_single_item(self, item, row):
-        try:
-            if self.cancelled:
-                return False
-                
-            plugin_name = item.get('name', '')
-            api_type = item.get('api', 'Modrinth')
-            selected_version = item.get('selected_version')
-            
-            def progress_callback(progress):
-                if not self.cancelled:
-                    self.item_progress_updated.emit(row, progress)
-            
-            # Dosya adını oluştur
-            if selected_version:
-                if api_type == "Modrinth":
-                    file_name = selected_version.get('files', [{}])[0].get('filename', f"{plugin_name}.jar")
-                else:
-                    file_name = f"{plugin_name}.jar"
-            else:
-                file_name = f"{plugin_name}.jar"
-            
-            download_path = os.path.join(self.download_folder, file_name)
-            
-            # İndirme klasörünü oluştur
-            os.makedirs(os.path.dirname(download_path), exist_ok=True)
-            
-            api = None
-            spigot_api = None
+            print(f"Modrinth projeleri bulunamadı: {e}")
+            modrinth_ids = {}
+        modrinth_versions = {}
+        if modrinth_ids and not self.isInterruptionRequested():
             try:
-                if api_type == "Modrinth" and selected_version:
-                    api = ModrinthAPI()
-                    download_url = selected_version.get('files', [{}])[0].get('url')
-                    if download_url:
-                        success = await api.download_plugin(download_url, download_path, progress_callback)
-                    else:
-                        success = False
-                elif api_type == "Spigot" and selected_version:
-                    api = SpigotAPI()
-                    # Spigot için plugin ID'sini bul
-                    spigot_api = SpigotAPI()
-                    search_results = spigot_api.search_plugins(plugin_name, size=5)
-                    if search_results:
-                        plugin_id = search_results[0].get('id')
-                        version_id = selected_version.get('id')
-                        success = await api.download_plugin(plugin_id, version_id, download_path, progress_callback)
-                    else:
-                        success = False
+                modrinth_versions = ModrinthAPI().get_recent_versions(
+                    list(set(modrinth_ids.values())), count=self.modrinth_version_count
+                )
+            except Exception as e:
+                print(f"Toplu sürüm yükleme hatası: {e}")
+        
+        for row, record in enumerate(self.download_records):
+            if self.isInterruptionRequested():
+                return
+            plugin_name = record.get('name', '')
+            try:
+                if record.get('api', 'Modrinth') == "Modrinth":
+                    plugin_id = modrinth_ids.get(row)
+                    self.versions_loaded.emit(row, modrinth_versions.get(plugin_id, []), plugin_id)
                 else:
-                    success = False
-                
-                return success
-            finally:
-                # API session'larını kapat
-                if api:
-                    try:
-                        await api.close_aio_session()
-                    except:
-                        pass
-                if spigot_api:
-                    try:
-                        await spigot_api.close_aio_session()
-                    except:
-                        pass
-            
-        except asyncio.CancelledError:
-            print("Yeniden indirme iptal edildi")
-            return False
-        except Exception as e:
-            print(f"Yeniden indirme hatası: {e}")
-            return False
+                    api = SpigotAPI()
+                    plugin_id = record.get('plugin_id')
+                    if not plugin_id:
+                        # Eski kayıtlarda ID yok: Spigot'ta plugin ara
+                        search_results = api.search_plugins(plugin_name, size=5)
+                        plugin_id = search_results[0].get('id') if search_results else None
+                    versions = api.get_plugin_versions(plugin_id, size=20) if plugin_id else []
+                    self.versions_loaded.emit(row, versions, plugin_id)
+                        
+            except Exception as e:
+                print(f"Sürüm yükleme hatası ({plugin_name}): {e}")
+                self.versions_loaded.emit(row, [], None)
     
-    def cancel(self):
-        self.cancelled = True
+    def resolve_modrinth_projects(self):
+        """
+        Modrinth kayıtlarının proje ID'lerini bul (satır -> proje ID)
+        
+        ID'si kayıtta saklananlar doğrudan kullanılır. Eski kayıtlarda diskte
+        duran dosyalar hash'leriyle tek istekte eşlenir; dosyası olmayan veya
+        eşleşmeyen kayıtlar için isimle arama yapılır.
+        """
+        api = ModrinthAPI()
+        project_ids = {}
+        record_hashes = {}
+        for row, record in enumerate(self.download_records):
+            if record.get('api', 'Modrinth') != "Modrinth":
+                continue
+            if record.get('plugin_id'):
+                project_ids[row] = record['plugin_id']
+                continue
+            path = record.get('path', '')
+            if path and os.path.isfile(path):
+                try:
+                    record_hashes[row] = JarStore.hash_file(path)['sha1']
+                except OSError as e:
+                    print(f"Hash hesaplanamadı ({path}): {e}")
+        
+        hash_matches = api.get_versions_by_hashes(list(record_hashes.values())) if record_hashes else {}
+        
+        for row, record in enumerate(self.download_records):
+            if record.get('api', 'Modrinth') != "Modrinth" or row in project_ids:
+                continue
+            version = hash_matches.get(record_hashes.get(row))
+            if version and version.get('project_id'):
+                project_ids[row] = version['project_id']
+                continue
+            
+            # Hash eşleşmedi: Modrinth'te plugin ara
+            search_results = api.search_plugins(record.get('name', ''), limit=5)
+            if search_results:
+                plugin = search_results[0]
+                project_ids[row] = plugin.get('project_id') or plugin.get('slug')
+        return project_ids
 
 class RedownloadDialog(QDialog):
+    MODRINTH_VERSION_COUNT = 100  # Toplu istekte proje başına alınan en yeni sürüm sayısı
+    
     def __init__(self, download_records, parent=None):
         super().__init__(parent)
         self.download_records = download_records
         self.download_manager = None
         self.download_worker = None
+        self.version_worker = None
         self.plugin_versions = {}  # Plugin sürümlerini sakla
+        self.plugin_ids = {}  # satır -> çözülen plugin ID (yeniden indirmede kullanılır)
         self.init_ui()
         self.load_plugin_versions()
         
@@ -259,39 +220,59 @@ class RedownloadDialog(QDialog):
             self.plugins_table.setItem(row, 5, QTableWidgetItem("Bekliyor"))
     
     def load_plugin_versions(self):
-        """Tüm pluginler için sürümleri yükle"""
-        for row, record in enumerate(self.download_records):
-            try:
-                plugin_name = record.get('name', '')
-                api_type = record.get('api', 'Modrinth')
-                
-                if api_type == "Modrinth":
-                    # Modrinth'te plugin ara
-                    api = ModrinthAPI()
-                    search_results = api.search_plugins(plugin_name, limit=5)
-                    if search_results:
-                        plugin = search_results[0]
-                        plugin_id = plugin.get('project_id') or plugin.get('slug')
-                        versions = api.get_plugin_versions(plugin_id, limit=200)
-                        self.update_version_combo(row, versions, api_type)
-                else:
-                    # Spigot'ta plugin ara
-                    api = SpigotAPI()
-                    search_results = api.search_plugins(plugin_name, size=5)
-                    if search_results:
-                        plugin = search_results[0]
-                        plugin_id = plugin.get('id')
-                        versions = api.get_plugin_versions(plugin_id, size=20)
-                        self.update_version_combo(row, versions, api_type)
-                        
-            except Exception as e:
-                print(f"Sürüm yükleme hatası ({plugin_name}): {e}")
-                self.update_version_combo(row, [], api_type)
+        """Sürümleri arka planda yükle; combo'lar sonuçlar geldikçe doldurulur"""
+        self.download_btn.setEnabled(False)
+        self.version_worker = RedownloadVersionWorker(self.download_records, self.MODRINTH_VERSION_COUNT)
+        self.version_worker.versions_loaded.connect(self.plugin_versions_loaded)
+        self.version_worker.finished.connect(self.plugin_versions_finished)
+        self.version_worker.start()
+    
+    def plugin_versions_loaded(self, row, versions, plugin_id):
+        """Bir kaydın sürümleri yüklendiğinde"""
+        if plugin_id:
+            self.plugin_ids[row] = plugin_id
+        self.update_version_combo(row, versions, self.download_records[row].get('api', 'Modrinth'))
+    
+    def plugin_versions_finished(self):
+        """Tüm sürümler yüklendiğinde indirmeye izin ver"""
+        if self.download_worker is None:
+            self.download_btn.setEnabled(True)
+    
+    @staticmethod
+    def stored_version(record):
+        """
+        Kayıtta saklanan kaynak bilgisinden sürüm oluştur (sürüm listesi alınamazsa)
+        
+        Modrinth kayıtları saklanan dosya adresinden, Spigot kayıtları plugin ve
+        sürüm ID'lerinden doğrudan indirilir.
+        """
+        api_type = record.get('api', 'Modrinth')
+        version_name = record.get('version', 'N/A')
+        if api_type == "Modrinth":
+            if not record.get('file_url'):
+                return None
+            file_name = os.path.basename(record.get('path', '')) or f"{record.get('name', 'plugin')}.jar"
+            return {
+                'id': record.get('version_id'),
+                'version_number': version_name,
+                'files': [{'url': record['file_url'], 'filename': file_name}]
+            }
+        if record.get('plugin_id') and record.get('version_id'):
+            return {'id': record['version_id'], 'name': version_name}
+        return None
     
     def update_version_combo(self, row, versions, api_type):
-        """Sürüm combo'sunu güncelle"""
+        """Sürüm combo'sunu güncelle; kayıtta saklanan sürüm seçili gelir"""
         version_combo = self.plugins_table.cellWidget(row, 3)
         version_combo.clear()
+        record = self.download_records[row]
+        
+        if not versions:
+            stored = self.stored_version(record)
+            if stored:
+                version_name = stored.get('version_number') or stored.get('name', 'N/A')
+                version_combo.addItem(f"{version_name} (kayıtlı dosya)", stored)
+                return
         
         if versions:
             for version in versions:
@@ -308,8 +289,15 @@ class RedownloadDialog(QDialog):
                 
                 version_combo.addItem(display_name, version)
             
-            # İlk sürümü seç
-            version_combo.setCurrentIndex(0)
+            # Kayıttaki sürümü seç; listede yoksa en yenisini
+            recorded_id = str(record.get('version_id') or '')
+            selected_index = 0
+            if recorded_id:
+                for index, version in enumerate(versions):
+                    if str(version.get('id', '')) == recorded_id:
+                        selected_index = index
+                        break
+            version_combo.setCurrentIndex(selected_index)
         else:
             version_combo.addItem("Sürüm bulunamadı", None)
     
@@ -343,10 +331,7 @@ class RedownloadDialog(QDialog):
                 selected_version = version_combo.currentData()
                 
                 if selected_version:
-                    # Orijinal record'u kopyala ve sürümü ekle
-                    item_data = self.download_records[row].copy()
-                    item_data['selected_version'] = selected_version
-                    selected_items.append(item_data)
+                    selected_items.append(self.download_item(row, selected_version))
         
         if not selected_items:
             QMessageBox.warning(self, "Uyarı", "Lütfen en az bir plugin seçin!")
@@ -364,14 +349,30 @@ class RedownloadDialog(QDialog):
                 self.plugins_table.setItem(row, 5, QTableWidgetItem("İndiriliyor"))
         
         # Worker thread başlat
-        self.download_worker = RedownloadWorker(selected_items, self.folder_input.text())
+        self.download_worker = MultiDownloadWorker(selected_items, self.folder_input.text())
         self.download_worker.progress_updated.connect(self.update_overall_progress)
+        self.download_worker.item_progress_updated.connect(self.update_item_progress)
         self.download_worker.download_finished.connect(self.item_download_finished)
         self.download_worker.all_finished.connect(self.all_downloads_finished)
         self.download_worker.start()
     
+    def download_item(self, row, selected_version):
+        """Kaydı çoklu indirme öğesine çevir (plugin ID kayıttan veya sürüm yüklemesinden gelir)"""
+        record = self.download_records[row]
+        api_type = record.get('api', 'Modrinth')
+        plugin_name = record.get('name', '')
+        plugin_id = self.plugin_ids.get(row, record.get('plugin_id'))
+        if api_type == "Modrinth":
+            plugin = {'title': plugin_name, 'project_id': plugin_id}
+        else:
+            plugin = {'name': plugin_name, 'id': plugin_id}
+        return {'plugin': plugin, 'version': selected_version, 'api': api_type, 'row': row}
+    
     def cancel_downloads(self):
         """İndirmeleri iptal et"""
+        if self.version_worker and self.version_worker.isRunning():
+            self.version_worker.requestInterruption()
+            self.version_worker.wait()
         if self.download_worker and self.download_worker.isRunning():
             self.download_worker.cancel()
             self.download_worker.wait()
@@ -381,6 +382,10 @@ class RedownloadDialog(QDialog):
         """Genel ilerlemeyi güncelle"""
         self.overall_progress.setValue(current)
     
+    def update_item_progress(self, row, progress):
+        """Öğe ilerlemesini durum sütununda göster"""
+        self.plugins_table.setItem(row, 5, QTableWidgetItem(f"İndiriliyor (%{progress})"))
+    
     def item_download_finished(self, success, name, row):
         """Öğe indirme tamamlandı"""
         if success:
@@ -401,8 +406,18 @@ class RedownloadDialog(QDialog):
                     else:
                         version_name = selected_version.get('name', 'N/A')
                     
-                    file_path = os.path.join(self.folder_input.text(), f"{plugin_name}.jar")
-                    self.download_manager.add_download(plugin_name, version_name, api_type, file_path)
+                    # Worker'ın dosyayı gerçekten yazdığı yol (Modrinth dosya adını sürümden alır)
+                    file_path = self.download_worker.download_paths.get(
+                        row, os.path.join(self.folder_input.text(), f"{plugin_name}.jar")
+                    )
+                    source = DownloadHistory.source_fields(
+                        api_type, self.plugin_ids.get(row, record.get('plugin_id')), selected_version
+                    )
+                    self.download_manager.add_download(
+                        plugin_name, version_name, api_type, file_path,
+                        journal_key=self.download_worker.journal_keys.get(row),
+                        **source
+                    )
         else:
             self.plugins_table.setItem(row, 5, QTableWidgetItem("Başarısız"))
     
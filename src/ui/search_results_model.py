@@ -0,0 +1,379 @@
+"""
+Arama sonuçları için model ve delegate'ler
+"""
+
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyle
+from PyQt6.QtGui import QPixmap, QPainter, QColor, QPen, QFont
+from PyQt6.QtCore import (Qt, QAbstractTableModel, QModelIndex, QRect, QEvent,
+                          pyqtSignal)
+
+from ..utils import IconFetchService
+
+class SearchResultsModel(QAbstractTableModel):
+    """
+    Arama sonuçlarını tutan tablo modeli.
+
+    Hücre widget'ı oluşturmaz; checkbox, ikon ve butonlar delegate'ler tarafından
+    çizilir. İkonlar sadece görünen satırlar için istenir.
+    """
+
+    COLUMN_CHECK = 0
+    COLUMN_ICON = 1
+    COLUMN_NAME = 2
+    COLUMN_DESCRIPTION = 3
+    COLUMN_AUTHOR = 4
+    COLUMN_API = 5
+    COLUMN_DOWNLOADS = 6
+    COLUMN_ACTIONS = 7
+
+    HEADERS = ["Seç", "İkon", "Ad", "Açıklama", "Yazar", "API", "İndirme", "Aksiyon"]
+
+    ICON_SIZE = 46
+    MAX_SCALED_ICONS = 1000  # Bellekte tutulan ölçeklenmiş ikon sayısı
+
+    selection_changed = pyqtSignal(int)  # Seçili plugin sayısı
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows = []  # Normalleştirilmiş satır bilgileri
+        self.selected_keys = set()  # "api:id" anahtarları, aramalar arasında korunur
+        self.icon_cache = None
+        self.default_api = "Modrinth"
+
+        self._scaled_icons = {}  # URL -> ölçeklenmiş QPixmap
+        self._placeholders = {}  # API -> varsayılan ikon
+        self._requested_icons = set()
+        self._failed_icons = set()
+
+        IconFetchService.shared().icon_ready.connect(self.on_icon_fetched)
+
+    def set_icon_cache(self, icon_cache):
+        """İkon cache referansını ayarla"""
+        self.icon_cache = icon_cache
+
+    # Satır verisi
+
+    def make_row(self, plugin):
+        """Plugin verisinden tabloda gösterilecek alanları bir kez hesapla"""
+        api_source = plugin.get('_api_source', self.default_api)
+
+        if api_source == "Modrinth":
+            name = plugin.get('title', 'N/A')
+            description = plugin.get('description', 'N/A')
+            author = plugin.get('author', 'N/A')
+            icon_url = plugin.get('icon_url', '') or ''
+            plugin_id = plugin.get('project_id') or plugin.get('slug', '')
+        else:  # Spigot
+            name = plugin.get('name', 'N/A')
+            description = plugin.get('tag', 'N/A')
+
+            # Yazar bilgisini güvenli şekilde al
+            author_info = plugin.get('author')
+            if isinstance(author_info, dict):
+                author = author_info.get('username', author_info.get('name', 'Bilinmeyen'))
+            elif isinstance(author_info, str):
+                author = author_info
+            else:
+                author = 'Bilinmeyen'
+
+            # Spigot ikon URL'sini oluştur
+            icon_url = ''
+            icon_data = plugin.get('icon', {})
+            if isinstance(icon_data, dict) and icon_data.get('url'):
+                url = icon_data['url']
+                if url.startswith('http'):
+                    icon_url = url
+                elif url.startswith('/'):
+                    icon_url = f"https://www.spigotmc.org{url}"
+                else:
+                    icon_url = f"https://www.spigotmc.org/{url}"
+
+            plugin_id = str(plugin.get('id', ''))
+
+        return {
+            'plugin': plugin,
+            'api': api_source,
+            'key': f"{api_source}:{plugin_id}",
+            'name': name,
+            'description': description,
+            'author': author,
+            'downloads': str(plugin.get('downloads', 0)),
+            'icon_url': icon_url
+        }
+
+    def set_results(self, results):
+        """Tüm sonuçları değiştir"""
+        self.beginResetModel()
+        self.rows = [self.make_row(plugin) for plugin in results]
+        self.endResetModel()
+        self.selection_changed.emit(self.selected_count())
+
+    def append_results(self, results):
+        """Mevcut sonuçların sonuna yeni satırlar ekle"""
+        # Sayfalar arasında kayan sonuçlar iki kez gösterilmesin
+        existing_keys = {row['key'] for row in self.rows}
+        new_rows = []
+        for plugin in results:
+            row = self.make_row(plugin)
+            if row['key'] not in existing_keys:
+                existing_keys.add(row['key'])
+                new_rows.append(row)
+        if not new_rows:
+            return
+        first = len(self.rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(new_rows) - 1)
+        self.rows.extend(new_rows)
+        self.endInsertRows()
+        self.selection_changed.emit(self.selected_count())
+
+    def remove_row(self, row):
+        """Satırı sonuçlardan ve seçimden çıkar"""
+        if not 0 <= row < len(self.rows):
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        removed = self.rows.pop(row)
+        self.endRemoveRows()
+        self.selected_keys.discard(removed['key'])
+        self.selection_changed.emit(self.selected_count())
+
+    def plugin_at(self, row):
+        """Satırdaki ham plugin verisini döndür"""
+        if 0 <= row < len(self.rows):
+            return self.rows[row]['plugin']
+        return None
+
+    def results(self):
+        """Gösterilen tüm plugin verileri"""
+        return [row['plugin'] for row in self.rows]
+
+    # Seçim
+
+    def selected_count(self):
+        return sum(1 for row in self.rows if row['key'] in self.selected_keys)
+
+    def selected_plugins(self):
+        """Seçili satırların plugin verileri"""
+        return [row['plugin'] for row in self.rows if row['key'] in self.selected_keys]
+
+    def set_all_checked(self, checked):
+        """Tüm satırları seç veya seçimi kaldır"""
+        for row in self.rows:
+            if checked:
+                self.selected_keys.add(row['key'])
+            else:
+                self.selected_keys.discard(row['key'])
+        if self.rows:
+            self.dataChanged.emit(
+                self.index(0, self.COLUMN_CHECK),
+                self.index(len(self.rows) - 1, self.COLUMN_CHECK),
+                [Qt.ItemDataRole.CheckStateRole]
+            )
+        self.selection_changed.emit(self.selected_count())
+
+    # İkonlar
+
+    def placeholder_icon(self, api_source):
+        """API'ye göre harfli varsayılan ikon"""
+        if api_source not in self._placeholders:
+            colors = {"Modrinth": ("M", "#1bd96a"), "Spigot": ("S", "#f4a261")}
+            letter, color = colors.get(api_source, ("?", "#cccccc"))
+
+            pixmap = QPixmap(self.ICON_SIZE, self.ICON_SIZE)
+            pixmap.fill(QColor(color))
+            painter = QPainter(pixmap)
+            font = QFont()
+            font.setBold(True)
+            font.setPixelSize(self.ICON_SIZE // 3)
+            painter.setFont(font)
+            painter.setPen(QColor("white"))
+            painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, letter)
+            painter.end()
+            self._placeholders[api_source] = pixmap
+        return self._placeholders[api_source]
+
+    def icon_for_row(self, row):
+        """Satırın ikonunu döndür; cache'de yoksa indirmeyi başlat"""
+        icon_url = row['icon_url']
+        if not icon_url or icon_url in self._failed_icons:
+            return self.placeholder_icon(row['api'])
+
+        scaled = self._scaled_icons.get(icon_url)
+        if scaled is not None:
+            return scaled
+
+        pixmap = self.icon_cache.get(icon_url) if self.icon_cache is not None else None
+        if pixmap is not None and not pixmap.isNull():
+            return self.remember_icon(icon_url, pixmap)
+
+        # Sadece görünen satırlar için data() çağrıldığından öncelik yüksek
+        if icon_url not in self._requested_icons:
+            self._requested_icons.add(icon_url)
+            IconFetchService.shared().request(icon_url, IconFetchService.PRIORITY_VISIBLE)
+        return self.placeholder_icon(row['api'])
+
+    def remember_icon(self, icon_url, pixmap):
+        """Ölçeklenmiş ikonu sakla (her çizimde yeniden ölçeklenmesin)"""
+        if len(self._scaled_icons) >= self.MAX_SCALED_ICONS:
+            self._scaled_icons.clear()
+        scaled = pixmap.scaled(
+            self.ICON_SIZE, self.ICON_SIZE,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+        self._scaled_icons[icon_url] = scaled
+        return scaled
+
+    def on_icon_fetched(self, icon_url, data):
+        """Servis bir ikonu indirdiğinde ilgili satırları yenile"""
+        if icon_url not in self._requested_icons:
+            return
+        self._requested_icons.discard(icon_url)
+
+        pixmap = QPixmap()
+        if data:
+            pixmap.loadFromData(data)
+        if pixmap.isNull():
+            # Varsayılan ikon gösterilmeye devam eder, tekrar denenmez
+            self._failed_icons.add(icon_url)
+            return
+
+        if self.icon_cache is not None:
+            if hasattr(self.icon_cache, 'put'):
+                self.icon_cache.put(icon_url, data, pixmap)
+            else:
+                self.icon_cache[icon_url] = pixmap
+        self.remember_icon(icon_url, pixmap)
+
+        for row_index, row in enumerate(self.rows):
+            if row['icon_url'] == icon_url:
+                index = self.index(row_index, self.COLUMN_ICON)
+                self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+
+    # QAbstractTableModel arayüzü
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.rows):
+            return None
+        row = self.rows[index.row()]
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == self.COLUMN_NAME:
+                return row['name']
+            if column == self.COLUMN_DESCRIPTION:
+                return row['description']
+            if column == self.COLUMN_AUTHOR:
+                return row['author']
+            if column == self.COLUMN_API:
+                return row['api']
+            if column == self.COLUMN_DOWNLOADS:
+                return row['downloads']
+        elif role == Qt.ItemDataRole.ToolTipRole and column == self.COLUMN_DESCRIPTION:
+            return row['description']
+        elif role == Qt.ItemDataRole.CheckStateRole and column == self.COLUMN_CHECK:
+            if row['key'] in self.selected_keys:
+                return Qt.CheckState.Checked
+            return Qt.CheckState.Unchecked
+        elif role == Qt.ItemDataRole.DecorationRole and column == self.COLUMN_ICON:
+            return self.icon_for_row(row)
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if (not index.isValid() or index.column() != self.COLUMN_CHECK
+                or role != Qt.ItemDataRole.CheckStateRole):
+            return False
+        row = self.rows[index.row()]
+        if Qt.CheckState(value) == Qt.CheckState.Checked:
+            self.selected_keys.add(row['key'])
+        else:
+            self.selected_keys.discard(row['key'])
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        self.selection_changed.emit(self.selected_count())
+        return True
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.isValid() and index.column() == self.COLUMN_CHECK:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+
+class IconDelegate(QStyledItemDelegate):
+    """İkonu hücrenin ortasına çerçeveli olarak çizer"""
+
+    def paint(self, painter, option, index):
+        if option.state & QStyle.StateFlag.State_Selected:
+            painter.fillRect(option.rect, option.palette.highlight())
+
+        pixmap = index.data(Qt.ItemDataRole.DecorationRole)
+        if pixmap is None or pixmap.isNull():
+            return
+
+        x = option.rect.x() + (option.rect.width() - pixmap.width()) // 2
+        y = option.rect.y() + (option.rect.height() - pixmap.height()) // 2
+        painter.drawPixmap(x, y, pixmap)
+
+        painter.save()
+        painter.setPen(QPen(QColor("#cccccc")))
+        painter.drawRect(QRect(x, y, pixmap.width() - 1, pixmap.height() - 1))
+        painter.restore()
+
+class ActionButtonDelegate(QStyledItemDelegate):
+    """Satır başına widget oluşturmadan İndir ve Git butonlarını çizer"""
+
+    download_clicked = pyqtSignal(int)
+    open_clicked = pyqtSignal(int)
+
+    BUTTONS = [
+        ("İndir", "#4CAF50"),
+        ("Git", "#2196F3")
+    ]
+    MARGIN = 4
+    BUTTON_HEIGHT = 26
+
+    def button_rects(self, rect):
+        """Hücre içindeki buton alanlarını hesapla"""
+        count = len(self.BUTTONS)
+        width = (rect.width() - self.MARGIN * (count + 1)) // count
+        height = min(self.BUTTON_HEIGHT, rect.height() - 2 * self.MARGIN)
+        y = rect.y() + (rect.height() - height) // 2
+        return [
+            QRect(rect.x() + self.MARGIN + i * (width + self.MARGIN), y, width, height)
+            for i in range(count)
+        ]
+
+    def paint(self, painter, option, index):
+        if option.state & QStyle.StateFlag.State_Selected:
+            painter.fillRect(option.rect, option.palette.highlight())
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        for (text, color), button_rect in zip(self.BUTTONS, self.button_rects(option.rect)):
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(color))
+            painter.drawRoundedRect(button_rect, 3, 3)
+            painter.setPen(QColor("white"))
+            painter.drawText(button_rect, Qt.AlignmentFlag.AlignCenter, text)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.LeftButton:
+            position = event.position().toPoint()
+            rects = self.button_rects(option.rect)
+            if rects[0].contains(position):
+                self.download_clicked.emit(index.row())
+                return True
+            if rects[1].contains(position):
+                self.open_clicked.emit(index.row())
+                return True
+        return super().editorEvent(event, model, option, index)
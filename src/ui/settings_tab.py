@@ -5,16 +5,20 @@ Ayarlar sekmesi
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                             QLineEdit, QPushButton, QCheckBox, QSpinBox,
                             QGroupBox, QFileDialog, QMessageBox)
-from PyQt6.QtCore import Qt
-import json
-import os
+from PyQt6.QtCore import Qt, pyqtSignal
+
+from ..utils import SettingsManager
 
 class SettingsTab(QWidget):
+    # Değişen anahtarlar ve yeni ayarlar; başka thread'den gelen bildirimler ana thread'e aktarılır
+    settings_changed = pyqtSignal(set, dict)
+    
     def __init__(self):
         super().__init__()
-        self.settings_file = "settings.json"
-        self.settings = self.load_settings()
+        self.settings = SettingsManager.load_settings()
         self.init_ui()
+        SettingsManager.add_listener(self.settings_changed.emit)
+        self.settings_changed.connect(self.on_settings_changed)
         
     def init_ui(self):
         layout = QVBoxLayout(self)
@@ -56,7 +60,7 @@ class SettingsTab(QWidget):
         
         # Arama sonuç limiti
         limit_layout = QHBoxLayout()
-        limit_layout.addWidget(QLabel("Arama Sonuç Limiti:"))
+        limit_layout.addWidget(QLabel("Sayfa Başına Sonuç:"))
         
         self.limit_spin = QSpinBox()
         self.limit_spin.setMinimum(10)
@@ -96,6 +100,20 @@ class SettingsTab(QWidget):
         
         layout.addWidget(api_group)
         
+        # Veri depolama
+        storage_group = QGroupBox("Veri Depolama")
+        storage_layout = QHBoxLayout(storage_group)
+        storage_layout.addWidget(QLabel("Liste ve İndirme Geçmişi:"))
+        
+        self.storage_combo = QComboBox()
+        self.storage_combo.addItem("JSON Dosyaları", 'json')
+        self.storage_combo.addItem("SQLite Veritabanı", 'sqlite')
+        self.set_storage_backend(self.settings.get('storage_backend', 'json'))
+        storage_layout.addWidget(self.storage_combo)
+        storage_layout.addWidget(QLabel("(Yeniden başlatma gerekir)"))
+        
+        layout.addWidget(storage_group)
+        
         # Butonlar
         button_layout = QHBoxLayout()
         
@@ -112,43 +130,28 @@ class SettingsTab(QWidget):
         layout.addLayout(button_layout)
         layout.addStretch()
         
-    def load_settings(self):
-        """Ayarları yükle"""
-        try:
-            if os.path.exists(self.settings_file):
-                with open(self.settings_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            else:
-                return self.get_default_settings()
-        except Exception as e:
-            print(f"Ayarlar yüklenemedi: {e}")
-            return self.get_default_settings()
-    
-    def get_default_settings(self):
-        """Varsayılan ayarları döndür"""
-        return {
-            'default_folder': 'plugins',
-            'concurrent_downloads': 3,
-            'search_limit': 20,
-            'default_api': 'Modrinth',
-            'api_priority': 'Modrinth Önce',
-            'show_premium_plugins': False
-        }
+    def on_settings_changed(self, changed, settings):
+        """Ayarlar başka yerden değiştiyse (sıralama butonları, dosya) formu güncelle"""
+        self.settings = settings
+        # Kaydedilmemiş diğer alanlar korunur
+        self.update_ui(changed)
     
     def save_settings(self):
         """Ayarları kaydet"""
         try:
-            self.settings = {
+            settings = {
                 'default_folder': self.folder_input.text(),
                 'concurrent_downloads': self.concurrent_spin.value(),
                 'search_limit': self.limit_spin.value(),
                 'default_api': self.default_api_combo.currentText(),
                 'api_priority': self.api_priority_combo.currentText(),
-                'show_premium_plugins': self.show_premium_checkbox.isChecked()
+                'show_premium_plugins': self.show_premium_checkbox.isChecked(),
+                'storage_backend': self.storage_combo.currentData()
             }
             
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, ensure_ascii=False, indent=2)
+            if not SettingsManager.save_settings(settings):
+                raise RuntimeError("ayar dosyası yazılamadı")
+            self.settings = settings
             
             QMessageBox.information(self, "Başarılı", "Ayarlar kaydedildi.")
             
@@ -165,17 +168,29 @@ class SettingsTab(QWidget):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            self.settings = self.get_default_settings()
+            self.settings = SettingsManager.get_default_settings()
             self.update_ui()
             QMessageBox.information(self, "Başarılı", "Ayarlar sıfırlandı.")
     
-    def update_ui(self):
-        """UI'yi ayarlara göre güncelle"""
-        self.folder_input.setText(self.settings.get('default_folder', 'plugins'))
-        self.concurrent_spin.setValue(self.settings.get('concurrent_downloads', 3))
-        self.limit_spin.setValue(self.settings.get('search_limit', 20))
-        self.default_api_combo.setCurrentText(self.settings.get('default_api', 'Modrinth'))
-        self.api_priority_combo.setCurrentText(self.settings.get('api_priority', 'Modrinth Önce'))
+    def update_ui(self, keys=None):
+        """UI'yi ayarlara göre güncelle (keys verilirse sadece o alanlar)"""
+        updaters = {
+            'default_folder': lambda value: self.folder_input.setText(value or 'plugins'),
+            'concurrent_downloads': lambda value: self.concurrent_spin.setValue(value or 3),
+            'search_limit': lambda value: self.limit_spin.setValue(value or 20),
+            'default_api': lambda value: self.default_api_combo.setCurrentText(value or 'Modrinth'),
+            'api_priority': lambda value: self.api_priority_combo.setCurrentText(value or 'Modrinth Önce'),
+            'show_premium_plugins': lambda value: self.show_premium_checkbox.setChecked(bool(value)),
+            'storage_backend': lambda value: self.set_storage_backend(value or 'json')
+        }
+        for key, update in updaters.items():
+            if keys is None or key in keys:
+                update(self.settings.get(key))
+    
+    def set_storage_backend(self, backend):
+        """Depolama seçimini combo'ya uygula"""
+        index = self.storage_combo.findData(backend)
+        self.storage_combo.setCurrentIndex(index if index >= 0 else 0)
     
     def browse_folder(self):
         """Klasör seç"""
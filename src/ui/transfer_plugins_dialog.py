@@ -15,6 +15,7 @@ class TransferPluginsDialog(QDialog):
         self.plugins = plugins
         self.available_lists = [lst for lst in available_lists if lst != current_list]
         self.current_list = current_list
+        self.modrinth_versions = {}  # plugin_id -> toplu istekle alınan sürümler
         self.init_ui()
         
     def init_ui(self):
@@ -140,6 +141,9 @@ class TransferPluginsDialog(QDialog):
         """Mod değiştiğinde çağrılır"""
         different_version_mode = self.different_version_radio.isChecked()
         
+        if different_version_mode:
+            self.prefetch_modrinth_versions()
+        
         # Sürüm combo'larını etkinleştir/devre dışı bırak
         for row in range(self.plugins_table.rowCount()):
             version_combo = self.plugins_table.cellWidget(row, 4)
@@ -150,6 +154,22 @@ class TransferPluginsDialog(QDialog):
                     # Farklı sürüm modunda sürümleri yükle
                     self.load_versions_for_plugin(row)
     
+    def prefetch_modrinth_versions(self):
+        """Modrinth plugin'lerinin sürümlerini tek seferde (toplu istekle) al"""
+        plugin_ids = [
+            plugin.get('plugin_id') for plugin in self.plugins
+            if plugin.get('api', 'Modrinth') == "Modrinth" and plugin.get('plugin_id')
+            and plugin.get('plugin_id') not in self.modrinth_versions
+        ]
+        if not plugin_ids:
+            return
+        
+        try:
+            from ..api.modrinth_api import ModrinthAPI
+            self.modrinth_versions.update(ModrinthAPI().get_recent_versions(plugin_ids))
+        except Exception as e:
+            print(f"Toplu sürüm yükleme hatası: {e}")
+    
     def load_versions_for_plugin(self, row):
         """Plugin için mevcut sürümleri yükle"""
         try:
@@ -166,9 +186,11 @@ class TransferPluginsDialog(QDialog):
             
             # API'den sürümleri al
             if api_type == "Modrinth":
-                from ..api.modrinth_api import ModrinthAPI
-                api = ModrinthAPI()
-                versions = api.get_plugin_versions(plugin_id)
+                versions = self.modrinth_versions.get(plugin_id)
+                if versions is None:
+                    from ..api.modrinth_api import ModrinthAPI
+                    api = ModrinthAPI()
+                    versions = api.get_plugin_versions(plugin_id)
             else:
                 from ..api.spigot_api import SpigotAPI
                 api = SpigotAPI()
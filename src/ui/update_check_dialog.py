@@ -0,0 +1,219 @@
+"""
+Toplu güncelleme kontrolü dialog penceresi
+"""
+
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
+                            QPushButton, QProgressBar, QTableWidget, QTableWidgetItem,
+                            QHeaderView, QCheckBox, QMessageBox)
+from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtGui import QColor
+
+from ..api.update_checker import UpdateChecker
+from ..utils import ListManager
+
+class UpdateCheckWorker(QThread):
+    check_finished = pyqtSignal(list)
+    error_occurred = pyqtSignal(str)
+
+    def __init__(self, entries):
+        super().__init__()
+        self.entries = entries
+
+    def run(self):
+        try:
+            self.check_finished.emit(UpdateChecker().check(self.entries))
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+
+class UpdateCheckDialog(QDialog):
+    STATUS_TEXTS = {
+        UpdateChecker.STATUS_OUTDATED: "Güncelleme var",
+        UpdateChecker.STATUS_UP_TO_DATE: "Güncel",
+        UpdateChecker.STATUS_UNKNOWN: "Bulunamadı"
+    }
+
+    def __init__(self, entries, parent=None, list_name=None):
+        super().__init__(parent)
+        self.entries = entries
+        self.list_name = list_name  # Liste kontrol ediliyorsa sonuçlar listeye yazılır
+        self.download_manager = None
+        self.results = []
+        self.displayed_results = []  # Tablodaki sırayla sonuçlar
+        self.worker = None
+        self.init_ui()
+        self.start_check()
+
+    def init_ui(self):
+        self.setWindowTitle("Güncelleme Kontrolü")
+        self.setModal(True)
+        self.resize(850, 600)
+
+        layout = QVBoxLayout(self)
+
+        # Özet
+        self.summary_label = QLabel(f"{len(self.entries)} plugin kontrol ediliyor...")
+        layout.addWidget(self.summary_label)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 0)  # Belirsiz ilerleme
+        layout.addWidget(self.progress_bar)
+
+        # Sonuç tablosu
+        self.results_table = QTableWidget()
+        self.results_table.setColumnCount(6)
+        self.results_table.setHorizontalHeaderLabels([
+            "Seç", "Plugin Adı", "API", "Mevcut Sürüm", "Son Sürüm", "Durum"
+        ])
+
+        header = self.results_table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(3, QHeaderView.ResizeMode.Interactive)
+        header.setSectionResizeMode(4, QHeaderView.ResizeMode.Interactive)
+        header.setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)
+        layout.addWidget(self.results_table)
+
+        self.show_all_checkbox = QCheckBox("Güncel olanları da göster")
+        self.show_all_checkbox.toggled.connect(self.populate_table)
+        layout.addWidget(self.show_all_checkbox)
+
+        # Butonlar
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+
+        self.download_btn = QPushButton("Seçilenleri Güncelle")
+        self.download_btn.setStyleSheet("QPushButton { background-color: #4CAF50; color: white; padding: 6px 12px; }")
+        self.download_btn.clicked.connect(self.download_selected)
+        self.download_btn.setEnabled(False)
+        button_layout.addWidget(self.download_btn)
+
+        close_btn = QPushButton("Kapat")
+        close_btn.clicked.connect(self.close)
+        button_layout.addWidget(close_btn)
+
+        layout.addLayout(button_layout)
+
+    def set_download_manager(self, download_manager):
+        """Download manager referansını ayarla"""
+        self.download_manager = download_manager
+
+    def start_check(self):
+        """Kontrolü arka planda başlat"""
+        self.worker = UpdateCheckWorker(self.entries)
+        self.worker.check_finished.connect(self.on_check_finished)
+        self.worker.error_occurred.connect(self.on_check_error)
+        self.worker.start()
+
+    def on_check_finished(self, results):
+        """Kontrol tamamlandı"""
+        self.results = results
+        self.progress_bar.setRange(0, 1)
+        self.progress_bar.setValue(1)
+
+        outdated = [result for result in results if result['status'] == UpdateChecker.STATUS_OUTDATED]
+        unknown = [result for result in results if result['status'] == UpdateChecker.STATUS_UNKNOWN]
+        summary = f"{len(results)} plugin kontrol edildi: {len(outdated)} güncelleme var"
+        if unknown:
+            summary += f", {len(unknown)} plugin bulunamadı"
+        self.summary_label.setText(summary)
+
+        if self.list_name:
+            self.save_latest_versions()
+
+        self.populate_table()
+
+    def on_check_error(self, error):
+        """Kontrol hatası"""
+        self.progress_bar.setRange(0, 1)
+        self.summary_label.setText("Güncelleme kontrolü başarısız")
+        QMessageBox.critical(self, "Hata", f"Güncelleme kontrolü hatası: {error}")
+
+    def save_latest_versions(self):
+        """Bulunan son sürümleri listedeki 'latest_version' alanına yaz"""
+        latest_versions = {
+            ListManager.plugin_key(result): result['latest_version']
+            for result in self.results if result['latest_version']
+        }
+        if latest_versions:
+            ListManager.shared().set_latest_versions(self.list_name, latest_versions)
+
+    def populate_table(self):
+        """Sonuçları tabloya yaz (varsayılan olarak sadece güncellemesi olanlar)"""
+        show_all = self.show_all_checkbox.isChecked()
+        self.displayed_results = [
+            result for result in self.results
+            if show_all or result['status'] == UpdateChecker.STATUS_OUTDATED
+        ]
+
+        self.results_table.setRowCount(len(self.displayed_results))
+        for row, result in enumerate(self.displayed_results):
+            outdated = result['status'] == UpdateChecker.STATUS_OUTDATED
+
+            checkbox = QCheckBox()
+            checkbox.setChecked(outdated)
+            checkbox.setEnabled(outdated)
+            self.results_table.setCellWidget(row, 0, checkbox)
+
+            self.results_table.setItem(row, 1, QTableWidgetItem(result['name']))
+            self.results_table.setItem(row, 2, QTableWidgetItem(result['api']))
+            self.results_table.setItem(row, 3, QTableWidgetItem(result['current_version'] or 'N/A'))
+
+            latest_item = QTableWidgetItem(result['latest_version'] or '-')
+            if outdated:
+                latest_item.setForeground(QColor("#4CAF50"))
+            self.results_table.setItem(row, 4, latest_item)
+
+            self.results_table.setItem(row, 5, QTableWidgetItem(self.STATUS_TEXTS[result['status']]))
+
+        self.download_btn.setEnabled(any(
+            result['status'] == UpdateChecker.STATUS_OUTDATED for result in self.displayed_results
+        ))
+
+    def get_checked_results(self):
+        """İşaretli satırların sonuçları"""
+        checked = []
+        for row, result in enumerate(self.displayed_results):
+            checkbox = self.results_table.cellWidget(row, 0)
+            if checkbox and checkbox.isChecked() and result['latest']:
+                checked.append(result)
+        return checked
+
+    def download_selected(self):
+        """Seçilen plugin'lerin son sürümlerini indir"""
+        selected_plugins = []
+        for result in self.get_checked_results():
+            if result['api'] == "Modrinth":
+                plugin_obj = {
+                    'title': result['name'],
+                    'project_id': result['plugin_id'],
+                    'slug': result['plugin_id'],
+                    '_api_source': 'Modrinth'
+                }
+            else:
+                plugin_obj = {
+                    'name': result['name'],
+                    'id': int(result['plugin_id']),
+                    '_api_source': 'Spigot'
+                }
+
+            selected_plugins.append({
+                'plugin': plugin_obj,
+                'version': result['latest'],
+                'api': result['api']
+            })
+
+        if not selected_plugins:
+            QMessageBox.warning(self, "Uyarı", "Güncellenecek plugin seçilmedi!")
+            return
+
+        from .multi_download_dialog import MultiDownloadDialog
+        dialog = MultiDownloadDialog(selected_plugins, self)
+        dialog.set_download_manager(self.download_manager)
+        dialog.exec()
+
+    def closeEvent(self, event):
+        """Dialog kapanırken kontrolün bitmesini bekle"""
+        if self.worker and self.worker.isRunning():
+            self.worker.wait()
+        event.accept()
@@ -1,17 +1,44 @@
 """
 Utility modülleri
+
+Alt modüller ilk erişimde yüklenir (PEP 562); böylece PyQt6'ya bağımlı ikon
+modülleri sadece arayüz onları kullandığında içe aktarılır ve komut satırı
+aracı Qt olmadan çalışır.
 """
 
-from .settings_manager import SettingsManager
-from .icon_manager import IconManager, IconDownloadWorker, IconCacheMixin
-from .plugin_sorter import PluginSorter
-from .list_manager import ListManager
+import importlib
+
+_EXPORTS = {
+    'SettingsManager': '.settings_manager',
+    'IconManager': '.icon_manager',
+    'IconFetchService': '.icon_fetch_service',
+    'IconCacheMixin': '.icon_manager',
+    'IconCache': '.icon_cache',
+    'PluginSorter': '.plugin_sorter',
+    'ListManager': '.list_manager',
+    'SQLiteStorage': '.sqlite_storage',
+    'DownloadHistory': '.download_history'
+}
 
 __all__ = [
     'SettingsManager',
     'IconManager', 
-    'IconDownloadWorker',
+    'IconFetchService',
     'IconCacheMixin',
+    'IconCache',
     'PluginSorter',
-    'ListManager'
-]
\ No newline at end of file
+    'ListManager',
+    'SQLiteStorage',
+    'DownloadHistory'
+]
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Sonraki erişimler doğrudan modül sözlüğünden
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
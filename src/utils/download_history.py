@@ -0,0 +1,447 @@
+"""
+İndirme geçmişi deposu
+"""
+
+import json
+import os
+import threading
+import uuid
+from datetime import datetime
+
+from .sqlite_storage import SQLiteStorage
+
+class DownloadHistory:
+    """
+    İndirme kayıtlarının tek erişim noktası.
+
+    Her indirme başlangıç, ilerleme, tamamlanma ve hata olayı olarak satır satır
+    bir günlüğe (downloads.jsonl) eklenir; ekleme maliyeti geçmişin boyutundan
+    bağımsızdır. Günlük belirli bir uzunluğu geçince arka planda anlık görüntüye
+    (downloads.json) sıkıştırılır. Uygulama çökerse yarım kalan indirmeler bir
+    sonraki açılışta günlükten okunur.
+
+    SQLite kullanılırken tamamlanan kayıtlar veritabanına yazılır, günlük sadece
+    devam eden indirmeleri izler.
+    """
+
+    COMPACT_THRESHOLD = 500  # Sıkıştırmadan önce günlükte biriken satır sayısı
+    PROGRESS_STEP = 25  # İlerleme olaylarının günlüğe yazıldığı yüzde aralığı
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, downloads_file="downloads.json", storage=None, journal_file=None):
+        self.downloads_file = downloads_file
+        self.journal_file = journal_file or f"{os.path.splitext(downloads_file)[0]}.jsonl"
+        self.storage = storage
+        self._lock = threading.RLock()
+        self._compact_lock = threading.Lock()
+        self._records = None  # Bellekteki kayıtlar (ilk erişimde yüklenir)
+        self._version = None  # Son okunan/yazılan verinin sürümü
+        self._in_flight = {}  # anahtar -> {'record', 'progress', 'started'}
+        self._interrupted = None  # Önceki oturumda yarım kalan indirmeler (ilk yüklemede belirlenir)
+        self._journal = None  # Ekleme modunda açık günlük dosyası
+        self._journal_lines = 0
+        self._compaction_tail = None  # Sıkıştırma sürerken eklenen satırlar
+
+    @classmethod
+    def shared(cls):
+        """Uygulama genelindeki ortak indirme geçmişini döndür"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls(storage=SQLiteStorage.from_settings())
+            return cls._shared
+
+    @staticmethod
+    def source_fields(api, plugin_id, version):
+        """
+        Kaydın indirildiği kaynağı tanımlayan alanlar
+
+        Kayıtta saklanan plugin/sürüm ID'si ve dosya adresiyle yeniden indirme
+        isimle arama yapmadan doğrudan çözülür.
+        """
+        version = version or {}
+        fields = {'plugin_id': plugin_id, 'version_id': version.get('id')}
+        if api == "Modrinth":
+            fields['file_url'] = (version.get('files') or [{}])[0].get('url')
+        return fields
+
+    @staticmethod
+    def _now():
+        return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    @staticmethod
+    def _stat_version(path):
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _source_version(self):
+        """Kaynağın dışarıdan değişip değişmediğini anlamak için sürüm değeri"""
+        if self.storage is not None:
+            try:
+                return self.storage.data_version()
+            except Exception:
+                return None
+        return (self._stat_version(self.downloads_file), self._stat_version(self.journal_file))
+
+    # Okuma
+
+    def _read_snapshot(self):
+        """Sıkıştırılmış kayıtları oku (JSON modu)"""
+        try:
+            if os.path.exists(self.downloads_file):
+                with open(self.downloads_file, 'r', encoding='utf-8') as f:
+                    records = json.load(f)
+                return records if isinstance(records, list) else []
+        except Exception as e:
+            print(f"İndirme geçmişi okunamadı: {e}")
+        return []
+
+    def _read_journal(self):
+        """Günlükteki olayları sırayla oku; yarım yazılmış son satır atlanır"""
+        events = []
+        if not os.path.exists(self.journal_file):
+            return events
+        try:
+            with open(self.journal_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        events.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        print("Uyarı: İndirme günlüğünde bozuk satır atlandı")
+        except Exception as e:
+            print(f"İndirme günlüğü okunamadı: {e}")
+        return events
+
+    def _replay(self, records, events):
+        """Olayları kayıtlara ve devam eden indirmelere uygula"""
+        known_ids = {record.get('id') for record in records}
+        in_flight = {}
+        for event in events:
+            kind = event.get('event')
+            key = event.get('key')
+            if kind == 'start':
+                in_flight[key] = {
+                    'record': event.get('record', {}),
+                    'progress': event.get('progress', 0),
+                    'started': event.get('time')
+                }
+            elif kind == 'progress':
+                if key in in_flight:
+                    in_flight[key]['progress'] = event.get('progress', 0)
+            elif kind in ('complete', 'fail'):
+                in_flight.pop(key, None)
+                record = event.get('record')
+                # Sıkıştırma sırasında çökülürse aynı kayıt iki kez gelebilir
+                if kind == 'complete' and self.storage is None and record and record.get('id') not in known_ids:
+                    records.append(record)
+                    known_ids.add(record.get('id'))
+            elif kind == 'remove' and self.storage is None:
+                remove_ids = set(event.get('ids', []))
+                records[:] = [record for record in records if record.get('id') not in remove_ids]
+                known_ids -= remove_ids
+            elif kind == 'clear' and self.storage is None:
+                records.clear()
+                known_ids.clear()
+        return in_flight
+
+    def _read(self):
+        """Kayıtları kaynaktan oku"""
+        try:
+            if self.storage is not None:
+                return self.storage.load_downloads()
+        except Exception as e:
+            print(f"İndirme geçmişi okunamadı: {e}")
+            return []
+
+        records = self._read_snapshot()
+        missing_id = False
+        for record in records:
+            if 'id' not in record:
+                # Eski biçimdeki kayıtlar silinebilmek için kalıcı bir kimlik alır
+                record['id'] = uuid.uuid4().hex
+                missing_id = True
+        self._replay(records, self._read_journal())
+        if missing_id:
+            self._write_snapshot(records)
+        return records
+
+    def _ensure_loaded(self):
+        with self._lock:
+            if self._interrupted is None:
+                self._load_journal_state()
+            version = self._source_version()
+            if self._records is None or version != self._version:
+                self._records = self._read()
+                self._version = self._source_version()
+            return self._records
+
+    def _load_journal_state(self):
+        """İlk açılışta günlükteki yarım kalmış indirmeleri işaretle"""
+        events = self._read_journal()
+        self._journal_lines = len(events)
+        self._interrupted = []
+        stale = self._replay([], events)
+        for key, entry in stale.items():
+            self._interrupted.append(entry)
+            self._append({'event': 'fail', 'key': key, 'error': 'interrupted'})
+        if stale:
+            print(f"Uyarı: Önceki oturumda {len(stale)} indirme yarım kaldı")
+
+    # Yazma
+
+    def _write_snapshot(self, records):
+        """Kayıtları anlık görüntü dosyasına atomik olarak yaz"""
+        tmp_file = f"{self.downloads_file}.tmp"
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(records, f, ensure_ascii=False, separators=(',', ':'))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.downloads_file)
+            return True
+        except Exception as e:
+            print(f"İndirme geçmişi kaydedilemedi: {e}")
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+            return False
+
+    def _append(self, event, durable=True):
+        """Günlüğe tek olay ekle (sabit maliyet)"""
+        event.setdefault('time', self._now())
+        line = json.dumps(event, ensure_ascii=False, separators=(',', ':')) + '\n'
+        with self._lock:
+            try:
+                if self._journal is None:
+                    self._journal = open(self.journal_file, 'a', encoding='utf-8')
+                self._journal.write(line)
+                self._journal.flush()
+                if durable:
+                    os.fsync(self._journal.fileno())
+            except Exception as e:
+                print(f"İndirme günlüğüne yazılamadı: {e}")
+                return False
+
+            self._journal_lines += 1
+            if self.storage is None and self._records is not None:
+                # Kendi yazımımız dışarıdan değişiklik sayılmasın
+                self._version = self._source_version()
+            if self._compaction_tail is not None:
+                self._compaction_tail.append(line)
+            elif self._journal_lines >= self.COMPACT_THRESHOLD:
+                self.compact_async()
+            return True
+
+    def compact_async(self):
+        """Günlüğü arka planda sıkıştır"""
+        if self._compact_lock.locked():
+            return
+        threading.Thread(target=self.compact, name="DownloadHistoryCompact", daemon=True).start()
+
+    def compact(self):
+        """Kayıtları anlık görüntüye yaz ve günlüğü sadece devam eden indirmelere indir"""
+        if not self._compact_lock.acquire(blocking=False):
+            return False
+        try:
+            with self._lock:
+                records = list(self._ensure_loaded())
+                in_flight = {key: dict(entry) for key, entry in self._in_flight.items()}
+                self._compaction_tail = []
+
+            # Anlık görüntü kilit dışında yazılır, bu sırada eklenen olaylar tail'de birikir
+            if self.storage is None and not self._write_snapshot(records):
+                return False
+
+            with self._lock:
+                lines = []
+                for key, entry in in_flight.items():
+                    lines.append(json.dumps({
+                        'event': 'start', 'key': key, 'record': entry['record'],
+                        'progress': entry['progress'], 'time': entry['started']
+                    }, ensure_ascii=False, separators=(',', ':')) + '\n')
+                lines.extend(self._compaction_tail)
+
+                tmp_file = f"{self.journal_file}.tmp"
+                try:
+                    with open(tmp_file, 'w', encoding='utf-8') as f:
+                        f.writelines(lines)
+                        f.flush()
+                        os.fsync(f.fileno())
+                    if self._journal is not None:
+                        self._journal.close()
+                        self._journal = None
+                    os.replace(tmp_file, self.journal_file)
+                except Exception as e:
+                    print(f"İndirme günlüğü sıkıştırılamadı: {e}")
+                    try:
+                        os.remove(tmp_file)
+                    except OSError:
+                        pass
+                    return False
+
+                self._journal_lines = len(lines)
+                self._version = self._source_version()
+                return True
+        finally:
+            with self._lock:
+                self._compaction_tail = None
+            self._compact_lock.release()
+
+    # Devam eden indirmeler
+
+    def start(self, name, version, api, path, **extra):
+        """İndirmenin başladığını günlüğe yaz ve izleme anahtarını döndür"""
+        record = {'name': name, 'version': version, 'api': api, 'path': path}
+        record.update({key: value for key, value in extra.items() if value is not None})
+        key = uuid.uuid4().hex
+        with self._lock:
+            self._ensure_loaded()
+            self._in_flight[key] = {'record': record, 'progress': 0, 'started': self._now()}
+            self._append({'event': 'start', 'key': key, 'record': record})
+        return key
+
+    def progress(self, key, progress):
+        """İlerlemeyi güncelle; sadece PROGRESS_STEP sınırları günlüğe yazılır"""
+        with self._lock:
+            entry = self._in_flight.get(key)
+            if entry is None:
+                return
+            checkpoint = int(progress) // self.PROGRESS_STEP * self.PROGRESS_STEP
+            if checkpoint > entry['progress']:
+                entry['progress'] = checkpoint
+                self._append({'event': 'progress', 'key': key, 'progress': checkpoint}, durable=False)
+
+    def fail(self, key, error=""):
+        """İndirmenin başarısız olduğunu günlüğe yaz"""
+        with self._lock:
+            if self._in_flight.pop(key, None) is not None:
+                self._append({'event': 'fail', 'key': key, 'error': str(error)})
+
+    def in_flight(self):
+        """Bu oturumda devam eden indirmeler"""
+        with self._lock:
+            return [dict(entry, key=key) for key, entry in self._in_flight.items()]
+
+    def interrupted(self):
+        """Önceki oturumda tamamlanmadan kalan indirmeler"""
+        with self._lock:
+            self._ensure_loaded()
+            return list(self._interrupted)
+
+    # Kayıtlar
+
+    def load(self, reload=False):
+        """
+        Tüm kayıtları eklenme sırasıyla döndür
+
+        Dönen liste bellekteki verinin kendisidir; değişiklikler add/remove ile yapılmalıdır.
+        """
+        with self._lock:
+            if reload:
+                self._records = None
+            return self._ensure_loaded()
+
+    def add(self, name, version, api, path, key=None, **extra):
+        """
+        Tamamlanan indirme kaydını ekle ve kaydı döndür (hata durumunda None)
+
+        key verilirse start ile açılan indirme kapatılır.
+        """
+        record = {
+            'name': name,
+            'version': version,
+            'api': api,
+            'path': path,
+            'date': self._now()
+        }
+        record.update({k: value for k, value in extra.items() if value is not None})
+
+        with self._lock:
+            records = self._ensure_loaded()
+            self._in_flight.pop(key, None)
+            if self.storage is not None:
+                try:
+                    record['id'] = self.storage.add_download(record)
+                except Exception as e:
+                    print(f"İndirme kaydı eklenemedi: {e}")
+                    return None
+                if key is not None:
+                    self._append({'event': 'complete', 'key': key})
+            else:
+                record['id'] = uuid.uuid4().hex
+                if not self._append({'event': 'complete', 'key': key, 'record': record}):
+                    return None
+            records.append(record)
+            self._version = self._source_version()
+            return record
+
+    def remove(self, records_to_remove):
+        """
+        Verilen kayıtları sil, silinen sayısını döndür
+
+        Kayıtlar saklanan 'id' alanıyla eşlenir; kaynak yeniden okunduktan sonra
+        elde kalan eski kayıt nesneleriyle de silme çalışır.
+        """
+        with self._lock:
+            records = self._ensure_loaded()
+            remove_ids = {record.get('id') for record in records_to_remove} - {None}
+            removed = [record for record in records if record.get('id') in remove_ids]
+            if not removed:
+                return 0
+
+            record_ids = [record.get('id') for record in removed]
+            try:
+                if self.storage is not None:
+                    self.storage.delete_downloads(record_ids)
+                elif not self._append({'event': 'remove', 'ids': record_ids}):
+                    return 0
+            except Exception as e:
+                print(f"İndirme kayıtları silinemedi: {e}")
+                return 0
+
+            self._records = [record for record in records if record.get('id') not in remove_ids]
+            self._version = self._source_version()
+            return len(removed)
+
+    def clear(self):
+        """Tüm indirme geçmişini sil (devam eden indirmeler korunur)"""
+        with self._lock:
+            self._ensure_loaded()
+            try:
+                if self.storage is not None:
+                    self.storage.clear_downloads()
+                elif not self._append({'event': 'clear'}):
+                    return False
+            except Exception as e:
+                print(f"İndirme geçmişi temizlenemedi: {e}")
+                return False
+            self._records = []
+            self._version = self._source_version()
+        self.compact_async()
+        return True
+
+    def find(self, plugin_id=None, api=None, since=None, limit=None):
+        """Plugin id, API ve tarihe göre kayıt ara (en yeni önce)"""
+        if self.storage is not None:
+            try:
+                return self.storage.find_downloads(plugin_id, api, since, limit)
+            except Exception as e:
+                print(f"İndirme geçmişi sorgulanamadı: {e}")
+                return []
+
+        with self._lock:
+            matches = [
+                record for record in self._ensure_loaded()
+                if (plugin_id is None or str(record.get('plugin_id')) == str(plugin_id))
+                and (api is None or record.get('api') == api)
+                and (since is None or record.get('date', '') >= since)
+            ]
+        matches.sort(key=lambda record: record.get('date', ''), reverse=True)
+        return matches[:limit] if limit is not None else matches
@@ -0,0 +1,227 @@
+"""
+İki katmanlı ikon cache'i (bellek LRU + disk)
+"""
+
+from collections import OrderedDict
+import hashlib
+import os
+
+from PyQt6.QtGui import QPixmap
+
+class IconCache:
+    """
+    URL -> QPixmap cache'i.
+
+    Bellekte bayt sınırlı bir LRU tutar, ham görüntü baytlarını URL hash'i ile
+    diskte saklar. Eski dict tabanlı cache ile aynı arayüzü (in, [], len, clear) sunar.
+    """
+
+    DEFAULT_MEMORY_BYTES = 32 * 1024 * 1024
+    DEFAULT_DISK_BYTES = 100 * 1024 * 1024
+    WARM_LOAD_COUNT = 200  # Açılışta belleğe alınacak en fazla ikon sayısı
+
+    def __init__(self, cache_dir=os.path.join("cache", "icons"),
+                 max_memory_bytes=DEFAULT_MEMORY_BYTES, max_disk_bytes=DEFAULT_DISK_BYTES):
+        self.cache_dir = cache_dir
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+
+        self._memory = OrderedDict()  # key -> (QPixmap, bayt)
+        self._memory_bytes = 0
+        self._disk = OrderedDict()  # key -> boyut (en eski erişim başta)
+        self._disk_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+
+        self._load_disk_index()
+
+    @staticmethod
+    def make_key(url):
+        """URL'den cache anahtarı üret"""
+        return hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def pixmap_bytes(pixmap):
+        """Pixmap'in bellekte kapladığı yaklaşık bayt"""
+        return max(1, pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8)
+
+    def _path_for(self, key):
+        return os.path.join(self.cache_dir, key)
+
+    def _load_disk_index(self):
+        """Diskteki ikonları son erişim sırasına göre indeksle"""
+        try:
+            if not os.path.isdir(self.cache_dir):
+                return
+            entries = []
+            for entry in os.scandir(self.cache_dir):
+                if entry.is_file() and not entry.name.endswith('.tmp'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, entry.name, stat.st_size))
+            for _, key, size in sorted(entries):
+                self._disk[key] = size
+                self._disk_bytes += size
+        except Exception as e:
+            print(f"İkon cache indeksi yüklenemedi: {e}")
+
+    def warm_load(self, limit=WARM_LOAD_COUNT):
+        """En son kullanılan ikonları diskten belleğe yükle"""
+        loaded = 0
+        for key in reversed(list(self._disk.keys())):
+            if loaded >= limit or self._memory_bytes >= self.max_memory_bytes:
+                break
+            if key in self._memory:
+                continue
+            if self._load_from_disk(key, touch=False) is not None:
+                loaded += 1
+        return loaded
+
+    def _remember(self, key, pixmap):
+        """Pixmap'i bellek LRU'suna ekle ve sınırı koru"""
+        size = self.pixmap_bytes(pixmap)
+        if key in self._memory:
+            self._memory_bytes -= self._memory.pop(key)[1]
+        self._memory[key] = (pixmap, size)
+        self._memory_bytes += size
+
+        while self._memory_bytes > self.max_memory_bytes and len(self._memory) > 1:
+            _, (_, old_size) = self._memory.popitem(last=False)
+            self._memory_bytes -= old_size
+
+    def _load_from_disk(self, key, touch=True):
+        """Diskteki ham baytları çözüp belleğe al"""
+        if key not in self._disk:
+            return None
+        path = self._path_for(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            self._forget_disk(key)
+            return None
+
+        pixmap = QPixmap()
+        if not pixmap.loadFromData(data) or pixmap.isNull():
+            self._forget_disk(key, remove_file=True)
+            return None
+
+        self._remember(key, pixmap)
+        if touch:
+            self._disk.move_to_end(key)
+            try:
+                os.utime(path, None)
+            except OSError:
+                pass
+        return pixmap
+
+    def _forget_disk(self, key, remove_file=False):
+        size = self._disk.pop(key, None)
+        if size is not None:
+            self._disk_bytes -= size
+        if remove_file:
+            try:
+                os.remove(self._path_for(key))
+            except OSError:
+                pass
+
+    def _write_disk(self, key, data):
+        """Ham görüntü baytlarını atomik olarak diske yaz"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = self._path_for(key)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"İkon cache yazma hatası: {e}")
+            return
+
+        self._forget_disk(key)
+        self._disk[key] = len(data)
+        self._disk_bytes += len(data)
+
+        # Disk sınırı aşıldıysa en eski ikonları sil
+        while self._disk_bytes > self.max_disk_bytes and len(self._disk) > 1:
+            old_key = next(iter(self._disk))
+            self._forget_disk(old_key, remove_file=True)
+
+    def put(self, url, data, pixmap=None):
+        """İndirilen ikonu iki katmana da ekle"""
+        if not url:
+            return None
+        if pixmap is None:
+            pixmap = QPixmap()
+            pixmap.loadFromData(data)
+        if pixmap.isNull():
+            return None
+
+        key = self.make_key(url)
+        self._remember(key, pixmap)
+        if data:
+            self._write_disk(key, bytes(data))
+        return pixmap
+
+    def get(self, url, default=None):
+        """İkonu bellekten, yoksa diskten getir"""
+        if not url:
+            return default
+        key = self.make_key(url)
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        pixmap = self._load_from_disk(key)
+        if pixmap is not None:
+            self.hits += 1
+            return pixmap
+
+        self.misses += 1
+        return default
+
+    def __contains__(self, url):
+        # Sadece varlık kontrolü; isabet/ıska sayaçları get() içinde tutulur
+        if not url:
+            return False
+        key = self.make_key(url)
+        return key in self._memory or key in self._disk
+
+    def __getitem__(self, url):
+        pixmap = self.get(url)
+        if pixmap is None:
+            raise KeyError(url)
+        return pixmap
+
+    def __setitem__(self, url, pixmap):
+        # Ham bayt olmadan eklenen ikonlar sadece bellekte tutulur
+        if url and pixmap is not None and not pixmap.isNull():
+            self._remember(self.make_key(url), pixmap)
+
+    def __len__(self):
+        return len(set(self._memory.keys()) | set(self._disk.keys()))
+
+    def clear(self):
+        """Bellek ve disk cache'ini temizle"""
+        self._memory.clear()
+        self._memory_bytes = 0
+        for key in list(self._disk.keys()):
+            self._forget_disk(key, remove_file=True)
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """Cache istatistiklerini döndür"""
+        lookups = self.hits + self.misses
+        return {
+            'count': len(self),
+            'memory_count': len(self._memory),
+            'memory_bytes': self._memory_bytes,
+            'disk_count': len(self._disk),
+            'disk_bytes': self._disk_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits / lookups) if lookups else 0.0
+        }
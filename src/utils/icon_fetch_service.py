@@ -0,0 +1,141 @@
+"""
+Paylaşılan ikon indirme servisi
+"""
+
+import heapq
+import itertools
+import threading
+
+import requests
+import requests.adapters
+from PyQt6.QtCore import QObject, pyqtSignal
+
+class IconFetchService(QObject):
+    """
+    Sabit sayıda worker thread ile ikonları indiren uygulama geneli servis.
+
+    Aynı URL için gelen istekler tek indirmede birleştirilir, görünür satırların
+    ikonları öncelik kuyruğunda öne alınır. Sonuç tüm dinleyicilere icon_ready
+    sinyali ile ham bayt olarak iletilir (QPixmap GUI thread'inde oluşturulur).
+    """
+
+    icon_ready = pyqtSignal(str, bytes)  # URL, ham görüntü baytları (hata durumunda boş)
+
+    PRIORITY_VISIBLE = 0  # Ekranda görünen satırlar
+    PRIORITY_NORMAL = 1   # Tabloya eklenmiş ama görünmeyen satırlar
+
+    WORKER_COUNT = 4
+    REQUEST_TIMEOUT = 10
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, worker_count=WORKER_COUNT):
+        super().__init__()
+        self.worker_count = max(1, int(worker_count))
+
+        # Tüm worker'lar tek keep-alive session'ı paylaşır
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'Minecraft-Plugin-Downloader/1.0'
+        })
+        adapter = requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=self.worker_count)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        self._condition = threading.Condition()
+        self._heap = []  # (öncelik, sıra, url)
+        self._queued = {}  # url -> kuyruktaki en iyi öncelik
+        self._in_flight = set()
+        self._counter = itertools.count()
+        self._threads = []
+        self._stopped = False
+
+    @classmethod
+    def shared(cls):
+        """Uygulama genelindeki ortak servisi döndür"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def _ensure_workers(self):
+        """Worker thread'lerini ilk istekte başlat"""
+        if self._threads:
+            return
+        for index in range(self.worker_count):
+            thread = threading.Thread(target=self._worker_loop, name=f"IconFetch-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def request(self, url, priority=PRIORITY_NORMAL):
+        """İkonu kuyruğa ekle; zaten bekliyorsa sadece önceliğini yükselt"""
+        if not url or not url.strip():
+            return
+        with self._condition:
+            if self._stopped or url in self._in_flight:
+                return
+            current = self._queued.get(url)
+            if current is not None and current <= priority:
+                return
+            # Eski kayıt heap'te kalır, worker tarafından atlanır
+            self._queued[url] = priority
+            heapq.heappush(self._heap, (priority, next(self._counter), url))
+            self._ensure_workers()
+            self._condition.notify()
+
+    def prioritize(self, urls):
+        """Verilen URL'leri (görünür satırlar) kuyruğun önüne al"""
+        for url in urls:
+            self.request(url, self.PRIORITY_VISIBLE)
+
+    def is_pending(self, url):
+        """URL kuyrukta veya indiriliyor mu"""
+        with self._condition:
+            return url in self._queued or url in self._in_flight
+
+    def _next_url(self):
+        """Kuyruktan en yüksek öncelikli güncel URL'yi al (durdurulursa None)"""
+        with self._condition:
+            while True:
+                while self._heap:
+                    priority, _, url = heapq.heappop(self._heap)
+                    if self._queued.get(url) == priority:
+                        del self._queued[url]
+                        self._in_flight.add(url)
+                        return url
+                if self._stopped:
+                    return None
+                self._condition.wait()
+
+    def _worker_loop(self):
+        while True:
+            url = self._next_url()
+            if url is None:
+                return
+
+            data = b''
+            try:
+                response = self.session.get(url, timeout=self.REQUEST_TIMEOUT)
+                if response.status_code == 200:
+                    data = response.content
+            except Exception as e:
+                print(f"İkon indirme hatası ({url}): {e}")
+            finally:
+                with self._condition:
+                    self._in_flight.discard(url)
+
+            try:
+                self.icon_ready.emit(url, data)
+            except RuntimeError:
+                # Uygulama kapanırken QObject silinmiş olabilir
+                return
+
+    def stop(self):
+        """Bekleyen istekleri bırak ve worker'ları durdur"""
+        with self._condition:
+            self._stopped = True
+            self._heap.clear()
+            self._queued.clear()
+            self._condition.notify_all()
+        self.session.close()
@@ -4,9 +4,11 @@
 
 from PyQt6.QtWidgets import QLabel
 from PyQt6.QtGui import QPixmap
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer
 import weakref
 
+from .icon_fetch_service import IconFetchService
+
 class IconManager:
     """İkon yönetimi sınıfı"""
     
@@ -39,10 +41,9 @@ class IconManager:
         
         # İkon URL'si varsa ve cache sistemimiz varsa
         if icon_url and icon_url.strip() and icon_cache is not None:
-            # Cache'de var mı kontrol et
-            if icon_url in icon_cache:
-                # Cache'den al
-                cached_pixmap = icon_cache[icon_url]
+            # Cache'de var mı kontrol et (bellekte yoksa diskten yüklenir)
+            cached_pixmap = icon_cache.get(icon_url)
+            if cached_pixmap is not None:
                 if not cached_pixmap.isNull():
                     scaled_pixmap = cached_pixmap.scaled(size-2, size-2, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
                     icon_label.setPixmap(scaled_pixmap)
@@ -65,50 +66,14 @@ class IconManager:
         
         return icon_label
 
-class IconDownloadWorker(QThread):
-    """İkon indirme worker thread'i"""
-    icon_downloaded = pyqtSignal(object)  # QPixmap signal
-    
-    def __init__(self, icon_url):
-        super().__init__()
-        self.icon_url = icon_url
-        
-    def run(self):
-        """İkonu indir"""
-        try:
-            import requests
-            
-            headers = {
-                'User-Agent': 'Minecraft-Plugin-Downloader/1.0'
-            }
-            response = requests.get(self.icon_url, timeout=10, headers=headers)
-            
-            if response.status_code == 200:
-                pixmap = QPixmap()
-                pixmap.loadFromData(response.content)
-                self.icon_downloaded.emit(pixmap)
-            else:
-                self.icon_downloaded.emit(QPixmap())
-        except Exception as e:
-            print(f"İkon indirme hatası ({self.icon_url}): {e}")
-            self.icon_downloaded.emit(QPixmap())
-
 class IconCacheMixin:
     """İkon cache işlemleri için mixin sınıfı"""
     
     def download_icon_async(self, icon_url, icon_label):
-        """İkonu arka planda indir ve cache'e ekle"""
-        if not hasattr(self, 'icon_workers'):
-            self.icon_workers = {}
-        
-        # Aynı URL için zaten indirme varsa, tekrar başlatma
-        if icon_url in self.icon_workers:
-            existing_worker = self.icon_workers[icon_url]
-            if existing_worker.isRunning():
-                return
-        
-        # Worker thread oluştur
-        worker = IconDownloadWorker(icon_url)
+        """İkonu paylaşılan servis üzerinden arka planda indir ve cache'e ekle"""
+        if not hasattr(self, 'icon_waiters'):
+            self.icon_waiters = {}  # URL -> bekleyen label referansları
+            IconFetchService.shared().icon_ready.connect(self.on_icon_fetched)
         
         # Weak reference kullanarak QLabel'ı tut (silinirse None olur)
         try:
@@ -117,53 +82,89 @@ class IconCacheMixin:
             # Bazı Qt objeleri weakref desteklemez, direkt referans kullan
             label_ref = lambda: icon_label
         
-        worker.icon_downloaded.connect(lambda pixmap: self.on_icon_downloaded(icon_url, pixmap, label_ref))
-        worker.finished.connect(lambda: self.cleanup_icon_worker(icon_url))
-        worker.start()
+        # Aynı URL zaten bekleniyorsa sadece label'ı listeye ekle
+        self.icon_waiters.setdefault(icon_url, []).append(label_ref)
+        IconFetchService.shared().request(icon_url)
         
-        # Worker'ı dictionary'de tut
-        self.icon_workers[icon_url] = worker
+        # Tablo çizildikten sonra görünür ikonları öne al
+        if not getattr(self, '_icon_prioritize_scheduled', False):
+            self._icon_prioritize_scheduled = True
+            QTimer.singleShot(0, self.prioritize_visible_icons)
     
-    def cleanup_icon_worker(self, icon_url):
-        """İkon worker'ını temizle"""
-        if hasattr(self, 'icon_workers') and icon_url in self.icon_workers:
-            worker = self.icon_workers[icon_url]
-            if not worker.isRunning():
-                worker.deleteLater()
-                del self.icon_workers[icon_url]
+    def prioritize_visible_icons(self, *args):
+        """Ekranda görünen label'ların ikonlarını indirme kuyruğunda öne al"""
+        self._icon_prioritize_scheduled = False
+        visible_urls = []
+        for icon_url, label_refs in list(getattr(self, 'icon_waiters', {}).items()):
+            for label_ref in label_refs:
+                try:
+                    icon_label = label_ref()
+                    if icon_label is not None and icon_label.isVisible() and not icon_label.visibleRegion().isEmpty():
+                        visible_urls.append(icon_url)
+                        break
+                except RuntimeError:
+                    continue
+        if visible_urls:
+            IconFetchService.shared().prioritize(visible_urls)
+    
+    def watch_icon_visibility(self, scroll_area):
+        """Kaydırma sırasında görünür ikonları öne almak için scroll bar'ı izle"""
+        scroll_area.verticalScrollBar().valueChanged.connect(self.prioritize_visible_icons)
+    
+    def on_icon_fetched(self, icon_url, data):
+        """Servis bir ikonu indirdiğinde çağrılır"""
+        label_refs = getattr(self, 'icon_waiters', {}).pop(icon_url, None)
+        if not label_refs:
+            # Bu URL'yi bu sekme istememiş
+            return
+        
+        pixmap = QPixmap()
+        if data:
+            pixmap.loadFromData(data)
+        if pixmap.isNull():
+            return
+        
+        # Cache'e bir kez ekle (iki katmanlı cache ham baytları diske de yazar)
+        if hasattr(self, 'icon_cache') and self.icon_cache is not None:
+            if hasattr(self.icon_cache, 'put'):
+                self.icon_cache.put(icon_url, data, pixmap)
+            else:
+                self.icon_cache[icon_url] = pixmap
+        
+        for label_ref in label_refs:
+            self.on_icon_downloaded(icon_url, pixmap, label_ref)
+        
+        # Ana pencereye cache güncellemesini bildir
+        try:
+            main_window = self.window()
+            if hasattr(main_window, 'update_cache_stats'):
+                main_window.update_cache_stats()
+        except RuntimeError:
+            pass
     
     def on_icon_downloaded(self, icon_url, pixmap, label_ref):
-        """İkon indirildiğinde çağrılır"""
+        """İndirilen ikonu label'a uygula"""
         # Weak reference'dan label'ı al
         try:
             icon_label = label_ref()
         except:
             icon_label = None
         
-        if icon_label is None:
+        if icon_label is None or pixmap.isNull():
             # Label silinmiş, işlem yapma
             return
         
-        if not pixmap.isNull() and hasattr(self, 'icon_cache') and self.icon_cache is not None:
-            # Cache'e ekle
-            self.icon_cache[icon_url] = pixmap
-            
-            try:
-                # Label'ı güncelle
-                size = icon_label.size()
-                scaled_pixmap = pixmap.scaled(
-                    size.width()-2, 
-                    size.height()-2, 
-                    Qt.AspectRatioMode.KeepAspectRatio, 
-                    Qt.TransformationMode.SmoothTransformation
-                )
-                icon_label.setPixmap(scaled_pixmap)
-                icon_label.setStyleSheet("border: 1px solid #ccc; border-radius: 4px;")
-                
-                # Ana pencereye cache güncellemesini bildir
-                main_window = self.window()
-                if hasattr(main_window, 'update_cache_stats'):
-                    main_window.update_cache_stats()
-            except RuntimeError:
-                # Label silinmiş, sessizce geç
-                pass
\ No newline at end of file
+        try:
+            # Label'ı güncelle
+            size = icon_label.size()
+            scaled_pixmap = pixmap.scaled(
+                size.width()-2, 
+                size.height()-2, 
+                Qt.AspectRatioMode.KeepAspectRatio, 
+                Qt.TransformationMode.SmoothTransformation
+            )
+            icon_label.setPixmap(scaled_pixmap)
+            icon_label.setStyleSheet("border: 1px solid #ccc; border-radius: 4px;")
+        except RuntimeError:
+            # Label silinmiş, sessizce geç
+            pass
\ No newline at end of file
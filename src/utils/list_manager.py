@@ -2,19 +2,85 @@
 Plugin listesi yönetimi utilities
 """
 
+import atexit
 import json
 import os
+import threading
+import weakref
 from datetime import datetime
 
+from .sqlite_storage import SQLiteStorage
+
 class ListManager:
-    """Plugin listesi yönetimi sınıfı"""
+    """
+    Plugin listesi yönetimi sınıfı
+    
+    Listeler bellekte tutulur; değişiklikler kısa bir gecikmeyle birleştirilip
+    geçici dosya + rename ile atomik olarak diske yazılır. Dosya dışarıdan
+    değişirse (mtime) bir sonraki erişimde yeniden okunur.
+    
+    storage verilirse (SQLiteStorage) veri JSON yerine veritabanında tutulur ve
+    sadece değişen listeler yeniden yazılır.
+    """
+    
+    FLUSH_DELAY = 0.5  # Değişikliklerin diske yazılmadan önce birleştirildiği süre (saniye)
     
-    def __init__(self, lists_file="plugin_lists.json"):
+    _instances = weakref.WeakSet()
+    
+    _shared = None
+    _shared_lock = threading.Lock()
+    
+    def __init__(self, lists_file="plugin_lists.json", flush_delay=FLUSH_DELAY, storage=None):
         self.lists_file = lists_file
+        self.flush_delay = flush_delay
+        self.storage = storage
+        self._lock = threading.RLock()
+        self._lists = None  # Bellekteki veri (ilk erişimde yüklenir)
+        self._mtime = None  # Son okunan/yazılan verinin sürümü (dosya mtime veya SQLite data_version)
+        self._dirty = False
+        self._changed_lists = set()  # Bir sonraki yazımda güncellenecek listeler
+        self._removed_lists = set()  # Bir sonraki yazımda silinecek listeler
+        self._full_write = False  # save_lists sonrası tüm veri yeniden yazılır
+        self._flush_timer = None
+        self._key_index = {}  # liste adı -> (ad, api) anahtarları, tekrar kontrolü için
+        ListManager._instances.add(self)
     
-    def load_lists(self):
-        """Plugin listelerini yükle"""
+    @classmethod
+    def shared(cls):
+        """Sekme ve dialog'ların paylaştığı ortak liste deposunu döndür"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls(storage=SQLiteStorage.from_settings())
+            return cls._shared
+    
+    @staticmethod
+    def plugin_key(plugin):
+        """Aynı plugin'i tanımlayan anahtar"""
+        return (plugin.get('name'), plugin.get('api'))
+    
+    def _plugin_keys(self, list_name):
+        """Listedeki plugin anahtarları (ilk kullanımda oluşturulur)"""
+        keys = self._key_index.get(list_name)
+        if keys is None:
+            plugins = self._lists.get(list_name, {}).get('plugins', [])
+            keys = {self.plugin_key(plugin) for plugin in plugins}
+            self._key_index[list_name] = keys
+        return keys
+    
+    def _file_mtime(self):
+        """Kaynağın dışarıdan değişip değişmediğini anlamak için sürüm değeri"""
+        try:
+            if self.storage is not None:
+                return self.storage.data_version()
+            return os.stat(self.lists_file).st_mtime_ns
+        except Exception:
+            return None
+    
+    def _read_file(self):
+        """Liste dosyasını diskten oku"""
         try:
+            if self.storage is not None:
+                return self.storage.load_lists()
             if os.path.exists(self.lists_file):
                 with open(self.lists_file, 'r', encoding='utf-8') as f:
                     return json.load(f)
@@ -24,166 +90,343 @@ class ListManager:
             print(f"Liste yükleme hatası: {e}")
             return {}
     
-    def save_lists(self, lists_data):
-        """Plugin listelerini kaydet"""
+    def _ensure_loaded(self):
+        """Veriyi bellekte hazır tut, dosya dışarıdan değiştiyse yeniden oku"""
+        with self._lock:
+            mtime = self._file_mtime()
+            if self._lists is None:
+                self._lists = self._read_file()
+                self._mtime = mtime
+                self._key_index = {}
+            elif mtime != self._mtime:
+                if self._dirty:
+                    # Bekleyen değişikliklerimiz daha yeni, bir sonraki yazımda korunur
+                    print("Uyarı: Liste dosyası dışarıdan değişti, bekleyen değişiklikler önceliklidir")
+                else:
+                    self._lists = self._read_file()
+                    self._mtime = mtime
+                    self._key_index = {}
+            return self._lists
+    
+    def _mark_dirty(self):
+        """Değişikliği kaydet ve gecikmeli yazımı planla"""
+        with self._lock:
+            self._dirty = True
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_delay, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+    
+    def _commit(self, *changed, removed=()):
+        """Bellekteki değişikliği (değişen/silinen liste adlarıyla) kalıcı hale getirilmek üzere işaretle"""
+        with self._lock:
+            self._removed_lists.update(removed)
+            self._changed_lists.difference_update(removed)
+            self._changed_lists.update(changed)
+            self._removed_lists.difference_update(changed)
+            self._mark_dirty()
+        return True
+    
+    def _write_storage(self):
+        """Bekleyen değişiklikleri SQLite deposuna yaz"""
+        try:
+            if self._full_write:
+                self.storage.save_lists(self._lists)
+            else:
+                self.storage.save_lists(self._lists, self._changed_lists, self._removed_lists)
+            return True
+        except Exception as e:
+            print(f"Liste kaydetme hatası: {e}")
+            return False
+    
+    def _write_file(self):
+        """Listeleri geçici dosya + rename ile atomik olarak yaz"""
+        tmp_file = f"{self.lists_file}.tmp"
         try:
-            with open(self.lists_file, 'w', encoding='utf-8') as f:
-                json.dump(lists_data, f, ensure_ascii=False, indent=2)
+            payload = json.dumps(self._lists, ensure_ascii=False, separators=(',', ':'))
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.lists_file)
             return True
         except Exception as e:
             print(f"Liste kaydetme hatası: {e}")
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
             return False
     
+    def flush(self):
+        """Bekleyen değişiklikleri atomik olarak diske yaz"""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return True
+            
+            if self.storage is not None:
+                written = self._write_storage()
+            else:
+                written = self._write_file()
+            if not written:
+                return False
+            
+            self._dirty = False
+            self._full_write = False
+            self._changed_lists.clear()
+            self._removed_lists.clear()
+            self._mtime = self._file_mtime()
+            return True
+    
+    @classmethod
+    def flush_all(cls):
+        """Tüm örneklerin bekleyen değişikliklerini yaz (çıkışta çağrılır)"""
+        for manager in list(cls._instances):
+            manager.flush()
+    
+    def load_lists(self):
+        """
+        Plugin listelerini döndür
+        
+        Dönen sözlük bellekteki verinin kendisidir; değiştirildiyse save_lists ile bildirilmelidir.
+        """
+        return self._ensure_loaded()
+    
+    def save_lists(self, lists_data):
+        """Plugin listelerini kaydet (yazım arka planda birleştirilerek yapılır)"""
+        with self._lock:
+            self._ensure_loaded()
+            self._lists = lists_data
+            self._key_index = {}
+            self._full_write = True
+            self._mark_dirty()
+        return True
+    
     def get_list_names(self):
         """Mevcut liste isimlerini döndür"""
         lists_data = self.load_lists()
         return list(lists_data.keys())
     
+    def get_list(self, name):
+        """Liste bilgisini döndür (yoksa None)"""
+        return self.load_lists().get(name)
+    
+    def get_plugins(self, name):
+        """Listedeki pluginleri döndür"""
+        list_info = self.get_list(name)
+        return list_info.get('plugins', []) if list_info else []
+    
+    def has_plugin(self, list_name, plugin_data):
+        """Plugin listede var mı (sabit zamanlı kontrol)"""
+        with self._lock:
+            self._ensure_loaded()
+            if list_name not in self._lists:
+                return False
+            return self.plugin_key(plugin_data) in self._plugin_keys(list_name)
+    
     def create_list(self, name, icon="📋 Varsayılan", description="", custom_icon_path=""):
         """Yeni liste oluştur"""
-        lists_data = self.load_lists()
-        
-        if name in lists_data:
-            return False, "Bu isimde bir liste zaten var!"
-        
-        lists_data[name] = {
-            'plugins': [],
-            'icon': icon,
-            'description': description,
-            'created_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        }
-        
-        if custom_icon_path:
-            lists_data[name]['custom_icon_path'] = custom_icon_path
-        
-        success = self.save_lists(lists_data)
-        return success, "Liste başarıyla oluşturuldu." if success else "Liste oluşturulamadı."
+        with self._lock:
+            lists_data = self.load_lists()
+            
+            if name in lists_data:
+                return False, "Bu isimde bir liste zaten var!"
+            
+            lists_data[name] = {
+                'plugins': [],
+                'icon': icon,
+                'description': description,
+                'created_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            }
+            
+            if custom_icon_path:
+                lists_data[name]['custom_icon_path'] = custom_icon_path
+            self._key_index[name] = set()
+            
+            success = self._commit(name)
+            return success, "Liste başarıyla oluşturuldu." if success else "Liste oluşturulamadı."
     
     def delete_list(self, name):
         """Liste sil"""
-        lists_data = self.load_lists()
-        
-        if name not in lists_data:
-            return False, "Liste bulunamadı!"
-        
-        del lists_data[name]
-        success = self.save_lists(lists_data)
-        return success, "Liste başarıyla silindi." if success else "Liste silinemedi."
+        with self._lock:
+            lists_data = self.load_lists()
+            
+            if name not in lists_data:
+                return False, "Liste bulunamadı!"
+            
+            del lists_data[name]
+            self._key_index.pop(name, None)
+            success = self._commit(removed=(name,))
+            return success, "Liste başarıyla silindi." if success else "Liste silinemedi."
     
     def rename_list(self, old_name, new_name):
         """Liste adını değiştir"""
-        lists_data = self.load_lists()
-        
-        if old_name not in lists_data:
-            return False, "Kaynak liste bulunamadı!"
-        
-        if new_name in lists_data:
-            return False, "Bu isimde bir liste zaten var!"
-        
-        lists_data[new_name] = lists_data.pop(old_name)
-        lists_data[new_name]['last_updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        
-        success = self.save_lists(lists_data)
-        return success, "Liste adı başarıyla değiştirildi." if success else "Liste adı değiştirilemedi."
+        with self._lock:
+            lists_data = self.load_lists()
+            
+            if old_name not in lists_data:
+                return False, "Kaynak liste bulunamadı!"
+            
+            if new_name in lists_data:
+                return False, "Bu isimde bir liste zaten var!"
+            
+            lists_data[new_name] = lists_data.pop(old_name)
+            if old_name in self._key_index:
+                self._key_index[new_name] = self._key_index.pop(old_name)
+            lists_data[new_name]['last_updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            
+            success = self._commit(new_name, removed=(old_name,))
+            return success, "Liste adı başarıyla değiştirildi." if success else "Liste adı değiştirilemedi."
     
     def update_list(self, name, icon=None, description=None, custom_icon_path=None):
         """Liste bilgilerini güncelle"""
-        lists_data = self.load_lists()
-        
-        if name not in lists_data:
-            return False, "Liste bulunamadı!"
-        
-        if icon is not None:
-            lists_data[name]['icon'] = icon
-        
-        if description is not None:
-            lists_data[name]['description'] = description
-        
-        if custom_icon_path is not None:
-            lists_data[name]['custom_icon_path'] = custom_icon_path
-        
-        lists_data[name]['last_updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        
-        success = self.save_lists(lists_data)
-        return success, "Liste başarıyla güncellendi." if success else "Liste güncellenemedi."
+        with self._lock:
+            lists_data = self.load_lists()
+            
+            if name not in lists_data:
+                return False, "Liste bulunamadı!"
+            
+            if icon is not None:
+                lists_data[name]['icon'] = icon
+            
+            if description is not None:
+                lists_data[name]['description'] = description
+            
+            if custom_icon_path is not None:
+                lists_data[name]['custom_icon_path'] = custom_icon_path
+            
+            lists_data[name]['last_updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            
+            success = self._commit(name)
+            return success, "Liste başarıyla güncellendi." if success else "Liste güncellenemedi."
     
     def add_plugin_to_list(self, list_name, plugin_data):
         """Plugin'i listeye ekle"""
-        lists_data = self.load_lists()
-        
-        if list_name not in lists_data:
-            return False, "Liste bulunamadı!"
-        
-        # Plugin zaten listede var mı kontrol et
-        existing_plugins = lists_data[list_name]['plugins']
-        for existing in existing_plugins:
-            if (existing.get('name') == plugin_data.get('name') and 
-                existing.get('api') == plugin_data.get('api')):
+        with self._lock:
+            lists_data = self.load_lists()
+            
+            if list_name not in lists_data:
+                return False, "Liste bulunamadı!"
+            
+            # Plugin zaten listede var mı kontrol et
+            keys = self._plugin_keys(list_name)
+            if self.plugin_key(plugin_data) in keys:
                 return False, "Bu plugin zaten listede mevcut!"
-        
-        # Plugin'i ekle
-        lists_data[list_name]['plugins'].append(plugin_data)
-        lists_data[list_name]['last_updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        
-        success = self.save_lists(lists_data)
-        return success, "Plugin başarıyla eklendi." if success else "Plugin eklenemedi."
+            
+            # Plugin'i ekle
+            lists_data[list_name]['plugins'].append(plugin_data)
+            keys.add(self.plugin_key(plugin_data))
+            lists_data[list_name]['last_updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            
+            success = self._commit(list_name)
+            return success, "Plugin başarıyla eklendi." if success else "Plugin eklenemedi."
     
     def remove_plugin_from_list(self, list_name, plugin_index):
         """Plugin'i listeden çıkar"""
-        lists_data = self.load_lists()
-        
-        if list_name not in lists_data:
-            return False, "Liste bulunamadı!"
-        
-        plugins = lists_data[list_name]['plugins']
-        
-        if plugin_index >= len(plugins):
-            return False, "Plugin bulunamadı!"
-        
-        plugins.pop(plugin_index)
-        lists_data[list_name]['plugins'] = plugins
-        lists_data[list_name]['last_updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        
-        success = self.save_lists(lists_data)
-        return success, "Plugin başarıyla kaldırıldı." if success else "Plugin kaldırılamadı."
+        with self._lock:
+            lists_data = self.load_lists()
+            
+            if list_name not in lists_data:
+                return False, "Liste bulunamadı!"
+            
+            plugins = lists_data[list_name]['plugins']
+            
+            if plugin_index >= len(plugins):
+                return False, "Plugin bulunamadı!"
+            
+            plugins.pop(plugin_index)
+            lists_data[list_name]['plugins'] = plugins
+            lists_data[list_name]['last_updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            self._key_index.pop(list_name, None)
+            
+            success = self._commit(list_name)
+            return success, "Plugin başarıyla kaldırıldı." if success else "Plugin kaldırılamadı."
+    
+    def remove_plugins(self, list_name, plugins_to_remove):
+        """Verilen plugin kayıtlarını (get_plugins'ten dönen nesneler) listeden çıkar"""
+        with self._lock:
+            lists_data = self.load_lists()
+            
+            if list_name not in lists_data:
+                return False, "Liste bulunamadı!"
+            
+            remove_ids = {id(plugin) for plugin in plugins_to_remove}
+            plugins = lists_data[list_name]['plugins']
+            remaining = [plugin for plugin in plugins if id(plugin) not in remove_ids]
+            removed_count = len(plugins) - len(remaining)
+            
+            if removed_count == 0:
+                return False, "Plugin bulunamadı!"
+            
+            lists_data[list_name]['plugins'] = remaining
+            lists_data[list_name]['last_updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            self._key_index.pop(list_name, None)
+            
+            success = self._commit(list_name)
+            return success, f"{removed_count} plugin listeden kaldırıldı." if success else "Plugin kaldırılamadı."
+    
+    def set_latest_versions(self, list_name, latest_versions):
+        """
+        Güncelleme kontrolü sonucunu listeye yaz
+        
+        latest_versions: plugin_key -> en son sürüm adı
+        """
+        with self._lock:
+            lists_data = self.load_lists()
+            
+            if list_name not in lists_data:
+                return False
+            
+            checked_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            for plugin in lists_data[list_name]['plugins']:
+                latest = latest_versions.get(self.plugin_key(plugin))
+                if latest is not None:
+                    plugin['latest_version'] = latest
+                    plugin['last_checked'] = checked_at
+            
+            return self._commit(list_name)
     
     def transfer_plugins(self, source_list, target_list, plugins_to_transfer):
         """Plugin'leri bir listeden diğerine aktar"""
-        lists_data = self.load_lists()
-        
-        if source_list not in lists_data:
-            return False, "Kaynak liste bulunamadı!"
-        
-        if target_list not in lists_data:
-            return False, "Hedef liste bulunamadı!"
-        
-        target_plugins = lists_data[target_list]['plugins']
-        added_count = 0
-        
-        for plugin in plugins_to_transfer:
-            # Aynı plugin zaten var mı kontrol et
-            exists = False
-            for existing in target_plugins:
-                if (existing.get('name') == plugin.get('name') and 
-                    existing.get('api') == plugin.get('api')):
-                    exists = True
-                    break
-            
-            if not exists:
-                target_plugins.append(plugin)
-                added_count += 1
-        
-        # Hedef listeyi güncelle
-        lists_data[target_list]['plugins'] = target_plugins
-        lists_data[target_list]['last_updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        
-        success = self.save_lists(lists_data)
-        
-        if success:
-            message = f"{added_count} plugin '{target_list}' listesine aktarıldı."
-            if len(plugins_to_transfer) - added_count > 0:
-                message += f"\n{len(plugins_to_transfer) - added_count} plugin zaten mevcuttu."
-            return True, message
-        else:
-            return False, "Plugin'ler aktarılamadı."
\ No newline at end of file
+        with self._lock:
+            lists_data = self.load_lists()
+            
+            if source_list not in lists_data:
+                return False, "Kaynak liste bulunamadı!"
+            
+            if target_list not in lists_data:
+                return False, "Hedef liste bulunamadı!"
+            
+            target_plugins = lists_data[target_list]['plugins']
+            target_keys = self._plugin_keys(target_list)
+            added_count = 0
+            
+            for plugin in plugins_to_transfer:
+                # Aynı plugin zaten var mı kontrol et
+                key = self.plugin_key(plugin)
+                if key not in target_keys:
+                    # Kopya eklenir; iki liste aynı kaydı paylaşmaz
+                    target_plugins.append(dict(plugin))
+                    target_keys.add(key)
+                    added_count += 1
+            
+            # Hedef listeyi güncelle
+            lists_data[target_list]['plugins'] = target_plugins
+            lists_data[target_list]['last_updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            
+            success = self._commit(target_list)
+            
+            if success:
+                message = f"{added_count} plugin '{target_list}' listesine aktarıldı."
+                if len(plugins_to_transfer) - added_count > 0:
+                    message += f"\n{len(plugins_to_transfer) - added_count} plugin zaten mevcuttu."
+                return True, message
+            else:
+                return False, "Plugin'ler aktarılamadı."
+
+# Uygulama kapanırken yazılmamış değişiklikleri kaybetme
+atexit.register(ListManager.flush_all)
\ No newline at end of file
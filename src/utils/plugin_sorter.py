@@ -7,6 +7,12 @@ from .settings_manager import SettingsManager
 class PluginSorter:
     """Plugin sıralama işlemleri"""
     
+    # Öncelik ayarına göre API grup sırası (listede olmayanlar en sona)
+    API_ORDERS = {
+        "Modrinth Önce": ['Modrinth', 'Spigot'],
+        "Spigot Önce": ['Spigot', 'Modrinth']
+    }
+    
     @staticmethod
     def sort_by_api_priority(items, api_key='api'):
         """Plugin'leri/indirmeleri API önceliğine göre sırala"""
@@ -25,7 +31,34 @@ class PluginSorter:
             other_items = [item for item in items if item.get(api_key) not in ['Modrinth', 'Spigot']]
             return spigot_items + modrinth_items + other_items
         else:  # Rastgele veya diğer
-            return items
+            # Her zaman yeni liste: çağıranın listesiyle (ör. geçmişin kendi kayıtları) paylaşılmaz
+            return list(items)
+    
+    @staticmethod
+    def api_rank(item, api_priority, api_key='api'):
+        """Öğenin sort_by_api_priority sıralamasındaki grup numarası"""
+        order = PluginSorter.API_ORDERS.get(api_priority)
+        if order is None:
+            return 0
+        api = item.get(api_key)
+        return order.index(api) if api in order else len(order)
+    
+    @staticmethod
+    def insert_position(sorted_items, item, api_key='api', api_priority=None):
+        """Yeni öğenin sıralı listede grubunun sonuna eklenmesi gereken index"""
+        if api_priority is None:
+            api_priority = SettingsManager.get_api_priority()
+        rank = PluginSorter.api_rank(item, api_priority, api_key)
+        
+        # Gruplar sıralı olduğundan ikili arama yeterli
+        low, high = 0, len(sorted_items)
+        while low < high:
+            middle = (low + high) // 2
+            if PluginSorter.api_rank(sorted_items[middle], api_priority, api_key) <= rank:
+                low = middle + 1
+            else:
+                high = middle
+        return low
     
     @staticmethod
     def sort_search_results(modrinth_results, spigot_results):
@@ -4,9 +4,21 @@ Ayarlar yönetimi için utility fonksiyonları
 
 import json
 import os
+import threading
 
 class SettingsManager:
-    """Ayarlar yönetimi sınıfı"""
+    """
+    Ayarlar yönetimi sınıfı
+    
+    Ayarlar ilk erişimde okunup bellekte tutulur; dosya sadece mtime değiştiğinde
+    yeniden okunur. Kaydetme veya dışarıdan değişiklikle bir ayar değişirse
+    eklenen dinleyiciler değişen anahtarlarla çağrılır.
+    """
+    
+    _settings = None  # Bellekteki ayarlar (ilk erişimde yüklenir)
+    _mtime = None  # Son okunan/yazılan dosyanın mtime değeri
+    _lock = threading.RLock()
+    _listeners = []
     
     @staticmethod
     def get_settings_file():
@@ -14,8 +26,15 @@ class SettingsManager:
         return "settings.json"
     
     @staticmethod
-    def load_settings():
-        """Ayarları yükle"""
+    def _file_mtime():
+        try:
+            return os.stat(SettingsManager.get_settings_file()).st_mtime_ns
+        except OSError:
+            return None
+    
+    @staticmethod
+    def _read_file():
+        """Ayar dosyasını diskten oku"""
         try:
             settings_file = SettingsManager.get_settings_file()
             if os.path.exists(settings_file):
@@ -27,17 +46,77 @@ class SettingsManager:
             print(f"Ayarlar yüklenemedi: {e}")
             return SettingsManager.get_default_settings()
     
+    @classmethod
+    def _current(cls):
+        """Bellekteki ayarları döndür, dosya dışarıdan değiştiyse yeniden oku"""
+        with cls._lock:
+            mtime = cls._file_mtime()
+            if cls._settings is None or mtime != cls._mtime:
+                old_settings = cls._settings
+                cls._settings = cls._read_file()
+                cls._mtime = mtime
+                if old_settings is not None:
+                    cls._notify(old_settings, cls._settings)
+            return cls._settings
+    
+    @classmethod
+    def _notify(cls, old_settings, new_settings):
+        """Değişen anahtarları dinleyicilere bildir"""
+        changed = {
+            key for key in set(old_settings) | set(new_settings)
+            if old_settings.get(key) != new_settings.get(key)
+        }
+        if not changed:
+            return
+        for listener in list(cls._listeners):
+            try:
+                listener(changed, dict(new_settings))
+            except Exception as e:
+                print(f"Ayar bildirimi hatası: {e}")
+    
+    @classmethod
+    def add_listener(cls, listener):
+        """Ayar değişikliklerinde listener(değişen_anahtarlar, ayarlar) çağrılır"""
+        with cls._lock:
+            if listener not in cls._listeners:
+                cls._listeners.append(listener)
+    
+    @classmethod
+    def remove_listener(cls, listener):
+        with cls._lock:
+            if listener in cls._listeners:
+                cls._listeners.remove(listener)
+    
     @staticmethod
-    def save_settings(settings):
-        """Ayarları kaydet"""
-        try:
-            settings_file = SettingsManager.get_settings_file()
-            with open(settings_file, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, ensure_ascii=False, indent=2)
+    def load_settings():
+        """Ayarların kopyasını döndür (dosya sadece değiştiyse okunur)"""
+        return dict(SettingsManager._current())
+    
+    @staticmethod
+    def get(key, default=None):
+        """Tek bir ayarı kopya oluşturmadan oku"""
+        return SettingsManager._current().get(key, default)
+    
+    @classmethod
+    def save_settings(cls, settings):
+        """Ayarları kaydet (geçici dosya + rename ile atomik)"""
+        with cls._lock:
+            try:
+                settings_file = cls.get_settings_file()
+                tmp_file = f"{settings_file}.tmp"
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(settings, f, ensure_ascii=False, indent=2)
+                os.replace(tmp_file, settings_file)
+            except Exception as e:
+                print(f"Ayarlar kaydedilemedi: {e}")
+                return False
+            
+            old_settings = cls._settings
+            cls._settings = dict(settings)
+            cls._mtime = cls._file_mtime()
+            if old_settings is not None:
+                cls._notify(old_settings, cls._settings)
             return True
-        except Exception as e:
-            print(f"Ayarlar kaydedilemedi: {e}")
-            return False
     
     @staticmethod
     def get_default_settings():
@@ -48,14 +127,14 @@ class SettingsManager:
             'search_limit': 20,
             'default_api': 'Modrinth',
             'api_priority': 'Modrinth Önce',
-            'show_premium_plugins': False
+            'show_premium_plugins': False,
+            'storage_backend': 'json'
         }
     
     @staticmethod
     def get_api_priority():
         """API öncelik ayarını al"""
-        settings = SettingsManager.load_settings()
-        return settings.get('api_priority', 'Modrinth Önce')
+        return SettingsManager.get('api_priority', 'Modrinth Önce')
     
     @staticmethod
     def update_api_priority(new_priority):
@@ -67,5 +146,15 @@ class SettingsManager:
     @staticmethod
     def get_show_premium_plugins():
         """Paralı pluginleri göster ayarını al"""
-        settings = SettingsManager.load_settings()
-        return settings.get('show_premium_plugins', False)
\ No newline at end of file
+        return SettingsManager.get('show_premium_plugins', False)
+    
+    @staticmethod
+    def get_search_limit():
+        """Arama sayfası başına sonuç sayısını al"""
+        return SettingsManager.get('search_limit', 20)
+    
+    @staticmethod
+    def get_storage_backend():
+        """Liste ve indirme geçmişi deposunu al ('json' veya 'sqlite')"""
+        backend = SettingsManager.get('storage_backend', 'json')
+        return backend if backend in ('json', 'sqlite') else 'json'
\ No newline at end of file
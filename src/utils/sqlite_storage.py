@@ -0,0 +1,289 @@
+"""
+Plugin listeleri ve indirme geçmişi için SQLite depolama motoru
+"""
+
+import json
+import os
+import sqlite3
+import threading
+
+from .settings_manager import SettingsManager
+
+class SQLiteStorage:
+    """
+    WAL modunda çalışan tek dosyalık SQLite deposu.
+
+    Listeler ve indirme kayıtları satır bazında saklanır; sadece değişen listeler
+    yeniden yazılır, indirme kayıtları tek INSERT ile eklenir. İlk açılışta mevcut
+    JSON dosyaları bir kez içeri aktarılır.
+    """
+
+    DEFAULT_DB_FILE = "pluginauto.db"
+
+    # Sütun olarak saklanan alanlar; geri kalanı 'data' sütununda JSON olarak tutulur
+    PLUGIN_COLUMNS = ('name', 'api', 'plugin_id')
+    DOWNLOAD_COLUMNS = ('name', 'version', 'api', 'path', 'date', 'plugin_id')
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, db_file=DEFAULT_DB_FILE):
+        self.db_file = db_file
+        self._lock = threading.RLock()
+        self.connection = sqlite3.connect(db_file, check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+    @classmethod
+    def shared(cls, db_file=DEFAULT_DB_FILE, lists_file="plugin_lists.json", downloads_file="downloads.json"):
+        """Dosya başına tek bağlantı döndür; ilk açılışta JSON verisini taşı"""
+        with cls._shared_lock:
+            storage = cls._shared.get(db_file)
+            if storage is None:
+                storage = cls(db_file)
+                storage.migrate_from_json(lists_file, downloads_file)
+                cls._shared[db_file] = storage
+            return storage
+
+    @classmethod
+    def from_settings(cls):
+        """Ayarlarda SQLite seçiliyse ortak depoyu döndür, değilse None (JSON kullanılır)"""
+        if SettingsManager.get_storage_backend() != 'sqlite':
+            return None
+        try:
+            return cls.shared()
+        except Exception as e:
+            print(f"SQLite deposu açılamadı, JSON kullanılacak: {e}")
+            return None
+
+    def _create_schema(self):
+        with self._lock, self.connection:
+            self.connection.executescript("""
+                CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                );
+                CREATE TABLE IF NOT EXISTS lists (
+                    name TEXT PRIMARY KEY,
+                    position INTEGER NOT NULL,
+                    data TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS list_plugins (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    list_name TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    name TEXT,
+                    api TEXT,
+                    plugin_id TEXT,
+                    data TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_list_plugins_list ON list_plugins(list_name, position);
+                CREATE INDEX IF NOT EXISTS idx_list_plugins_plugin ON list_plugins(plugin_id);
+                CREATE INDEX IF NOT EXISTS idx_list_plugins_api ON list_plugins(api);
+                CREATE TABLE IF NOT EXISTS downloads (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT,
+                    version TEXT,
+                    api TEXT,
+                    path TEXT,
+                    date TEXT,
+                    plugin_id TEXT,
+                    data TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_downloads_plugin ON downloads(plugin_id);
+                CREATE INDEX IF NOT EXISTS idx_downloads_api ON downloads(api);
+                CREATE INDEX IF NOT EXISTS idx_downloads_date ON downloads(date);
+            """)
+
+    def data_version(self):
+        """Başka bir bağlantı veriyi değiştirdiğinde artan sayaç"""
+        with self._lock:
+            return self.connection.execute("PRAGMA data_version").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self.connection.close()
+
+    # Yardımcılar
+
+    @staticmethod
+    def _split(record, columns):
+        """Kaydı sütun değerleri ve JSON olarak saklanacak tam veri olarak ayır"""
+        values = []
+        for column in columns:
+            value = record.get(column)
+            values.append(None if value is None else str(value))
+        return values, json.dumps(record, ensure_ascii=False, separators=(',', ':'))
+
+    def _get_meta(self, key):
+        row = self.connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key, value):
+        self.connection.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value)
+        )
+
+    # Listeler
+
+    def load_lists(self):
+        """Tüm listeleri ListManager'ın kullandığı sözlük yapısında döndür"""
+        with self._lock:
+            lists_data = {}
+            for row in self.connection.execute("SELECT name, data FROM lists ORDER BY position"):
+                list_info = json.loads(row['data'])
+                list_info['plugins'] = []
+                lists_data[row['name']] = list_info
+
+            for row in self.connection.execute(
+                    "SELECT list_name, data FROM list_plugins ORDER BY list_name, position"):
+                if row['list_name'] in lists_data:
+                    lists_data[row['list_name']]['plugins'].append(json.loads(row['data']))
+            return lists_data
+
+    def _write_list(self, position, name, list_info):
+        info = {key: value for key, value in list_info.items() if key != 'plugins'}
+        self.connection.execute(
+            "INSERT INTO lists (name, position, data) VALUES (?, ?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET position = excluded.position, data = excluded.data",
+            (name, position, json.dumps(info, ensure_ascii=False, separators=(',', ':')))
+        )
+        self.connection.execute("DELETE FROM list_plugins WHERE list_name = ?", (name,))
+        rows = []
+        for plugin_position, plugin in enumerate(list_info.get('plugins', [])):
+            values, data = self._split(plugin, self.PLUGIN_COLUMNS)
+            rows.append((name, plugin_position, *values, data))
+        self.connection.executemany(
+            "INSERT INTO list_plugins (list_name, position, name, api, plugin_id, data) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            rows
+        )
+
+    def save_lists(self, lists_data, changed=None, removed=None):
+        """
+        Listeleri kaydet.
+
+        changed/removed verilirse sadece o listeler yazılır ya da silinir,
+        verilmezse tüm veri tek transaction içinde yeniden yazılır.
+        """
+        with self._lock, self.connection:
+            names = list(lists_data.keys())
+            if changed is None:
+                self.connection.execute("DELETE FROM list_plugins")
+                self.connection.execute("DELETE FROM lists")
+                targets = names
+            else:
+                for name in removed or ():
+                    self.connection.execute("DELETE FROM list_plugins WHERE list_name = ?", (name,))
+                    self.connection.execute("DELETE FROM lists WHERE name = ?", (name,))
+                targets = [name for name in names if name in changed]
+
+            for name in targets:
+                self._write_list(names.index(name), name, lists_data[name])
+
+    # İndirme geçmişi
+
+    def _download_from_row(self, row):
+        record = json.loads(row['data'])
+        record['id'] = row['id']
+        return record
+
+    def load_downloads(self):
+        """Tüm indirme kayıtlarını eklenme sırasıyla döndür"""
+        with self._lock:
+            rows = self.connection.execute("SELECT id, data FROM downloads ORDER BY id").fetchall()
+            return [self._download_from_row(row) for row in rows]
+
+    def find_downloads(self, plugin_id=None, api=None, since=None, limit=None):
+        """İndeksli sütunlar üzerinden kayıt ara (en yeni önce)"""
+        conditions = []
+        params = []
+        if plugin_id is not None:
+            conditions.append("plugin_id = ?")
+            params.append(str(plugin_id))
+        if api is not None:
+            conditions.append("api = ?")
+            params.append(api)
+        if since is not None:
+            conditions.append("date >= ?")
+            params.append(since)
+
+        query = "SELECT id, data FROM downloads"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY date DESC, id DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(int(limit))
+
+        with self._lock:
+            rows = self.connection.execute(query, params).fetchall()
+            return [self._download_from_row(row) for row in rows]
+
+    def add_download(self, record):
+        """Kaydı ekle ve verilen id'yi döndür"""
+        stored = {key: value for key, value in record.items() if key != 'id'}
+        values, data = self._split(stored, self.DOWNLOAD_COLUMNS)
+        with self._lock, self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO downloads (name, version, api, path, date, plugin_id, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (*values, data)
+            )
+            return cursor.lastrowid
+
+    def delete_downloads(self, ids):
+        """Verilen id'lere sahip kayıtları sil"""
+        ids = [(record_id,) for record_id in ids if record_id is not None]
+        if not ids:
+            return
+        with self._lock, self.connection:
+            self.connection.executemany("DELETE FROM downloads WHERE id = ?", ids)
+
+    def clear_downloads(self):
+        with self._lock, self.connection:
+            self.connection.execute("DELETE FROM downloads")
+
+    # JSON'dan taşıma
+
+    def migrate_from_json(self, lists_file="plugin_lists.json", downloads_file="downloads.json"):
+        """Mevcut JSON dosyalarını bir kez içeri aktar (dosyalar silinmez)"""
+        with self._lock:
+            if self._get_meta('json_migrated'):
+                return False
+
+            # İndirme geçmişi anlık görüntü + günlükten oluşur, birlikte okunmalı
+            from .download_history import DownloadHistory
+
+            lists_data = {}
+            try:
+                if os.path.exists(lists_file):
+                    with open(lists_file, 'r', encoding='utf-8') as f:
+                        lists_data = json.load(f)
+                downloads = DownloadHistory(downloads_file).load()
+            except Exception as e:
+                print(f"JSON verisi taşınamadı: {e}")
+                return False
+
+            with self.connection:
+                for position, (name, list_info) in enumerate(lists_data.items()):
+                    self._write_list(position, name, list_info)
+                rows = []
+                for record in downloads:
+                    record = {key: value for key, value in record.items() if key != 'id'}
+                    values, data = self._split(record, self.DOWNLOAD_COLUMNS)
+                    rows.append((*values, data))
+                self.connection.executemany(
+                    "INSERT INTO downloads (name, version, api, path, date, plugin_id, data) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+                self._set_meta('json_migrated', '1')
+
+            if lists_data or downloads:
+                print(f"JSON verisi SQLite'a taşındı: {len(lists_data)} liste, {len(downloads)} indirme kaydı")
+            return True